@@ -1,13 +1,75 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from contextlib import asynccontextmanager
+import atexit
+import hmac
 import json
+import os
 import uuid
 from pathlib import Path
+from urllib.parse import quote
+from pydantic import ValidationError
 from app.services.parser_service import ResumeParser
-from app.services.matching_service import rank_jobs, get_matching_insights
-from app.services.gap_service import analyze_skill_gap, generate_learning_roadmap
+from app.services.matching_service import (
+    rank_jobs, rank_jobs_batch, get_matching_insights, canonical_skills
+)
+from app.services.gap_service import (
+    analyze_skill_gap, generate_learning_roadmap, analyze_catalog_gap, optimize_learning_path,
+    analyze_cohort
+)
+from app.services.catalog_service import JobCatalog
+from app.services.search_cache import SearchCache, canonicalize_query, normalize_location
+from app.services.candidate_index import CandidateIndex
+from app.services.match_session import MatchSession, MatchSessionStore
+from app.services.profile_matches import MaterializedMatches
+from app.services.similarity_service import SimilarJobsIndex
+from app.services.dedup_service import JobDeduplicator, dedupe_jobs
+from app.services.text_search import TextSearchIndex, blend_text_scores
+from app.services.semantic_service import SemanticMatcher, blend_semantic_scores
+from app.services.skill_resolver import SkillResolver
+from app.services.skill_vocabulary import SkillVocabulary
+from app.services.facet_service import FacetIndex
+from app.services.job_views import parse_fields, project_jobs
+from app.services.market_stats import MarketStats
+from app.services.profile_store import ProfileStore
+from app.services.profile_cache import ProfileCache
+from app.services.upload_store import UploadStore
+from app.services.json_response import FastJSONResponse
+from app.services.http_cache import make_etag, etag_matches, cache_headers, not_modified
+from app.schemas import ParseResumeResponse, JobPosting, GapAnalysisResponse
+from app.services.fingerprint_service import (
+    ResumeFingerprintIndex, content_hash, text_hash, simhash
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    One-time legacy imports, run when the server starts rather than on import
+    
+    Importing app.main still opens the stores under uploads/ and
+    saved_profiles/ relative to the CWD: UploadStore, ProfileStore (which
+    creates profiles.db), ResumeFingerprintIndex (which may rewrite a
+    legacy fingerprint log) and the CANDIDATE_INDEX load. Only the flat
+    upload / PROF_*.json directory imports wait for startup.
+    """
+    imported_uploads = UPLOAD_STORE.import_directory(UPLOAD_DIR)
+    if imported_uploads:
+        print(f"✅ Imported {imported_uploads} legacy uploads into {UPLOAD_STORE.blob_dir}")
+    
+    imported_profiles = PROFILE_STORE.import_directory(PROFILES_DIR)
+    if imported_profiles:
+        print(f"✅ Imported {imported_profiles} legacy profile files into {PROFILE_STORE.db_path}")
+        CANDIDATE_INDEX.load(PROFILE_STORE.iter_profiles())
+    
+    yield
 
-app = FastAPI(title="Wevolve API", version="1.0.0")
+# orjson / pydantic-core rendering instead of json.dumps for every response
+app = FastAPI(
+    title="Wevolve API", version="1.0.0",
+    default_response_class=FastJSONResponse, lifespan=lifespan
+)
 
 # CORS
 app.add_middleware(
@@ -25,6 +87,29 @@ parser_service = ResumeParser()
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
 
+# Content-addressed upload blobs + file_id metadata index; legacy flat
+# uploads are imported at startup (see lifespan)
+UPLOAD_STORE = UploadStore(UPLOAD_DIR)
+
+PROFILES_DIR = Path("saved_profiles")
+
+# Saved profiles in SQLite (WAL); legacy PROF_*.json files are imported at startup
+PROFILE_STORE = ProfileStore(PROFILES_DIR / "profiles.db")
+
+# Decoded-profile LRU; saves are written behind in batched, fsync'd transactions
+PROFILE_CACHE = ProfileCache(PROFILE_STORE, max_entries=1024, flush_interval=0.5)
+atexit.register(PROFILE_CACHE.close)
+
+# Upload fingerprints (content hash + SimHash) for duplicate resume detection
+RESUME_FINGERPRINTS = ResumeFingerprintIndex(UPLOAD_DIR / "fingerprints.jsonl")
+
+# Maintenance endpoints that delete data need this token in an
+# X-Admin-Token header; they are disabled while it is unset
+ADMIN_TOKEN = os.environ.get("WEVOLVE_ADMIN_TOKEN")
+
+# Uploads younger than this are never expired through the API
+MIN_UPLOAD_AGE_DAYS = 30
+
 # Load mock data helpers
 def load_mock_resume():
     file_path = Path(__file__).parent / "data" / "mock_resume.json"
@@ -51,8 +136,81 @@ def load_mock_jobs():
     except FileNotFoundError:
         return []
 
+def require_admin(token: str):
+    """403 unless token matches the configured admin token"""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled (WEVOLVE_ADMIN_TOKEN is not set)")
+    if not token or not hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+def require_positive_int(value, name: str) -> int:
+    """400 unless value is a positive integer (JSON bodies are not coerced)"""
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise HTTPException(status_code=400, detail=f"{name} must be a positive integer")
+    return value
+
+def require_experience(value) -> float:
+    """Years of experience from a JSON body: a non-negative number (null means 0)"""
+    if value is None:
+        return 0
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+        raise HTTPException(status_code=400, detail="experience must be a non-negative number")
+    return value
+
+def require_skill_list(value, name: str = "skills") -> list:
+    """400 unless value is an array of strings"""
+    if not isinstance(value, list) or not all(isinstance(s, str) for s in value):
+        raise HTTPException(status_code=400, detail=f"{name} must be an array of strings")
+    return value
+
+# Near-duplicate postings are collapsed at ingest (MinHash + LSH)
+JOB_DEDUP = JobDeduplicator(threshold=0.8)
+
 # Store mock jobs in memory (load once)
-MOCK_JOBS = load_mock_jobs()
+_unique_jobs, _job_aliases = dedupe_jobs(load_mock_jobs(), JOB_DEDUP)
+JOB_CATALOG = JobCatalog(_unique_jobs)
+for _alias, _canonical in _job_aliases.items():
+    JOB_CATALOG.add_alias(_alias, _canonical)
+JOB_CATALOG.subscribe(
+    lambda event, job, slot: JOB_DEDUP.forget(job["job_id"]) if event == "remove" else None
+)
+
+# Precomputed top-N similar jobs per posting (kept in sync with the catalog)
+SIMILAR_JOBS = SimilarJobsIndex(JOB_CATALOG, top_n=10)
+
+# Typo/alias-tolerant resolution of skills in query strings
+SKILL_RESOLVER = SkillResolver(JOB_CATALOG)
+
+# Skill names + demand counts for autocomplete
+SKILL_VOCABULARY = SkillVocabulary(JOB_CATALOG)
+
+# location / job_type / salary band bitmaps for search facets
+FACET_INDEX = FacetIndex(JOB_CATALOG)
+
+# BM25 index over job titles/descriptions for the q= search parameter
+TEXT_INDEX = TextSearchIndex(JOB_CATALOG)
+TEXT_SEARCH_LIMIT = 100
+
+# Per-skill postings, salary percentiles and co-occurrence, kept in step with the catalog
+MARKET_STATS = MarketStats(JOB_CATALOG)
+
+# TF-IDF resume <-> job text similarity, refitted when the catalog changes
+SEMANTIC_MATCHER = SemanticMatcher(JOB_CATALOG)
+
+# Ranked search results, invalidated when the catalog version changes
+SEARCH_CACHE = SearchCache(max_entries=512, ttl_seconds=300)
+
+# Skill -> saved profiles index for reverse (job -> candidates) matching
+CANDIDATE_INDEX = CandidateIndex()
+CANDIDATE_INDEX.load(PROFILE_STORE.iter_profiles())
+
+# Profile-editor sessions with cached per-job match components
+MATCH_SESSIONS = MatchSessionStore(max_sessions=1000)
+
+# Top-K matches + gap analysis per saved profile, computed after each save
+PROFILE_MATCHES = MaterializedMatches(
+    PROFILES_DIR / "matches", top_k=10, demand_for=MARKET_STATS.counts_for
+)
 
 @app.get("/")
 def root():
@@ -65,10 +223,25 @@ def root():
             "resume_parse": "POST /api/resume/parse",
             "resume_save": "POST /api/resume/save",
             "resume_get": "GET /api/resume/{profile_id}",
+            "resume_matches": "GET /api/resume/{profile_id}/matches",
+            "jobs_ingest": "POST /api/jobs/ingest",
             "jobs_search": "GET /api/jobs/search",
+            "jobs_semantic_search": "POST /api/jobs/semantic-search",
+            "jobs_search_batch": "POST /api/jobs/search/batch",
+            "match_session_create": "POST /api/jobs/match-session",
+            "match_session_update": "PATCH /api/jobs/match-session/{session_id}",
+            "job_get": "GET /api/jobs/{job_id}",
             "job_match_details": "GET /api/jobs/{job_id}/match",
+            "job_candidates": "GET /api/jobs/{job_id}/candidates",
+            "job_similar": "GET /api/jobs/{job_id}/similar",
             "skills_analyze": "POST /api/skills/analyze",
-            "skills_available": "GET /api/skills/available"
+            "skills_analyze_catalog": "POST /api/skills/analyze/catalog",
+            "skills_analyze_cohort": "POST /api/skills/analyze/cohort",
+            "skills_optimize": "POST /api/skills/optimize",
+            "skills_available": "GET /api/skills/available",
+            "skills_suggest": "GET /api/skills/suggest",
+            "skills_demand": "GET /api/skills/demand",
+            "uploads_gc": "POST /api/uploads/gc"
         }
     }
 
@@ -78,12 +251,19 @@ def health():
         "status": "ok",
         "service": "wevolve-api",
         "version": "1.0.0",
-        "jobs_loaded": len(MOCK_JOBS),
+        "jobs_loaded": len(JOB_CATALOG),
+        "catalog_version": JOB_CATALOG.version,
+        "profiles_saved": len(CANDIDATE_INDEX),
+        "profile_cache": PROFILE_CACHE.stats(),
+        "job_dedup": JOB_DEDUP.stats(),
         "upload_dir": str(UPLOAD_DIR.absolute()),
-        "uploads_count": len(list(UPLOAD_DIR.glob("*.pdf")))
+        "uploads_count": len(UPLOAD_STORE),
+        "upload_store": UPLOAD_STORE.stats(),
+        "upload_dedup": RESUME_FINGERPRINTS.stats(),
+        "search_cache": SEARCH_CACHE.stats()
     }
 
-@app.post("/api/resume/parse")
+@app.post("/api/resume/parse", response_model=ParseResumeResponse)
 async def parse_resume(file: UploadFile = File(...)):
     """
     Parse uploaded PDF/DOCX resume
@@ -92,11 +272,14 @@ async def parse_resume(file: UploadFile = File(...)):
     - Real parsing for: name, email, phone, skills, education, experience, projects
     - File storage with unique ID
     - Confidence scores for all fields
+    - Duplicate detection: re-uploads reuse the earlier parse and storage
     
     Returns:
     - ParsedResume with confidence scores
     - file_id for reference
     - original_filename
+    - duplicate_of / dedup: earlier upload this one matched
+      ("exact", "same_text" or "near"), otherwise null
     """
     # Validate file type
     if not (file.filename.endswith('.pdf') or file.filename.endswith('.docx')):
@@ -112,22 +295,66 @@ async def parse_resume(file: UploadFile = File(...)):
         raise HTTPException(status_code=413, detail="File too large (max 5MB)")
     
     try:
-        # Generate unique file ID
-        file_id = str(uuid.uuid4())
-        
-        # Save file to disk
         file_extension = ".pdf" if file.filename.endswith('.pdf') else ".docx"
-        file_path = UPLOAD_DIR / f"{file_id}{file_extension}"
-        with open(file_path, "wb") as f:
-            f.write(content)
+        digest = content_hash(content)
+        duplicate_of = None
+        dedup = None
         
-        # ✅ CRITICAL FIX: Pass filename to parser
-        parsed_data = parser_service.parse(content, file.filename)
+        exact = RESUME_FINGERPRINTS.find_exact(digest)
+        exact_parse = RESUME_FINGERPRINTS.parsed(exact)
+        if exact_parse is not None:
+            # Byte-identical re-upload: reuse the stored file and its parse
+            file_id = exact["file_id"]
+            parsed_data = exact_parse
+            duplicate_of, dedup = file_id, "exact"
+            RESUME_FINGERPRINTS.record_saving("exact", len(content), parse_reused=True)
+        else:
+            try:
+                # ✅ CRITICAL FIX: Pass filename to parser
+                text = parser_service.extract_text(content, file.filename)
+            except Exception as e:
+                print(f"❌ Text extraction error: {e}")
+                text = ""
+            
+            same_text = RESUME_FINGERPRINTS.find_same_text(text_hash(text)) if text.strip() else None
+            same_text_parse = RESUME_FINGERPRINTS.parsed(same_text)
+            if same_text_parse is not None:
+                # Different bytes, same normalized text: nothing new to parse or store
+                file_id = same_text["file_id"]
+                parsed_data = same_text_parse
+                duplicate_of, dedup = file_id, "same_text"
+                RESUME_FINGERPRINTS.record_saving("text", len(content), parse_reused=True)
+            else:
+                # Generate unique file ID
+                file_id = str(uuid.uuid4())
+                
+                # Save file to the content-addressed store
+                UPLOAD_STORE.put(file_id, content, file.filename)
+                
+                parsed_data = parser_service.parse_text(text)
+                fingerprint = simhash(text)
+                
+                near = RESUME_FINGERPRINTS.find_near(fingerprint) if text.strip() else None
+                if near:
+                    duplicate_of, dedup = near[0]["file_id"], "near"
+                    RESUME_FINGERPRINTS.record_saving("near")
+                
+                RESUME_FINGERPRINTS.add({
+                    "file_id": file_id,
+                    "extension": file_extension,
+                    "size": len(content),
+                    "content_hash": digest,
+                    "text_hash": text_hash(text),
+                    "simhash": fingerprint,
+                    "duplicate_of": duplicate_of
+                }, parsed=parsed_data)
         
         # Result with file metadata
         result = {
             "file_id": file_id,
             "original_filename": file.filename,
+            "duplicate_of": duplicate_of,
+            "dedup": dedup,
             "name": parsed_data.get("name", ""),
             "email": parsed_data.get("email", ""),
             "phone": parsed_data.get("phone", ""),
@@ -146,7 +373,7 @@ async def parse_resume(file: UploadFile = File(...)):
         }
         
         print(f"✅ Parsed resume: {result['name']} | {len(result['skills'])} skills | {len(result['education'])} education")
-        print(f"   File saved: {file_id}{file_extension}")
+        print(f"   File: {file_id}{file_extension}" + (f" ({dedup} duplicate of {duplicate_of})" if dedup else ""))
         print(f"   Confidence avg: {sum(result['confidence_scores'].values())/6:.2f}")
         
         return result
@@ -158,7 +385,7 @@ async def parse_resume(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=f"Failed to parse resume: {str(e)}")
 
 @app.post("/api/resume/save")
-async def save_corrected_resume(data: dict):
+async def save_corrected_resume(data: dict, background_tasks: BackgroundTasks, durable: bool = False):
     """
     Save user-corrected resume data
     
@@ -177,6 +404,10 @@ async def save_corrected_resume(data: dict):
         "file_id": "uuid-from-parse" (optional)
     }
     
+    Query params:
+    - durable: Wait until the profile is committed to disk (default: false,
+      the write is batched and flushed within a second)
+    
     Returns:
     {
         "success": true,
@@ -208,19 +439,27 @@ async def save_corrected_resume(data: dict):
         # Generate profile ID from email
         profile_id = f"PROF_{email.split('@')[0].upper().replace('.', '_')}"
         
-        # Save to JSON file for demo
-        profiles_dir = Path("saved_profiles")
-        profiles_dir.mkdir(exist_ok=True)
+        # Cached immediately, written behind; durable saves block on the flush
+        if durable:
+            await run_in_threadpool(PROFILE_CACHE.save, profile_id, data, True)
+        else:
+            PROFILE_CACHE.save(profile_id, data)
         
-        profile_file = profiles_dir / f"{profile_id}.json"
-        with open(profile_file, "w") as f:
-            json.dump(data, f, indent=2)
+        # Keep reverse-matching index in sync
+        CANDIDATE_INDEX.upsert(profile_id, data)
+        
+        # Materialize top-K matches so the dashboard loads instantly
+        indexed = CANDIDATE_INDEX.get(profile_id)
+        background_tasks.add_task(
+            PROFILE_MATCHES.refresh,
+            profile_id, indexed["skills"], indexed["experience_years"], JOB_CATALOG
+        )
         
         print(f"✅ Saved corrected resume for: {data['name']}")
         print(f"   Email: {email}")
         print(f"   Skills: {len(data.get('skills', []))}")
         print(f"   Profile ID: {profile_id}")
-        print(f"   Saved to: {profile_file}")
+        print(f"   Saved to: {PROFILE_STORE.db_path}")
         
         return {
             "success": True,
@@ -251,18 +490,14 @@ def get_saved_resume(profile_id: str):
     Returns saved resume data or 404 if not found
     """
     try:
-        profiles_dir = Path("saved_profiles")
-        profile_file = profiles_dir / f"{profile_id}.json"
+        data = PROFILE_CACHE.get(profile_id)
         
-        if not profile_file.exists():
+        if data is None:
             raise HTTPException(
                 status_code=404, 
                 detail=f"Profile {profile_id} not found"
             )
         
-        with open(profile_file, "r") as f:
-            data = json.load(f)
-        
         print(f"✅ Retrieved profile: {profile_id}")
         
         return {
@@ -280,57 +515,384 @@ def get_saved_resume(profile_id: str):
             detail=f"Failed to retrieve profile: {str(e)}"
         )
 
+@app.get("/api/resume/{profile_id}/matches")
+def get_profile_matches(profile_id: str):
+    """
+    Precomputed top job matches (with gap analysis) for a saved profile
+    
+    Path params:
+    - profile_id: Profile ID (e.g., "PROF_JOHNDOE")
+    
+    Results are computed in the background when the profile is saved and
+    recomputed here only if the catalog or the profile's skills changed.
+    """
+    indexed = CANDIDATE_INDEX.get(profile_id)
+    if indexed is None:
+        raise HTTPException(status_code=404, detail=f"Profile {profile_id} not found")
+    
+    result = PROFILE_MATCHES.get(
+        profile_id, indexed["skills"], indexed["experience_years"], JOB_CATALOG
+    )
+    
+    return {
+        "success": True,
+        "profile_id": profile_id,
+        **result
+    }
+
+@app.post("/api/jobs/ingest")
+def ingest_jobs(data: dict):
+    """
+    Add job postings to the catalog, collapsing near-duplicates
+    
+    Request body:
+    {
+        "jobs": [{"job_id": "J101", "title": "...", "company": "...",
+                  "description": "...", "required_skills": [...], ...}]
+    }
+    
+    Returns:
+    - added: job_ids added to the catalog
+    - duplicates: {duplicate_job_id: canonical_job_id}
+    - dedup_report: catalog size reduction and dedup cost so far
+    """
+    jobs = data.get("jobs")
+    if not isinstance(jobs, list) or not jobs:
+        raise HTTPException(status_code=400, detail="jobs must be a non-empty array")
+    
+    for job in jobs:
+        if not isinstance(job, dict) or not job.get("job_id") or not job.get("title"):
+            raise HTTPException(status_code=400, detail="Each job needs job_id and title")
+        if not isinstance(job.get("required_skills", []), list):
+            raise HTTPException(status_code=400, detail="required_skills must be an array")
+        # Reject what GET /api/jobs/{job_id} could not serve back
+        try:
+            JobPosting.model_validate(job)
+        except ValidationError as e:
+            error = e.errors()[0]
+            field = ".".join(str(part) for part in error["loc"])
+            raise HTTPException(status_code=400, detail=f"Invalid job {job['job_id']}: {field}: {error['msg']}")
+    
+    unique, aliases = dedupe_jobs(jobs, JOB_DEDUP)
+    for job in unique:
+        JOB_CATALOG.add_job(job)
+    for alias, canonical in aliases.items():
+        JOB_CATALOG.add_alias(alias, canonical)
+    # Refit TF-IDF once per batch, not on the next semantic query
+    SEMANTIC_MATCHER.refresh()
+    
+    print(f"✅ Ingested {len(unique)} jobs ({len(aliases)} duplicates collapsed)")
+    
+    return {
+        "added": [job["job_id"] for job in unique],
+        "duplicates": aliases,
+        "catalog_size": len(JOB_CATALOG),
+        "dedup_report": JOB_DEDUP.stats()
+    }
+
 @app.get("/api/jobs/search")
 def search_jobs(
     skills: str = "",
     experience: int = 0,
     location: str = None,
     min_salary: int = None,
-    max_salary: int = None
+    max_salary: int = None,
+    q: str = None,
+    related: bool = False,
+    facets: bool = False,
+    fields: str = None,
+    if_none_match: str = Header(None)
 ):
     """
     Search and rank jobs based on candidate profile
     
     Query params:
-    - skills: Comma-separated list (e.g., "Python,React,Docker")
+    - skills: Comma-separated list (e.g., "Python,React,Docker"); misspelled
+      or aliased skills ("Pyhton", "React JS") are resolved to catalog skills
     - experience: Years of experience (default: 0)
     - location: Preferred location (optional, filters for exact match or Remote)
     - min_salary: Minimum salary in INR (optional)
     - max_salary: Maximum salary in INR (optional)
+    - q: Free-text query over job titles and descriptions (optional, BM25)
+    - related: Give partial credit for related/implied skills from the
+      skills taxonomy (default: false)
+    - facets: Also return per-location / job_type / salary_band counts
+      for the results (default: false)
+    - fields: Comma-separated columns to return, or "all" for full records
+      (default: job_id, title, company, location, salary_range, match_score)
     
     Returns:
     - List of jobs ranked by match_score (highest first)
     - Each job includes match_score field (0-100)
+    - Full job details (description etc.) via GET /api/jobs/{job_id}
+    - With q: only text matches, with text_score and search_score
+      (blend of match_score and text_score), ranked by search_score
+    - X-Resolved-Skills header listing rewritten skills ("pyhton=python",
+      percent-encoded)
+    - With facets: {"jobs": [...], "facets": {"location": {"Bangalore": 10, ...},
+      "job_type": {...}, "salary_band": {"6-10L": 12, ...}}}
+    
+    Results are cached per normalized query (deduplicated, alias-resolved
+    skills + filters) until the catalog version changes. The result list is
+    serialized straight to JSON bytes (no jsonable_encoder pass).
+    
+    The ETag covers the catalog version + normalized query; a matching
+    If-None-Match gets 304 Not Modified without ranking anything.
     """
+    try:
+        columns = parse_fields(fields, extra=("text_score", "search_score") if q else ())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     try:
         # Parse candidate skills
         candidate_skills = [s.strip() for s in skills.split(",")] if skills else []
+        candidate_skills, corrections = SKILL_RESOLVER.resolve_skills(candidate_skills)
+        headers = {}
+        if corrections:
+            # Header values must be latin-1; percent-encode anything else (and , =)
+            headers["X-Resolved-Skills"] = ", ".join(
+                f"{quote(raw, safe=' +#/')}={quote(skill, safe=' +#/')}"
+                for raw, skill in corrections.items()
+            )
         
-        # Use copy to avoid modifying original MOCK_JOBS
-        jobs_copy = [job.copy() for job in MOCK_JOBS]
-        
-        # Rank jobs with matching algorithm
-        ranked_jobs = rank_jobs(
-            candidate_skills=candidate_skills,
-            jobs=jobs_copy,
-            experience_years=experience,
-            location_preference=location,
-            min_salary=min_salary,
-            max_salary=max_salary
+        # One normalized location for the cache key and both filter paths
+        location = normalize_location(location)
+        cache_key = canonicalize_query(
+            candidate_skills, experience, location, min_salary, max_salary, q, related
         )
         
+        etag = make_etag(JOB_CATALOG.version, "search", cache_key, columns, facets, headers.get("X-Resolved-Skills"))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        
+        def compute():
+            text_hits = TEXT_INDEX.search(q, TEXT_SEARCH_LIMIT) if q else None
+            
+            # Use copy to avoid modifying the catalog records
+            if text_hits is None:
+                jobs_copy = [job.copy() for job in JOB_CATALOG.jobs]
+            else:
+                jobs_copy = [JOB_CATALOG.get(job_id).copy() for job_id, _ in text_hits]
+            
+            # Rank jobs with matching algorithm (on the canonical skill set)
+            ranked = rank_jobs(
+                candidate_skills=list(cache_key[0]),
+                jobs=jobs_copy,
+                experience_years=experience,
+                location_preference=location,
+                min_salary=min_salary,
+                max_salary=max_salary,
+                related_credit=related
+            )
+            return ranked if text_hits is None else blend_text_scores(ranked, text_hits)
+        
+        ranked_jobs = SEARCH_CACHE.get_or_compute(cache_key, JOB_CATALOG.version, compute)
+        
         print(f"✅ Ranked {len(ranked_jobs)} jobs for {len(candidate_skills)} skills")
         if ranked_jobs:
             print(f"   Top 3 scores: {[j.get('match_score', 0) for j in ranked_jobs[:3]]}")
         
-        return ranked_jobs
+        if facets:
+            # Result set straight from bitmaps: filters AND (text hits when q is set)
+            result_bits = FACET_INDEX.filter_bits(location, min_salary, max_salary)
+            if q:
+                result_bits &= FACET_INDEX.result_bits(
+                    job_id for job_id, _ in TEXT_INDEX.search(q, TEXT_SEARCH_LIMIT)
+                )
+            content = {"jobs": project_jobs(ranked_jobs, columns), "facets": FACET_INDEX.counts(result_bits)}
+        else:
+            content = project_jobs(ranked_jobs, columns)
+        
+        return FastJSONResponse(content, headers=cache_headers(etag, headers))
         
     except Exception as e:
         print(f"❌ Job search error: {e}")
         raise HTTPException(status_code=500, detail=f"Job search failed: {str(e)}")
 
+@app.post("/api/jobs/semantic-search")
+def semantic_search_jobs(data: dict):
+    """
+    Rank jobs by skill match blended with resume text similarity
+    
+    Request body:
+    {
+        "resume_text": "..."  or  "file_id": "<id from /api/resume/parse>",
+        "skills": ["Python", "React"] (optional, parsed from the resume if omitted),
+        "experience": 2 (optional),
+        "semantic_weight": 0.4 (optional, 0-1),
+        "limit": 20 (optional)
+    }
+    
+    Returns jobs ranked by combined_score, each with match_score
+    (skills), semantic_score (TF-IDF cosine, 0-100) and combined_score.
+    """
+    resume_text = data.get("resume_text")
+    file_id = data.get("file_id")
+    skills = data.get("skills")
+    semantic_weight = data.get("semantic_weight", 0.4)
+    experience = require_experience(data.get("experience"))
+    limit = require_positive_int(data.get("limit", 20), "limit")
+    
+    if not isinstance(semantic_weight, (int, float)) or not 0 <= semantic_weight <= 1:
+        raise HTTPException(status_code=400, detail="semantic_weight must be between 0 and 1")
+    
+    if not resume_text and file_id:
+        upload = UPLOAD_STORE.get(file_id)
+        content = UPLOAD_STORE.read(file_id) if upload else None
+        # The record can outlive its blob (expired or reclaimed meanwhile)
+        if content is None:
+            raise HTTPException(status_code=404, detail=f"Upload {file_id} not found")
+        resume_text = parser_service.extract_text(content, f"{file_id}{upload['extension']}")
+        parsed = RESUME_FINGERPRINTS.parsed(RESUME_FINGERPRINTS.get(file_id))
+        if skills is None and parsed:
+            skills = parsed.get("skills", [])
+    
+    if not resume_text or not isinstance(resume_text, str):
+        raise HTTPException(status_code=400, detail="resume_text or file_id is required")
+    
+    if skills is None:
+        skills = parser_service.parse_text(resume_text).get("skills", [])
+    if not isinstance(skills, list):
+        raise HTTPException(status_code=400, detail="Skills must be an array")
+    
+    ranked = rank_jobs(
+        candidate_skills=canonical_skills(skills),
+        jobs=[job.copy() for job in JOB_CATALOG.jobs],
+        experience_years=experience
+    )
+    similarities = SEMANTIC_MATCHER.similarities(resume_text)
+    results = blend_semantic_scores(ranked, similarities, semantic_weight)[:limit]
+    
+    print(f"✅ Semantic search: {len(similarities)} jobs share terms with the resume")
+    
+    return results
+
+@app.post("/api/jobs/search/batch")
+def search_jobs_batch(data: dict):
+    """
+    Top-K job matches for many candidates in one call
+    
+    Request body:
+    {
+        "candidates": [
+            {"id": "user-1", "skills": ["Python", "React"], "experience": 2},
+            ...
+        ],
+        "top_k": 10
+    }
+    
+    Returns newline-delimited JSON, one line per candidate in request order:
+    {"id": "user-1", "matches": [{"job_id", "title", "company", "match_score"}, ...]}
+    """
+    candidates = data.get("candidates")
+    top_k = data.get("top_k", 10)
+    
+    if not isinstance(candidates, list) or not candidates:
+        raise HTTPException(status_code=400, detail="candidates must be a non-empty array")
+    
+    require_positive_int(top_k, "top_k")
+    
+    # Validate every candidate before streaming: once the 200 is sent,
+    # a bad candidate can only abort the response mid-body
+    normalized = []
+    for candidate in candidates:
+        if not isinstance(candidate, dict):
+            raise HTTPException(status_code=400, detail="Each candidate must be an object")
+        normalized.append({
+            "id": candidate.get("id"),
+            "skills": canonical_skills(require_skill_list(candidate.get("skills", []), "candidate skills")),
+            "experience": require_experience(candidate.get("experience"))
+        })
+    # Small batches are cheaper in-process than spinning up a pool
+    processes = None if len(candidates) > 1000 else 1
+    results = rank_jobs_batch(normalized, list(JOB_CATALOG.jobs), top_k, processes=processes)
+    
+    print(f"✅ Batch matching {len(candidates)} candidates (top {top_k})")
+    
+    return StreamingResponse(
+        (json.dumps(result) + "\n" for result in results),
+        media_type="application/x-ndjson"
+    )
+
+@app.post("/api/jobs/match-session")
+def create_match_session(data: dict):
+    """
+    Start an incremental matching session for the profile editor
+    
+    Request body:
+    {
+        "skills": ["Python", "React"],
+        "experience": 1,
+        "location": "Bangalore" (optional),
+        "min_salary": 500000 (optional),
+        "max_salary": 1500000 (optional),
+        "limit": 20 (optional)
+    }
+    
+    Returns session_id plus the current top jobs. Follow-up skill edits go
+    to PATCH /api/jobs/match-session/{session_id}.
+    """
+    skills = require_skill_list(data.get("skills", []))
+    experience = require_experience(data.get("experience"))
+    limit = require_positive_int(data.get("limit", 20), "limit")
+    
+    session = MatchSession(
+        JOB_CATALOG,
+        skills,
+        experience_years=experience,
+        location_preference=data.get("location"),
+        min_salary=data.get("min_salary"),
+        max_salary=data.get("max_salary")
+    )
+    session_id = MATCH_SESSIONS.create(session)
+    
+    with session.lock:
+        jobs = session.top(limit)
+    
+    return {
+        "session_id": session_id,
+        "skills": sorted(session.skills),
+        "jobs": jobs
+    }
+
+@app.patch("/api/jobs/match-session/{session_id}")
+def update_match_session(session_id: str, data: dict):
+    """
+    Apply a skill delta and return the updated top jobs
+    
+    Request body:
+    {
+        "add": ["Docker"],
+        "remove": ["React"],
+        "limit": 20 (optional)
+    }
+    
+    Only jobs requiring an added/removed skill are re-scored.
+    """
+    session = MATCH_SESSIONS.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=f"Match session {session_id} not found")
+    
+    add = require_skill_list(data.get("add", []), "add")
+    remove = require_skill_list(data.get("remove", []), "remove")
+    limit = require_positive_int(data.get("limit", 20), "limit")
+    
+    with session.lock:
+        updated = session.apply_delta(add, remove)
+        jobs = session.top(limit)
+    
+    print(f"✅ Match session {session_id[:8]}: re-scored {updated} jobs")
+    
+    return {
+        "session_id": session_id,
+        "skills": sorted(session.skills),
+        "rescored_jobs": updated,
+        "jobs": jobs
+    }
+
 @app.get("/api/jobs/{job_id}/match")
-def get_job_match_details(job_id: str, skills: str = ""):
+def get_job_match_details(job_id: str, skills: str = "", if_none_match: str = Header(None)):
     """
     Get detailed match insights for a specific job
     
@@ -338,32 +900,42 @@ def get_job_match_details(job_id: str, skills: str = ""):
     - job_id: Job ID (e.g., "J001")
     
     Query params:
-    - skills: Comma-separated candidate skills
+    - skills: Comma-separated candidate skills (typos/aliases are resolved)
     
     Returns:
     - Job details
     - Matching skills (green - candidate has these)
     - Missing skills (red - candidate needs these)
+    - Related skills (missing, but partly covered by a related/implied skill)
     - Additional skills (blue - candidate has, but job doesn't require)
     - Match percentage
+    - resolved_skills: query skills that were rewritten, e.g. {"Pyhton": "python"}
+    
+    ETag/If-None-Match: unchanged catalog + skills revalidate with 304.
     """
     try:
         candidate_skills = [s.strip() for s in skills.split(",")] if skills else []
+        candidate_skills, corrections = SKILL_RESOLVER.resolve_skills(candidate_skills)
         
         # Find the job
-        job = next((j for j in MOCK_JOBS if j["job_id"] == job_id), None)
+        job = JOB_CATALOG.get(job_id)
         if not job:
             raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
         
+        etag = make_etag(JOB_CATALOG.version, "match", job_id, tuple(candidate_skills), tuple(corrections.items()))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        
         # Get detailed insights
         insights = get_matching_insights(candidate_skills, job)
         
         print(f"✅ Match details for {job_id}: {insights['match_percentage']}% match")
         
-        return {
+        return FastJSONResponse({
             "job": job,
-            "insights": insights
-        }
+            "insights": insights,
+            "resolved_skills": corrections
+        }, headers=cache_headers(etag))
         
     except HTTPException:
         raise
@@ -371,7 +943,75 @@ def get_job_match_details(job_id: str, skills: str = ""):
         print(f"❌ Match details error: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get match details: {str(e)}")
 
-@app.post("/api/skills/analyze")
+@app.get("/api/jobs/{job_id}", response_model=JobPosting, response_model_exclude_unset=True)
+def get_job(job_id: str):
+    """
+    Full job posting (description, skills, ...) for a detail view
+    
+    Duplicate postings collapsed at ingest resolve to their canonical job.
+    """
+    job = JOB_CATALOG.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    
+    return job
+
+@app.get("/api/jobs/{job_id}/candidates")
+def get_job_candidates(job_id: str, limit: int = 10):
+    """
+    Rank saved candidate profiles for a specific job (reverse matching)
+    
+    Path params:
+    - job_id: Job ID (e.g., "J001")
+    
+    Query params:
+    - limit: Number of candidates to return (default: 10)
+    
+    Returns:
+    - Top candidates by match_score, using the same weighting as job search
+    - Only profiles with at least one required skill are ranked
+    """
+    job = JOB_CATALOG.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    
+    if limit < 1:
+        raise HTTPException(status_code=400, detail="limit must be at least 1")
+    
+    candidates = CANDIDATE_INDEX.top_candidates(job, limit)
+    
+    print(f"✅ Ranked {len(candidates)} candidates for {job_id}")
+    
+    return {
+        "job_id": job_id,
+        "candidates": candidates,
+        "count": len(candidates),
+        "indexed_profiles": len(CANDIDATE_INDEX)
+    }
+
+@app.get("/api/jobs/{job_id}/similar")
+def get_similar_jobs(job_id: str, limit: int = 10):
+    """
+    Jobs most similar to a given job (Jaccard similarity of required skills)
+    
+    Path params:
+    - job_id: Job ID (e.g., "J001")
+    
+    Query params:
+    - limit: Number of similar jobs (default: 10, max: 10)
+    """
+    if not JOB_CATALOG.get(job_id):
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    
+    similar = SIMILAR_JOBS.similar(job_id, limit)
+    
+    return {
+        "job_id": job_id,
+        "similar_jobs": similar,
+        "count": len(similar)
+    }
+
+@app.post("/api/skills/analyze", response_model=GapAnalysisResponse)
 def analyze_gap_endpoint(data: dict):
     """
     Analyze skill gaps and generate learning roadmap
@@ -426,10 +1066,11 @@ def analyze_gap_endpoint(data: dict):
         # Analyze gap using the smart gap service
         analysis = analyze_skill_gap(current_skills, target_skills)
         
-        # Generate phased learning roadmap
+        # Generate phased learning roadmap (in-demand skills first within a phase)
         roadmap = generate_learning_roadmap(
             analysis["missing_skills"],
-            current_skills
+            current_skills,
+            demand=MARKET_STATS.counts_for(analysis["missing_skills"])
         )
         
         print(f"✅ Gap analysis complete:")
@@ -451,22 +1092,273 @@ def analyze_gap_endpoint(data: dict):
             detail=f"Gap analysis failed: {str(e)}"
         )
 
+@app.post("/api/skills/analyze/catalog")
+def analyze_catalog_gap_endpoint(data: dict):
+    """
+    Find the jobs a candidate is closest to and the skills that unlock the most jobs
+    
+    Request body:
+    {
+        "current_skills": ["Python", "FastAPI"],
+        "limit": 10 (optional, closest jobs),
+        "skills_limit": 10 (optional, skills to learn)
+    }
+    
+    Returns:
+    {
+        "jobs_considered": 30,
+        "jobs_ready": 1,
+        "closest_jobs": [{"job_id", "title", "company", "missing_skills",
+                          "gap_months", "readiness_score"}, ...],
+        "skills_to_learn": [{"skill": "Docker", "jobs_unlocked": 3,
+                             "jobs_requiring": 9, "learning_months": 2}, ...]
+    }
+    gap_months sums learning_months of a job's missing skills; jobs_unlocked
+    counts jobs for which the skill is the only one missing.
+    """
+    current_skills = data.get("current_skills", [])
+    limit = data.get("limit", 10)
+    skills_limit = data.get("skills_limit", 10)
+    
+    if not isinstance(current_skills, list):
+        raise HTTPException(status_code=400, detail="current_skills must be an array")
+    
+    require_positive_int(limit, "limit")
+    require_positive_int(skills_limit, "skills_limit")
+    
+    resolved, _ = SKILL_RESOLVER.resolve_skills(current_skills)
+    result = analyze_catalog_gap(resolved, JOB_CATALOG, limit, skills_limit)
+    
+    print(f"✅ Catalog gap analysis: {result['jobs_ready']}/{result['jobs_considered']} jobs ready")
+    
+    return result
+
+@app.post("/api/skills/analyze/cohort")
+def analyze_cohort_endpoint(data: dict):
+    """
+    Gap report for a whole cohort against one target role
+    
+    Request body (target: target_skills or a job_id; profiles: saved
+    profile_ids or inline profiles):
+    {
+        "target_skills": ["Python", "Docker", "AWS"]  or  "job_id": "J001",
+        "profile_ids": ["PROF_...", ...]
+        or "profiles": [{"profile_id": "s-1", "name": "...", "skills": [...]}, ...]
+    }
+    
+    Returns newline-delimited JSON:
+    - {"type": "group", "gap_group": 1, "missing_skills": [...], "learning_roadmap": [...], ...}
+      once per distinct missing-skill set (roadmaps are shared, not per student)
+    - {"type": "profile", "profile_id": ..., "readiness_score": ..., "missing_skills": [...], "gap_group": 1}
+    - {"type": "summary", "profiles": n, "average_readiness": ..., "missing_skill_histogram": {...}} last
+    """
+    target_skills = data.get("target_skills")
+    job_id = data.get("job_id")
+    profile_ids = data.get("profile_ids")
+    profiles = data.get("profiles")
+    
+    if not target_skills and job_id:
+        job = JOB_CATALOG.get(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+        target_skills = job.get("required_skills", [])
+    
+    if not isinstance(target_skills, list) or not target_skills:
+        raise HTTPException(status_code=400, detail="target_skills (or a job_id) is required")
+    require_skill_list(target_skills, "target_skills")
+    
+    # Everything is validated before streaming: once the 200 is sent, a
+    # bad profile can only abort the response mid-body
+    if profile_ids is not None:
+        require_skill_list(profile_ids, "profile_ids")
+        unknown = [pid for pid in profile_ids if CANDIDATE_INDEX.get(pid) is None]
+        if unknown:
+            raise HTTPException(status_code=404, detail=f"Profiles not found: {', '.join(unknown[:10])}")
+        profiles = (CANDIDATE_INDEX.get(pid) for pid in profile_ids)
+        cohort_size = len(profile_ids)
+    elif isinstance(profiles, list) and profiles:
+        for profile in profiles:
+            if not isinstance(profile, dict):
+                raise HTTPException(status_code=400, detail="Each profile must be an object")
+            require_skill_list(profile.get("skills", []), "profile skills")
+        cohort_size = len(profiles)
+    else:
+        raise HTTPException(status_code=400, detail="profile_ids or profiles is required")
+    
+    print(f"✅ Cohort analysis: {cohort_size} profiles against {len(target_skills)} skills")
+    
+    return StreamingResponse(
+        (json.dumps(row) + "\n" for row in analyze_cohort(
+            profiles, target_skills, demand=MARKET_STATS.counts_for(target_skills)
+        )),
+        media_type="application/x-ndjson"
+    )
+
+@app.post("/api/skills/optimize")
+def optimize_learning_path_endpoint(data: dict):
+    """
+    Choose which skills to learn within a time budget for the biggest payoff
+    
+    Request body:
+    {
+        "current_skills": ["Python", "FastAPI"],
+        "budget_months": 6,
+        "objective": "count" (jobs unlocked, default) or "salary"
+    }
+    
+    Returns the chosen skills (prerequisites included, in learning order),
+    months_used, jobs_unlocked / value_unlocked, unlocked_jobs and a
+    phased learning_roadmap for the chosen skills. A job is unlocked when
+    the candidate would have every required skill.
+    """
+    current_skills = data.get("current_skills", [])
+    budget_months = data.get("budget_months")
+    objective = data.get("objective", "count")
+    
+    if not isinstance(current_skills, list):
+        raise HTTPException(status_code=400, detail="current_skills must be an array")
+    
+    require_positive_int(budget_months, "budget_months")
+    
+    if objective not in ("count", "salary"):
+        raise HTTPException(status_code=400, detail="objective must be 'count' or 'salary'")
+    
+    resolved, _ = SKILL_RESOLVER.resolve_skills(current_skills)
+    result = optimize_learning_path(
+        resolved, JOB_CATALOG, budget_months, objective,
+        demand=MARKET_STATS.counts_for(JOB_CATALOG.skills())
+    )
+    
+    print(f"✅ Learning path: {len(result['skills_to_learn'])} skills, "
+          f"{result['months_used']}/{budget_months} months, {result['jobs_unlocked']} jobs unlocked")
+    
+    return result
+
 @app.get("/api/skills/available")
-def get_available_skills():
+def get_available_skills(if_none_match: str = Header(None)):
     """
     Get list of all skills across all jobs (for autocomplete/suggestions)
     
     Returns all unique skills from job listings
+    (prefer /api/skills/suggest for autocomplete)
+    
+    ETag follows the catalog version; If-None-Match revalidates with 304.
     """
-    all_skills = set()
-    for job in MOCK_JOBS:
-        all_skills.update(job.get("required_skills", []))
+    etag = make_etag(JOB_CATALOG.version, "skills")
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
     
-    return {
-        "skills": sorted(list(all_skills)),
+    all_skills = SKILL_VOCABULARY.skills()
+    
+    return FastJSONResponse({
+        "skills": all_skills,
         "count": len(all_skills)
+    }, headers=cache_headers(etag))
+
+@app.get("/api/skills/suggest")
+def suggest_skills(prefix: str = "", limit: int = 10):
+    """
+    Autocomplete skills by prefix
+    
+    Query params:
+    - prefix: Typed text; matches skill names and aliases (e.g. "post", "k8")
+    - limit: Max suggestions (1-50, default: 10)
+    
+    Returns suggestions ranked by demand (number of jobs requiring the skill):
+    {"prefix": "py", "suggestions": [{"skill": "Python", "job_count": 12}, ...]}
+    """
+    if limit < 1 or limit > 50:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 50")
+    
+    return {
+        "prefix": prefix,
+        "suggestions": SKILL_VOCABULARY.suggest(prefix, limit)
+    }
+
+@app.get("/api/skills/demand")
+def skill_demand(skill: str = None, limit: int = 20, sort: str = "count"):
+    """
+    Market demand for skills across the job catalog
+    
+    Query params:
+    - skill: Return stats for one skill (typos/aliases are resolved)
+    - limit: Max skills when listing (1-100, default: 20)
+    - sort: "count" (number of postings) or "salary" (salary-weighted demand)
+    
+    Returns (per skill):
+    {
+        "skill": "Python",
+        "job_count": 12,
+        "share_of_jobs": 48.0,
+        "salary_p25": 900000.0,
+        "salary_median": 1150000.0,
+        "salary_p75": 1500000.0,
+        "salary_weighted_demand": 14100000.0,
+        "often_required_with": [{"skill": "Django", "jobs": 4}, ...]
+    }
+    Statistics are maintained as jobs are added/removed, not computed per request.
+    """
+    if skill is not None:
+        resolved = SKILL_RESOLVER.resolve(skill)
+        stats = MARKET_STATS.skill_stats(resolved[0] if resolved else skill)
+        if stats is None:
+            raise HTTPException(status_code=404, detail=f"No jobs require skill: {skill}")
+        return stats
+    
+    if limit < 1 or limit > 100:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 100")
+    if sort not in ("count", "salary"):
+        raise HTTPException(status_code=400, detail="sort must be 'count' or 'salary'")
+    
+    return {
+        "total_jobs": len(JOB_CATALOG),
+        "sort": sort,
+        "skills": MARKET_STATS.top_skills(limit, sort)
     }
 
+@app.post("/api/uploads/gc")
+def collect_uploads(data: dict = None, x_admin_token: str = Header(None)):
+    """
+    Expire old uploads and reclaim blob storage (admin only)
+    
+    Headers:
+    - X-Admin-Token: must match WEVOLVE_ADMIN_TOKEN (403 otherwise, and
+      always while it is unset)
+    
+    Request body (optional):
+    {
+        "max_age_days": 90  (expire uploads older than this, at least
+                             MIN_UPLOAD_AGE_DAYS; omit to only reclaim
+                             unreferenced blobs)
+    }
+    
+    Uploads referenced by a saved profile (its file_id) are never expired.
+    
+    Returns expired_files, removed_blobs, bytes_freed and
+    fingerprints_dropped (fingerprint records of expired uploads, so
+    duplicate detection never points at a deleted file).
+    """
+    require_admin(x_admin_token)
+    
+    max_age_days = (data or {}).get("max_age_days")
+    if max_age_days is not None and (
+        isinstance(max_age_days, bool) or not isinstance(max_age_days, (int, float))
+        or max_age_days < MIN_UPLOAD_AGE_DAYS
+    ):
+        raise HTTPException(
+            status_code=400, detail=f"max_age_days must be a number of at least {MIN_UPLOAD_AGE_DAYS}"
+        )
+    
+    PROFILE_CACHE.flush()
+    keep = {profile.get("file_id") for _, profile in PROFILE_STORE.iter_profiles()} - {None}
+    result = UPLOAD_STORE.gc(max_age_days * 86400 if max_age_days is not None else None, keep=keep)
+    expired = result.pop("expired_file_ids")
+    result["fingerprints_dropped"] = RESUME_FINGERPRINTS.forget(expired)
+    
+    print(f"✅ Upload GC: {result}")
+    
+    return result
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
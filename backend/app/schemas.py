@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List, Dict, Optional
+from pydantic import BaseModel, ConfigDict, field_validator
+from typing import List, Dict, Optional, Union
 
 class Education(BaseModel):
     degree: str
@@ -7,6 +7,7 @@ class Education(BaseModel):
     institution: str
     year: Optional[str] = None
     cgpa: Optional[float] = None
+    percentage: Optional[float] = None
 
 class Experience(BaseModel):
     title: str
@@ -24,25 +25,43 @@ class ParsedResume(BaseModel):
     projects: List[str] = []
     confidence_scores: Dict[str, float]
 
+class ParseResumeResponse(ParsedResume):
+    file_id: str
+    original_filename: str
+    duplicate_of: Optional[str] = None
+    dedup: Optional[str] = None
+
+# Only job_id and title are required at ingest, so the rest may be absent.
+# Ingest validates against this model; extra fields are kept as posted.
 class JobPosting(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
     job_id: str
     title: str
-    company: str
-    location: str
-    salary_range: List[int]
-    required_skills: List[str]
-    experience_required: str
-    job_type: str
-    posted_date: str
-    description: str
+    company: str = ""
+    location: str = ""
+    salary_range: List[float] = []
+    required_skills: List[str] = []
+    experience_required: Union[str, int] = ""
+    job_type: str = ""
+    posted_date: str = ""
+    description: str = ""
     match_score: Optional[float] = None
 
+    @field_validator("salary_range")
+    @classmethod
+    def _salary_pair(cls, value: List[float]) -> List[float]:
+        if value and len(value) != 2:
+            raise ValueError("must be empty or [min, max]")
+        return value
+
 class SkillGapAnalysis(BaseModel):
     matching_skills: List[str]
     missing_skills: List[str]
     skill_gap_percentage: float
     readiness_score: float
     estimated_learning_time_months: int
+    confidence_level: str
 
 class LearningPhase(BaseModel):
     phase: int
@@ -51,6 +70,7 @@ class LearningPhase(BaseModel):
     skills_to_learn: List[str]
     priority: str
     reasoning: str
+    resources: List[Dict[str, str]] = []
 
 class GapAnalysisResponse(BaseModel):
     analysis: SkillGapAnalysis
@@ -0,0 +1,161 @@
+from typing import List, Dict, Set, Iterable, Tuple
+from datetime import date
+import heapq
+import re
+import threading
+
+from app.services.matching_service import calculate_match_score, canonical_skills
+
+
+class CandidateIndex:
+    """
+    Inverted index of saved candidate profiles by skill
+
+    - Posting lists map each canonical skill to the profiles that have it
+    - Ranking candidates for a job only scores profiles that share at
+      least one required skill, so cost follows the size of the job's
+      posting lists rather than the total number of profiles
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._profiles: Dict[str, Dict] = {}
+        self._postings: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def upsert(self, profile_id: str, data: Dict):
+        """Index (or re-index) a saved profile"""
+        skills = canonical_skills(data.get("skills", []))
+        entry = {
+            "profile_id": profile_id,
+            "name": data.get("name", ""),
+            "email": data.get("email", ""),
+            "skills": skills,
+            "experience_years": _experience_years(data),
+        }
+
+        with self._lock:
+            self._unlink(profile_id)
+            self._profiles[profile_id] = entry
+            for skill in skills:
+                self._postings.setdefault(skill, set()).add(profile_id)
+
+    def remove(self, profile_id: str):
+        with self._lock:
+            self._unlink(profile_id)
+
+    def _unlink(self, profile_id: str):
+        old = self._profiles.pop(profile_id, None)
+        if old is None:
+            return
+        for skill in old["skills"]:
+            posting = self._postings.get(skill)
+            if posting is not None:
+                posting.discard(profile_id)
+                if not posting:
+                    del self._postings[skill]
+
+    def get(self, profile_id: str) -> Dict:
+        return self._profiles.get(profile_id)
+
+    def profile_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._profiles)
+
+    def load(self, profiles: Iterable[Tuple[str, Dict]]) -> int:
+        """Index (profile_id, data) pairs, e.g. ProfileStore.iter_profiles()"""
+        loaded = 0
+        for profile_id, data in profiles:
+            self.upsert(profile_id, data)
+            loaded += 1
+        return loaded
+
+    def top_candidates(self, job: Dict, limit: int = 10) -> List[Dict]:
+        """
+        Rank indexed profiles for a job (same weighting as job search)
+
+        Only profiles with at least one required skill are considered.
+        """
+        job_skills = job.get("required_skills", [])
+
+        with self._lock:
+            candidate_ids = set()
+            for skill in canonical_skills(job_skills):
+                candidate_ids.update(self._postings.get(skill, ()))
+            entries = [self._profiles[pid] for pid in candidate_ids]
+
+        job_set = set(s.lower() for s in job_skills)
+        scored = []
+        for entry in entries:
+            score = calculate_match_score(entry["skills"], job_skills, entry["experience_years"])
+            scored.append((score, entry["profile_id"], entry))
+
+        # Highest score first, profile_id as a stable tie-breaker
+        top = heapq.nsmallest(limit, scored, key=lambda x: (-x[0], x[1]))
+
+        return [
+            {
+                "profile_id": entry["profile_id"],
+                "name": entry["name"],
+                "email": entry["email"],
+                "match_score": score,
+                "matching_skills": [s for s in entry["skills"] if s in job_set],
+            }
+            for score, _, entry in top
+        ]
+
+
+MONTHS = {name: i for i, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
+)}
+
+# "June 2025 - Aug 2025", "Jan 2023 – Present" (as the resume parser writes durations)
+DURATION_PATTERN = re.compile(
+    r"([a-z]{3})[a-z]*\.?\s+((?:19|20)\d{2})\s*[-–—]\s*"
+    r"(?:([a-z]{3})[a-z]*\.?\s+((?:19|20)\d{2})|present|current)",
+    re.IGNORECASE
+)
+
+
+def _experience_years(data: Dict, today: date = None) -> int:
+    """
+    Years of experience from a saved profile
+
+    An explicit experience_years field wins. Otherwise the durations of
+    the parsed experience entries are added up in whole months, with
+    overlapping jobs counted once.
+    """
+    if data.get("experience_years") not in (None, ""):
+        try:
+            return int(data["experience_years"])
+        except (TypeError, ValueError):
+            pass
+
+    today = today or date.today()
+    spans = []
+    for entry in data.get("experience") or []:
+        match = DURATION_PATTERN.search(str(entry.get("duration", ""))) if isinstance(entry, dict) else None
+        if not match:
+            continue
+        start_month, start_year, end_month, end_year = match.groups()
+        if start_month.lower() not in MONTHS or (end_month and end_month.lower() not in MONTHS):
+            continue
+        start = int(start_year) * 12 + MONTHS[start_month.lower()]
+        end = (
+            int(end_year) * 12 + MONTHS[end_month.lower()] if end_month
+            else today.year * 12 + today.month - 1
+        )
+        if end >= start:
+            spans.append((start, end + 1))
+
+    months = 0
+    covered = None
+    for start, end in sorted(spans):
+        if covered is not None:
+            start = max(start, covered)
+        if end > start:
+            months += end - start
+        covered = end if covered is None else max(covered, end)
+    return months // 12
@@ -0,0 +1,200 @@
+from typing import List, Dict, Optional, Iterator, Callable
+from array import array
+import hashlib
+import json
+import sys
+import threading
+
+WORD_BITS = 64
+
+
+def iter_bits(bits: int) -> Iterator[int]:
+    """
+    Yield the positions of set bits, lowest first
+    
+    Catalog bitmaps span every job slot, and peeling bits off one big int
+    copies the whole int per bit. Big bitmaps are split into 64-bit words
+    once, skipping empty words, and bits are peeled off the small words.
+    """
+    if bits.bit_length() <= WORD_BITS:
+        words = [bits]
+    else:
+        words = array("Q", bits.to_bytes(-(-bits.bit_length() // WORD_BITS) * 8, "little"))
+        if sys.byteorder == "big":
+            words.byteswap()
+    for index, word in enumerate(words):
+        base = index * WORD_BITS
+        while word:
+            low = word & -word
+            yield base + low.bit_length() - 1
+            word ^= low
+
+
+class JobCatalog:
+    """
+    In-memory job catalog with a content-derived version
+
+    - Jobs live in append-only slots and are looked up by job_id in O(1)
+    - A skill inverted index maps each lowercase skill to a bitmap of
+      job slots (Python ints), so set algebra over jobs is bitwise
+    - `version` changes on every add/remove, so derived data (caches,
+      indexes, materialized results) can detect a stale catalog cheaply
+    - Incrementally maintained indexes subscribe to add/remove events
+      (and "alias" events, which most of them ignore)
+    - A live job_id always wins over an alias of the same name
+    """
+
+    def __init__(self, jobs: List[Dict] = None):
+        self._lock = threading.RLock()
+        self._slots: List[Optional[Dict]] = []
+        self._slot_of: Dict[str, int] = {}
+        self._skill_bits: Dict[str, int] = {}
+        self._live_bits = 0
+        self._jobs_view: Optional[List[Dict]] = None
+        self._listeners: List[Callable[[str, Dict, int], None]] = []
+        self._aliases: Dict[str, str] = {}
+
+        for job in jobs or []:
+            self._insert(job)
+
+        self._version = self._fingerprint(self.jobs)
+
+    @staticmethod
+    def _fingerprint(jobs: List[Dict]) -> str:
+        """Hash the catalog contents so equal catalogs share a version"""
+        payload = json.dumps(jobs, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+    def _bump_version(self, operation: str, job_id: str, content=None):
+        # Chained over the history, with a hash of what changed folded in:
+        # re-posting a job ID with different content gives a new version
+        digest = self._fingerprint([content]) if content is not None else ""
+        seed = f"{self._version}:{operation}:{job_id}:{digest}"
+        self._version = hashlib.sha1(seed.encode("utf-8")).hexdigest()[:16]
+
+    @property
+    def version(self) -> str:
+        return self._version
+
+    @property
+    def jobs(self) -> List[Dict]:
+        """Live jobs in slot order (do not mutate the dicts)"""
+        view = self._jobs_view
+        if view is None:
+            view = [job for job in self._slots if job is not None]
+            self._jobs_view = view
+        return view
+
+    @property
+    def all_bits(self) -> int:
+        """Bitmap of every live job slot"""
+        return self._live_bits
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    def resolve(self, job_id: str) -> str:
+        """Canonical job_id for a (possibly duplicate) job_id"""
+        if job_id in self._slot_of:
+            return job_id
+        return self._aliases.get(job_id, job_id)
+
+    def add_alias(self, alias: str, canonical_id: str):
+        """
+        Point a collapsed duplicate posting at its canonical job
+
+        A live job re-posted as a duplicate of another is removed first,
+        so its stale record doesn't shadow the alias.
+        """
+        with self._lock:
+            if alias == canonical_id or self._aliases.get(alias) == canonical_id:
+                return
+            self.remove_job(alias)
+            self._aliases[alias] = canonical_id
+            self._bump_version("alias", alias, canonical_id)
+            slot = self._slot_of.get(canonical_id)
+            self._notify("alias", self._slots[slot] if slot is not None else None, slot)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        slot = self.slot(job_id)
+        return self._slots[slot] if slot is not None else None
+
+    def slot(self, job_id: str) -> Optional[int]:
+        slot = self._slot_of.get(job_id)
+        if slot is None and job_id in self._aliases:
+            slot = self._slot_of.get(self._aliases[job_id])
+        return slot
+
+    def job_at(self, slot: int) -> Optional[Dict]:
+        return self._slots[slot]
+
+    def skill_bitmap(self, skill: str) -> int:
+        """Bitmap of job slots requiring a skill (case-insensitive)"""
+        return self._skill_bits.get(skill.strip().lower(), 0)
+
+    def skills(self) -> List[str]:
+        """Lowercase skills required by at least one job"""
+        return list(self._skill_bits)
+
+    def subscribe(self, listener: Callable[[str, Dict, int], None]):
+        """Call listener(event, job, slot) on every add/remove event"""
+        self._listeners.append(listener)
+
+    def _notify(self, event: str, job: Dict, slot: int):
+        for listener in self._listeners:
+            listener(event, job, slot)
+
+    def add_job(self, job: Dict) -> Dict:
+        """Add or replace a job posting"""
+        with self._lock:
+            job_id = job["job_id"]
+            # A new posting reusing a collapsed duplicate's ID is its own job
+            self._aliases.pop(job_id, None)
+            if job_id in self._slot_of:
+                old_slot = self._slot_of[job_id]
+                self._notify("remove", self._remove(job_id), old_slot)
+            slot = self._insert(job)
+            self._bump_version("add", job_id, job)
+            self._notify("add", job, slot)
+            return job
+
+    def remove_job(self, job_id: str) -> Optional[Dict]:
+        """Remove a job posting, returning it (or None if unknown)"""
+        with self._lock:
+            slot = self._slot_of.get(job_id)
+            job = self._remove(job_id)
+            if job is not None:
+                # Duplicates collapsed into the removed job go with it
+                for alias in [a for a, canonical in self._aliases.items() if canonical == job_id]:
+                    del self._aliases[alias]
+                self._bump_version("remove", job_id, job)
+                self._notify("remove", job, slot)
+            return job
+
+    def _insert(self, job: Dict) -> int:
+        slot = len(self._slots)
+        bit = 1 << slot
+        self._slots.append(job)
+        self._slot_of[job["job_id"]] = slot
+        self._live_bits |= bit
+        for skill in set(s.lower() for s in job.get("required_skills", [])):
+            self._skill_bits[skill] = self._skill_bits.get(skill, 0) | bit
+        self._jobs_view = None
+        return slot
+
+    def _remove(self, job_id: str) -> Optional[Dict]:
+        slot = self._slot_of.pop(job_id, None)
+        if slot is None:
+            return None
+        job = self._slots[slot]
+        mask = ~(1 << slot)
+        self._slots[slot] = None
+        self._live_bits &= mask
+        for skill in set(s.lower() for s in job.get("required_skills", [])):
+            remaining = self._skill_bits.get(skill, 0) & mask
+            if remaining:
+                self._skill_bits[skill] = remaining
+            else:
+                self._skill_bits.pop(skill, None)
+        self._jobs_view = None
+        return job
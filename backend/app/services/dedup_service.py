@@ -0,0 +1,136 @@
+from typing import List, Dict, Optional, Set, Tuple
+import random
+import re
+import time
+import zlib
+
+# Mersenne prime for the universal hash family (a * x + b) mod P
+_PRIME = (1 << 61) - 1
+
+
+def shingles(job: Dict, size: int = 3) -> Set[str]:
+    """Word n-grams of title + company + description (normalized)"""
+    text = " ".join([job.get("title", ""), job.get("company", ""), job.get("description", "")])
+    tokens = re.findall(r"[a-z0-9]+", text.lower())
+    if len(tokens) < size:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+class JobDeduplicator:
+    """
+    Ingest-time near-duplicate detection with MinHash + LSH banding
+
+    - Each posting is reduced to a MinHash signature of its shingles
+    - Signatures are split into bands; postings sharing any band bucket
+      become candidates, so lookups touch a few buckets, not the catalog
+    - Candidates are confirmed with exact Jaccard >= threshold
+    Duplicates are collapsed into the first-seen (canonical) job_id.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, bands: int = 16, seed: int = 42):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+
+        self._buckets: Dict[Tuple, List[str]] = {}
+        self._shingles: Dict[str, Set[str]] = {}
+        self.aliases: Dict[str, str] = {}
+
+        self.processed = 0
+        self.duplicates = 0
+        self.elapsed_seconds = 0.0
+
+    def signature(self, shingle_set: Set[str]) -> List[int]:
+        hashes = [zlib.crc32(s.encode("utf-8")) for s in shingle_set]
+        if not hashes:
+            return [_PRIME] * self.num_perm
+        return [min((a * h + b) % _PRIME for h in hashes) for a, b in self._perms]
+
+    def _band_keys(self, signature: List[int]) -> List[Tuple]:
+        return [
+            (band, tuple(signature[band * self.rows:(band + 1) * self.rows]))
+            for band in range(self.bands)
+        ]
+
+    def find_duplicate(self, job: Dict) -> Optional[str]:
+        """Canonical job_id of an indexed near-duplicate, if any"""
+        shingle_set = shingles(job)
+        return self._match(shingle_set, self._band_keys(self.signature(shingle_set)))
+
+    def _match(self, shingle_set: Set[str], band_keys: List[Tuple]) -> Optional[str]:
+        seen = set()
+        for key in band_keys:
+            for candidate in self._buckets.get(key, ()):
+                if candidate in seen or candidate not in self._shingles:
+                    continue
+                seen.add(candidate)
+                other = self._shingles[candidate]
+                union = len(shingle_set | other)
+                if union and len(shingle_set & other) / union >= self.threshold:
+                    return candidate
+        return None
+
+    def add(self, job: Dict) -> Optional[str]:
+        """
+        Index a posting; returns the canonical job_id if it is a duplicate
+        """
+        start = time.perf_counter()
+        self.processed += 1
+        job_id = job["job_id"]
+
+        shingle_set = shingles(job)
+        band_keys = self._band_keys(self.signature(shingle_set))
+        canonical = self._match(shingle_set, band_keys)
+
+        if canonical is not None and canonical != job_id:
+            self.aliases[job_id] = canonical
+            self.duplicates += 1
+        else:
+            canonical = None
+            self._shingles[job_id] = shingle_set
+            for key in band_keys:
+                self._buckets.setdefault(key, []).append(job_id)
+
+        self.elapsed_seconds += time.perf_counter() - start
+        return canonical
+
+    def forget(self, job_id: str):
+        """Stop matching against a removed posting (stale bucket entries are skipped)"""
+        self._shingles.pop(job_id, None)
+        for alias in [a for a, c in self.aliases.items() if c == job_id]:
+            del self.aliases[alias]
+
+    def stats(self) -> Dict:
+        """Catalog size reduction and dedup cost"""
+        return {
+            "processed": self.processed,
+            "unique": self.processed - self.duplicates,
+            "duplicates": self.duplicates,
+            "reduction_percentage": round(self.duplicates / self.processed * 100, 1) if self.processed else 0.0,
+            "dedup_time_ms": round(self.elapsed_seconds * 1000, 2),
+            "avg_time_per_job_ms": round(self.elapsed_seconds * 1000 / self.processed, 3) if self.processed else 0.0
+        }
+
+
+def dedupe_jobs(jobs: List[Dict], deduplicator: JobDeduplicator) -> Tuple[List[Dict], Dict[str, str]]:
+    """
+    Split incoming postings into unique jobs and an alias mapping
+
+    Returns (unique_jobs, {duplicate_job_id: canonical_job_id})
+    """
+    unique = []
+    aliases = {}
+    for job in jobs:
+        canonical = deduplicator.add(job)
+        if canonical is None:
+            unique.append(job)
+        else:
+            aliases[job["job_id"]] = canonical
+    return unique, aliases
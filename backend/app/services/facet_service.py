@@ -0,0 +1,188 @@
+from typing import List, Dict, Iterable, Optional, Tuple
+import bisect
+import threading
+
+from app.services.catalog_service import JobCatalog
+
+# (label, lower bound, upper bound) in INR per year; bounds are [lo, hi)
+SALARY_BANDS = [
+    ("0-6L", 0, 600000),
+    ("6-10L", 600000, 1000000),
+    ("10-15L", 1000000, 1500000),
+    ("15-20L", 1500000, 2000000),
+    ("20L+", 2000000, None),
+]
+
+
+def salary_bands(salary_range: List[int]) -> List[str]:
+    """Bands a salary range overlaps (same overlap rule as the salary filters)"""
+    if not salary_range or len(salary_range) != 2:
+        return []
+    low, high = salary_range
+    return [
+        label for label, band_low, band_high in SALARY_BANDS
+        if high >= band_low and (band_high is None or low < band_high)
+    ]
+
+
+def _popcount(bits: int) -> int:
+    return bin(bits).count("1")
+
+
+def _cumulative(by_value: Dict[int, int], from_top: bool) -> Tuple[List[int], List[int]]:
+    """Sorted values + OR of the bitmaps of all values <= each one (>= with from_top)"""
+    values = sorted(by_value)
+    order = reversed(values) if from_top else values
+    running, cumulative = 0, {}
+    for value in order:
+        running |= by_value[value]
+        cumulative[value] = running
+    return values, [cumulative[v] for v in values]
+
+
+class FacetIndex:
+    """
+    Per-facet-value bitmaps over catalog slots
+
+    location, job_type and salary_band each map value -> bitmap of job
+    slots. Counts for a result set are popcount(result_bits & value_bits),
+    so facets cost one AND per facet value regardless of catalog size.
+    The search filters (location or Remote, salary overlap) are bitmaps
+    too, so a filtered result set is built without touching job dicts.
+    Bitmaps follow catalog add/remove events.
+    """
+
+    FIELDS = ("location", "job_type", "salary_band")
+
+    def __init__(self, catalog: JobCatalog):
+        self.catalog = catalog
+        self._lock = threading.Lock()
+        self._bits: Dict[str, Dict[str, int]] = {field: {} for field in self.FIELDS}
+        # Filter bitmaps: lowercase location, and salary bounds value -> slots
+        self._location_bits: Dict[str, int] = {}
+        self._low_bits: Dict[int, int] = {}
+        self._high_bits: Dict[int, int] = {}
+        # Cumulative salary bitmaps, rebuilt lazily after catalog changes
+        self._salary_ranges = None
+
+        for job in catalog.jobs:
+            self._add(job, catalog.slot(job["job_id"]))
+        catalog.subscribe(self._on_catalog_change)
+
+    def _values(self, job: Dict) -> Dict[str, List[str]]:
+        return {
+            "location": [job["location"]] if job.get("location") else [],
+            "job_type": [job["job_type"]] if job.get("job_type") else [],
+            "salary_band": salary_bands(job.get("salary_range")),
+        }
+
+    def _filter_keys(self, job: Dict) -> List[Tuple[Dict, object]]:
+        # Same defaults as matching_service.filter_jobs; anything but a
+        # [min, max] pair is unknown, as in salary_bands
+        salary_range = job.get("salary_range")
+        low, high = salary_range if salary_range and len(salary_range) == 2 else (0, 0)
+        return [
+            (self._location_bits, job.get("location", "").lower()),
+            (self._low_bits, low),
+            (self._high_bits, high),
+        ]
+
+    def _add(self, job: Dict, slot: int):
+        bit = 1 << slot
+        for field, values in self._values(job).items():
+            for value in values:
+                self._bits[field][value] = self._bits[field].get(value, 0) | bit
+        for bitmaps, key in self._filter_keys(job):
+            bitmaps[key] = bitmaps.get(key, 0) | bit
+        self._salary_ranges = None
+
+    def _remove(self, job: Dict, slot: int):
+        mask = ~(1 << slot)
+        for field, values in self._values(job).items():
+            for value in values:
+                remaining = self._bits[field].get(value, 0) & mask
+                if remaining:
+                    self._bits[field][value] = remaining
+                else:
+                    self._bits[field].pop(value, None)
+        for bitmaps, key in self._filter_keys(job):
+            remaining = bitmaps.get(key, 0) & mask
+            if remaining:
+                bitmaps[key] = remaining
+            else:
+                bitmaps.pop(key, None)
+        self._salary_ranges = None
+
+    def _on_catalog_change(self, event: str, job: Dict, slot: int):
+        with self._lock:
+            if event == "add":
+                self._add(job, slot)
+            elif event == "remove":
+                self._remove(job, slot)
+
+    def bitmap(self, field: str, value: str) -> int:
+        return self._bits.get(field, {}).get(value, 0)
+
+    def filter_bits(
+        self,
+        location_preference: str = None,
+        min_salary: int = None,
+        max_salary: int = None
+    ) -> int:
+        """
+        Slots passing the search filters, as one bitmap
+
+        Mirrors matching_service.filter_jobs: location (case-insensitive)
+        or job_type Remote; salary ranges overlapping [min_salary,
+        max_salary]. Salary thresholds are a bisect into cumulative
+        bitmaps, so this costs a few big-int ANDs, not a pass over jobs.
+        """
+        with self._lock:
+            bits = self.catalog.all_bits
+            if location_preference:
+                bits &= (
+                    self._location_bits.get(location_preference.lower(), 0)
+                    | self._bits["job_type"].get("Remote", 0)
+                )
+            if min_salary is not None or max_salary is not None:
+                if self._salary_ranges is None:
+                    self._salary_ranges = (
+                        _cumulative(self._high_bits, from_top=True),
+                        _cumulative(self._low_bits, from_top=False),
+                    )
+                (highs, high_bits), (lows, low_bits) = self._salary_ranges
+                if min_salary is not None:
+                    i = bisect.bisect_left(highs, min_salary)
+                    bits &= high_bits[i] if i < len(highs) else 0
+                if max_salary is not None:
+                    i = bisect.bisect_right(lows, max_salary) - 1
+                    bits &= low_bits[i] if i >= 0 else 0
+            return bits
+
+    def result_bits(self, job_ids: Iterable[str]) -> int:
+        """Bitmap of the catalog slots of a result list"""
+        bits = 0
+        for job_id in job_ids:
+            slot = self.catalog.slot(job_id)
+            if slot is not None:
+                bits |= 1 << slot
+        return bits
+
+    def counts(self, candidate_bits: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+        """Jobs per facet value within candidate_bits (default: whole catalog)"""
+        if candidate_bits is None:
+            candidate_bits = self.catalog.all_bits
+        with self._lock:
+            facets = {}
+            for field, values in self._bits.items():
+                counts = {value: _popcount(bits & candidate_bits) for value, bits in values.items()}
+                facets[field] = dict(sorted(
+                    ((v, n) for v, n in counts.items() if n),
+                    key=lambda item: (-item[1], item[0])
+                ))
+            # Bands keep their natural order
+            order = [label for label, _, _ in SALARY_BANDS]
+            facets["salary_band"] = {
+                label: facets["salary_band"][label] for label in order if label in facets["salary_band"]
+            }
+            return facets
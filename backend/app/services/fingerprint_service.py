@@ -0,0 +1,277 @@
+from typing import List, Dict, Optional, Tuple
+from collections import Counter
+from pathlib import Path
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+
+SIMHASH_BITS = 64
+# 4 blocks of 16 bits: any fingerprint within Hamming distance 3 shares
+# at least one block exactly with the query (pigeonhole principle)
+_BLOCKS = 4
+_BLOCK_BITS = SIMHASH_BITS // _BLOCKS
+_BLOCK_MASK = (1 << _BLOCK_BITS) - 1
+
+
+def content_hash(file_bytes: bytes) -> str:
+    """Exact fingerprint of the uploaded bytes"""
+    return hashlib.sha256(file_bytes).hexdigest()
+
+
+def normalize_text(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens, so layout/whitespace changes don't matter"""
+    return re.findall(r"[a-z0-9@.+#]+", text.lower())
+
+
+def text_hash(text: str) -> str:
+    """Exact fingerprint of the normalized extracted text"""
+    return hashlib.sha256(" ".join(normalize_text(text)).encode("utf-8")).hexdigest()
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash over token frequencies of the normalized text"""
+    weights = [0] * SIMHASH_BITS
+    for token, count in Counter(normalize_text(text)).items():
+        h = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if h >> bit & 1 else -count
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class ResumeFingerprintIndex:
+    """
+    Upload fingerprints for duplicate / near-duplicate resume detection
+
+    - content hash: byte-identical re-upload -> reuse parse, skip storage
+    - text hash: different file, same normalized text -> reuse parse
+    - SimHash: near-duplicate text (Hamming distance <= max_distance)
+      -> parse normally, but link the upload to the earlier one
+
+    Records (file_id, sizes, hashes, parse_ref) are appended to a JSONL
+    file so the index survives restarts. The parsed resume - name, email,
+    phone - is not part of the append-only log: it is stored once per
+    upload under parse_dir/<parse_ref>.json, where forget() can delete it.
+    """
+
+    def __init__(self, index_path: Optional[Path] = None, max_distance: int = 3, parse_dir: Optional[Path] = None):
+        self.index_path = Path(index_path) if index_path else None
+        if parse_dir is None and self.index_path:
+            parse_dir = self.index_path.parent / "parses"
+        self.parse_dir = Path(parse_dir) if parse_dir else None
+        self.max_distance = max_distance
+        self._lock = threading.Lock()
+        self._records: Dict[str, Dict] = {}
+        # Parses kept in memory when there is no parse_dir
+        self._parses: Dict[str, Dict] = {}
+        self._by_content: Dict[str, str] = {}
+        self._by_text: Dict[str, str] = {}
+        self._blocks: List[Dict[int, List[str]]] = [{} for _ in range(_BLOCKS)]
+
+        self.exact_duplicates = 0
+        self.text_duplicates = 0
+        self.near_duplicates = 0
+        self.parses_saved = 0
+        self.bytes_saved = 0
+
+        if self.index_path and self.index_path.exists():
+            legacy = False
+            with open(self.index_path) as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        if "parsed" in record:
+                            # Older logs embedded the whole parse; move it out
+                            self._save_parse(record["file_id"], record.pop("parsed"))
+                            record["parse_ref"] = record["file_id"]
+                            legacy = True
+                        self._index(record)
+            if legacy:
+                self._rewrite()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _index(self, record: Dict):
+        file_id = record["file_id"]
+        self._records[file_id] = record
+        self._by_content.setdefault(record["content_hash"], file_id)
+        self._by_text.setdefault(record["text_hash"], file_id)
+        for block in range(_BLOCKS):
+            key = record["simhash"] >> (block * _BLOCK_BITS) & _BLOCK_MASK
+            self._blocks[block].setdefault(key, []).append(file_id)
+
+    def get(self, file_id: str) -> Optional[Dict]:
+        return self._records.get(file_id)
+
+    def _parse_path(self, parse_ref: str) -> Path:
+        return self.parse_dir / f"{parse_ref}.json"
+
+    def _save_parse(self, parse_ref: str, parsed: Dict):
+        if self.parse_dir is None:
+            self._parses[parse_ref] = parsed
+            return
+        self.parse_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=self.parse_dir, suffix=".tmp", delete=False) as f:
+            json.dump(parsed, f)
+        os.replace(f.name, self._parse_path(parse_ref))
+
+    def parsed(self, record: Optional[Dict]) -> Optional[Dict]:
+        """The stored parse a record refers to (None if missing)"""
+        parse_ref = record.get("parse_ref") if record else None
+        if parse_ref is None:
+            return None
+        if self.parse_dir is None:
+            return self._parses.get(parse_ref)
+        try:
+            with open(self._parse_path(parse_ref)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def find_exact(self, digest: str) -> Optional[Dict]:
+        file_id = self._by_content.get(digest)
+        return self._records[file_id] if file_id else None
+
+    def find_same_text(self, digest: str) -> Optional[Dict]:
+        file_id = self._by_text.get(digest)
+        return self._records[file_id] if file_id else None
+
+    def find_near(self, fingerprint: int) -> Optional[Tuple[Dict, int]]:
+        """Closest indexed upload within max_distance, as (record, distance)"""
+        best = None
+        seen = set()
+        for block in range(_BLOCKS):
+            key = fingerprint >> (block * _BLOCK_BITS) & _BLOCK_MASK
+            for file_id in self._blocks[block].get(key, ()):
+                if file_id in seen:
+                    continue
+                seen.add(file_id)
+                distance = hamming(fingerprint, self._records[file_id]["simhash"])
+                if distance <= self.max_distance and (best is None or distance < best[1]):
+                    best = (self._records[file_id], distance)
+        return best
+
+    def add(self, record: Dict, parsed: Optional[Dict] = None):
+        """
+        Index a new upload and append it to the on-disk log
+
+        The parse is stored separately and the record only keeps its
+        reference (parse_ref).
+        """
+        record = {k: v for k, v in record.items() if k != "parsed"}
+        if parsed is not None:
+            self._save_parse(record["file_id"], parsed)
+            record["parse_ref"] = record["file_id"]
+        with self._lock:
+            self._index(record)
+            if self.index_path:
+                self.index_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.index_path, "a") as f:
+                    f.write(json.dumps(record) + "\n")
+
+    def forget(self, file_ids) -> int:
+        """
+        Drop the records of uploads that no longer exist (e.g. expired by
+        UploadStore.gc) and rewrite the log without them
+        """
+        with self._lock:
+            forgotten = {file_id for file_id in file_ids if file_id in self._records}
+            if not forgotten:
+                return 0
+            parse_refs = [self._records[file_id].get("parse_ref") for file_id in forgotten]
+            records = [r for file_id, r in self._records.items() if file_id not in forgotten]
+            self._records = {}
+            self._by_content = {}
+            self._by_text = {}
+            self._blocks = [{} for _ in range(_BLOCKS)]
+            for record in records:
+                self._index(record)
+
+            for parse_ref in filter(None, parse_refs):
+                self._parses.pop(parse_ref, None)
+                if self.parse_dir is not None:
+                    try:
+                        self._parse_path(parse_ref).unlink()
+                    except FileNotFoundError:
+                        pass
+            self._rewrite()
+            return len(forgotten)
+
+    def _rewrite(self):
+        if not self.index_path:
+            return
+        tmp = self.index_path.with_suffix(".jsonl.tmp")
+        with open(tmp, "w") as f:
+            for record in self._records.values():
+                f.write(json.dumps(record) + "\n")
+        os.replace(tmp, self.index_path)
+
+    def record_saving(self, kind: str, size: int = 0, parse_reused: bool = False):
+        """Account for work skipped thanks to a duplicate match"""
+        with self._lock:
+            if kind == "exact":
+                self.exact_duplicates += 1
+            elif kind == "text":
+                self.text_duplicates += 1
+            elif kind == "near":
+                self.near_duplicates += 1
+            if parse_reused:
+                self.parses_saved += 1
+            self.bytes_saved += size
+
+    def stats(self) -> Dict:
+        return {
+            "indexed_uploads": len(self._records),
+            "exact_duplicates": self.exact_duplicates,
+            "same_text_duplicates": self.text_duplicates,
+            "near_duplicates": self.near_duplicates,
+            "parses_saved": self.parses_saved,
+            "bytes_saved": self.bytes_saved
+        }
+
+
+def index_uploads(store, index: ResumeFingerprintIndex, parser) -> int:
+    """Fingerprint UploadStore files not yet in the index"""
+    added = 0
+    for file_id in sorted(store.file_ids()):
+        record = store.get(file_id)
+        file_bytes = store.read(file_id)
+        # Deleted or collected since file_ids()
+        if index.get(file_id) or record is None or file_bytes is None:
+            continue
+        text = parser.extract_text(file_bytes, f"{file_id}{record['extension']}")
+        index.add({
+            "file_id": file_id,
+            "extension": record["extension"],
+            "size": len(file_bytes),
+            "content_hash": content_hash(file_bytes),
+            "text_hash": text_hash(text),
+            "simhash": simhash(text),
+            "duplicate_of": None
+        }, parsed=parser.parse_text(text))
+        added += 1
+    return added
+
+
+if __name__ == "__main__":
+    # Backfill: python -m app.services.fingerprint_service [uploads_dir]
+    import sys
+    from app.services.parser_service import ResumeParser
+    from app.services.upload_store import UploadStore
+
+    directory = Path(sys.argv[1] if len(sys.argv) > 1 else "uploads")
+    fingerprints = ResumeFingerprintIndex(directory / "fingerprints.jsonl")
+    count = index_uploads(UploadStore(directory), fingerprints, ResumeParser())
+    print(f"✅ Indexed {count} uploads ({len(fingerprints)} total)")
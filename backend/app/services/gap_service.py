@@ -1,25 +1,125 @@
-from typing import List, Dict
-import json
-from pathlib import Path
+from typing import List, Dict, Set, Tuple, FrozenSet, Iterable, Iterator, Optional
+from functools import lru_cache
+import heapq
+
+from app.services.catalog_service import JobCatalog, iter_bits
+from app.services.matching_service import SKILL_GRAPH, normalize_skill
+
+# Learning time estimates and dependencies (prerequisites are merged with
+# the `requires` edges of skills_taxonomy.json when the DAG is compiled)
+SKILL_METADATA = {
+    "Python": {"learning_months": 3, "difficulty": "medium", "prerequisites": []},
+    "FastAPI": {"learning_months": 2, "difficulty": "easy", "prerequisites": ["Python"]},
+    "React": {"learning_months": 3, "difficulty": "medium", "prerequisites": ["JavaScript"]},
+    "TypeScript": {"learning_months": 2, "difficulty": "medium", "prerequisites": ["JavaScript"]},
+    "Docker": {"learning_months": 2, "difficulty": "medium", "prerequisites": ["Linux"]},
+    "Kubernetes": {"learning_months": 4, "difficulty": "hard", "prerequisites": ["Docker"]},
+    "PostgreSQL": {"learning_months": 2, "difficulty": "medium", "prerequisites": []},
+    "MongoDB": {"learning_months": 2, "difficulty": "easy", "prerequisites": []},
+    "AWS": {"learning_months": 4, "difficulty": "hard", "prerequisites": ["Linux"]},
+    "Redis": {"learning_months": 1, "difficulty": "easy", "prerequisites": []},
+    "GraphQL": {"learning_months": 2, "difficulty": "medium", "prerequisites": ["REST APIs"]},
+    "JavaScript": {"learning_months": 3, "difficulty": "medium", "prerequisites": []},
+    "Linux": {"learning_months": 2, "difficulty": "medium", "prerequisites": []},
+}
+
+DEFAULT_LEARNING_MONTHS = 2
+DEFAULT_DIFFICULTY = "medium"
+DIFFICULTY_ORDER = {"easy": 1, "medium": 2, "hard": 3}
+MAX_SKILLS_PER_PHASE = 3
+
+RESOURCE_MAP = {
+    "python": [
+        {"name": "freeCodeCamp Python Course", "type": "video", "url": "https://www.youtube.com/freecodecamp"},
+        {"name": "Automate the Boring Stuff", "type": "book", "url": "https://automatetheboringstuff.com/"}
+    ],
+    "react": [
+        {"name": "React Official Docs", "type": "docs", "url": "https://react.dev"},
+        {"name": "freeCodeCamp React Course", "type": "video", "url": "https://www.youtube.com/freecodecamp"}
+    ],
+    "docker": [
+        {"name": "Docker Getting Started", "type": "docs", "url": "https://docs.docker.com/get-started/"},
+        {"name": "Docker Mastery Course", "type": "course", "url": "https://www.udemy.com/"}
+    ],
+    # Add more as needed
+}
+
 
 def load_skill_metadata():
     """Load skill learning time estimates and dependencies"""
-    # This would ideally come from skills_taxonomy.json
-    return {
-        "Python": {"learning_months": 3, "difficulty": "medium", "prerequisites": []},
-        "FastAPI": {"learning_months": 2, "difficulty": "easy", "prerequisites": ["Python"]},
-        "React": {"learning_months": 3, "difficulty": "medium", "prerequisites": ["JavaScript"]},
-        "TypeScript": {"learning_months": 2, "difficulty": "medium", "prerequisites": ["JavaScript"]},
-        "Docker": {"learning_months": 2, "difficulty": "medium", "prerequisites": ["Linux"]},
-        "Kubernetes": {"learning_months": 4, "difficulty": "hard", "prerequisites": ["Docker"]},
-        "PostgreSQL": {"learning_months": 2, "difficulty": "medium", "prerequisites": []},
-        "MongoDB": {"learning_months": 2, "difficulty": "easy", "prerequisites": []},
-        "AWS": {"learning_months": 4, "difficulty": "hard", "prerequisites": ["Linux"]},
-        "Redis": {"learning_months": 1, "difficulty": "easy", "prerequisites": []},
-        "GraphQL": {"learning_months": 2, "difficulty": "medium", "prerequisites": ["REST APIs"]},
-        "JavaScript": {"learning_months": 3, "difficulty": "medium", "prerequisites": []},
-        "Linux": {"learning_months": 2, "difficulty": "medium", "prerequisites": []},
-    }
+    return SKILL_METADATA
+
+
+class SkillDAG:
+    """
+    Prerequisite graph compiled once at startup
+
+    - Nodes are lowercase skill names; edges come from SKILL_METADATA
+      prerequisites plus taxonomy `requires`
+    - A topological order and the transitive prerequisites of every skill
+      are precomputed, so roadmaps never walk the graph
+    """
+
+    def __init__(self, metadata: Dict[str, Dict], requires: Dict[str, List[str]], names: Dict[str, str]):
+        self.names: Dict[str, str] = dict(names)
+        self.months: Dict[str, int] = {}
+        self.difficulty: Dict[str, str] = {}
+        self.prerequisites: Dict[str, Set[str]] = {}
+
+        for name, meta in metadata.items():
+            key = name.lower()
+            self.names[key] = name
+            self.months[key] = meta.get("learning_months", DEFAULT_LEARNING_MONTHS)
+            self.difficulty[key] = meta.get("difficulty", DEFAULT_DIFFICULTY)
+            for prerequisite in meta.get("prerequisites", []):
+                self.names.setdefault(prerequisite.lower(), prerequisite)
+                self.prerequisites.setdefault(key, set()).add(prerequisite.lower())
+            self.prerequisites.setdefault(key, set())
+        for skill, required in requires.items():
+            self.prerequisites.setdefault(skill, set()).update(required)
+        for required in list(self.prerequisites.values()):
+            for skill in required:
+                self.prerequisites.setdefault(skill, set())
+
+        self.order = self._topological_order()
+        self.position = {skill: i for i, skill in enumerate(self.order)}
+        self.ancestors: Dict[str, FrozenSet[str]] = {}
+        for skill in self.order:
+            closure = set(self.prerequisites[skill])
+            for prerequisite in self.prerequisites[skill]:
+                closure |= self.ancestors[prerequisite]
+            self.ancestors[skill] = frozenset(closure)
+
+    def _topological_order(self) -> List[str]:
+        remaining = {skill: len(prereqs) for skill, prereqs in self.prerequisites.items()}
+        dependents: Dict[str, List[str]] = {}
+        for skill, prereqs in self.prerequisites.items():
+            for prerequisite in prereqs:
+                dependents.setdefault(prerequisite, []).append(skill)
+
+        ready = sorted(skill for skill, count in remaining.items() if count == 0)
+        order = []
+        while ready:
+            skill = ready.pop()
+            order.append(skill)
+            for dependent in dependents.get(skill, []):
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        if len(order) != len(remaining):
+            cycle = sorted(skill for skill, count in remaining.items() if count)
+            raise ValueError(f"Prerequisite cycle between: {', '.join(cycle)}")
+        return order
+
+    def learning_months(self, skill: str) -> int:
+        return self.months.get(skill.lower(), DEFAULT_LEARNING_MONTHS)
+
+    def display(self, skill: str) -> str:
+        return self.names.get(skill, skill)
+
+
+SKILL_DAG = SkillDAG(SKILL_METADATA, SKILL_GRAPH.requires, SKILL_GRAPH.names)
+
 
 def analyze_skill_gap(current_skills: List[str], target_skills: List[str]) -> Dict:
     """
@@ -35,11 +135,7 @@ def analyze_skill_gap(current_skills: List[str], target_skills: List[str]) -> Di
     readiness_score = 100 - gap_percentage
     
     # Estimate learning time based on skill metadata
-    skill_metadata = load_skill_metadata()
-    total_learning_months = sum(
-        skill_metadata.get(skill, {}).get("learning_months", 2) 
-        for skill in missing
-    )
+    total_learning_months = sum(SKILL_DAG.learning_months(skill) for skill in missing)
     
     return {
         "matching_skills": [s for s in target_skills if s.lower() in matching],
@@ -61,128 +157,485 @@ def _calculate_confidence(readiness: float) -> str:
     else:
         return "Very Low - Major upskilling needed"
 
+@lru_cache(maxsize=1024)
+def _schedule(
+    missing: FrozenSet[str],
+    current: FrozenSet[str],
+    demand: Tuple[Tuple[str, int], ...] = ()
+) -> Tuple[Tuple, ...]:
+    """
+    Layered schedule of missing skills as ((skills, layer, unmet), ...)
+
+    A skill's layer is one more than the deepest missing skill among its
+    transitive prerequisites, so everything it depends on is learned in
+    an earlier phase. Layers are split into phases of at most
+    MAX_SKILLS_PER_PHASE, easy skills first, then the ones more jobs ask
+    for (`demand`: (skill, job count) pairs), then short ones. `unmet`
+    lists direct prerequisites that are neither current nor part of the
+    plan.
+    """
+    job_counts = dict(demand)
+    layer: Dict[str, int] = {}
+    # Topological order guarantees prerequisites get their layer first
+    for skill in sorted(missing, key=lambda s: (SKILL_DAG.position.get(s, -1), s)):
+        planned_prereqs = SKILL_DAG.ancestors.get(skill, frozenset()) & missing
+        layer[skill] = 1 + max((layer[p] for p in planned_prereqs), default=-1)
+
+    phases = []
+    for depth in sorted(set(layer.values())):
+        skills = sorted(
+            (s for s in layer if layer[s] == depth),
+            key=lambda s: (
+                DIFFICULTY_ORDER.get(SKILL_DAG.difficulty.get(s, DEFAULT_DIFFICULTY), 2),
+                -job_counts.get(s, 0),
+                SKILL_DAG.learning_months(s),
+                s
+            )
+        )
+        for i in range(0, len(skills), MAX_SKILLS_PER_PHASE):
+            chunk = tuple(skills[i:i + MAX_SKILLS_PER_PHASE])
+            unmet = tuple(sorted(set(
+                p for s in chunk for p in SKILL_DAG.prerequisites.get(s, ())
+                if p not in current and p not in missing
+            )))
+            phases.append((chunk, depth, unmet))
+    return tuple(phases)
+
 def generate_learning_roadmap(
     missing_skills: List[str],
-    current_skills: List[str]
+    current_skills: List[str],
+    demand: Optional[Dict[str, int]] = None
 ) -> List[Dict]:
     """
     Generate a phased learning roadmap with smart ordering
-    """
-    skill_metadata = load_skill_metadata()
-    current_set = set(s.lower() for s in current_skills)
     
-    # Categorize missing skills by difficulty and prerequisites
-    ready_to_learn = []
-    requires_prereq = []
+    Every missing skill is scheduled: skills whose prerequisites are all
+    known (or outside the plan) come first, then each later phase builds
+    on skills from the earlier ones. `demand` (lowercase skill -> job
+    count, e.g. from MarketStats.counts_for) puts in-demand skills first
+    among equally difficult ones. Schedules are memoized per
+    (missing set, current set, demand of the missing skills).
+    """
+    names = {s.lower(): s for s in missing_skills}
+    current_set = frozenset(s.lower() for s in current_skills)
+    demand_key = tuple(sorted(
+        (skill, count) for skill, count in (demand or {}).items() if skill in names and count
+    ))
+    schedule = _schedule(frozenset(names), current_set, demand_key)
     
-    for skill in missing_skills:
-        metadata = skill_metadata.get(skill, {})
-        prerequisites = metadata.get("prerequisites", [])
-        
-        # Check if all prerequisites are met
-        prereq_met = all(p.lower() in current_set for p in prerequisites)
-        
-        if prereq_met:
-            ready_to_learn.append({
-                "skill": skill,
-                "difficulty": metadata.get("difficulty", "medium"),
-                "months": metadata.get("learning_months", 2),
-                "prerequisites": prerequisites
-            })
-        else:
-            requires_prereq.append({
-                "skill": skill,
-                "difficulty": metadata.get("difficulty", "medium"),
-                "months": metadata.get("learning_months", 2),
-                "prerequisites": prerequisites
-            })
-    
-    # Sort by difficulty (easy first) and learning time
-    difficulty_order = {"easy": 1, "medium": 2, "hard": 3}
-    ready_to_learn.sort(key=lambda x: (difficulty_order.get(x["difficulty"], 2), x["months"]))
-    
-    # Build phased roadmap
     roadmap = []
-    phase = 1
-    cumulative_months = 0
-    
-    # Phase 1: Skills ready to learn immediately (prioritize easy ones)
-    if ready_to_learn:
-        phase_skills = ready_to_learn[:3]  # Max 3 skills per phase
-        phase_duration = max(s["months"] for s in phase_skills)
-        cumulative_months += phase_duration
-        
-        roadmap.append({
-            "phase": phase,
-            "duration_months": phase_duration,
-            "focus": "Foundation & Quick Wins",
-            "skills_to_learn": [s["skill"] for s in phase_skills],
-            "priority": "High",
-            "reasoning": "These skills have no prerequisites and will give you immediate progress. Start with these to build momentum.",
-            "resources": _get_learning_resources([s["skill"] for s in phase_skills])
-        })
-        phase += 1
-    
-    # Phase 2: Remaining ready skills
-    if len(ready_to_learn) > 3:
-        phase_skills = ready_to_learn[3:6]
-        phase_duration = max(s["months"] for s in phase_skills)
-        cumulative_months += phase_duration
-        
-        roadmap.append({
-            "phase": phase,
-            "duration_months": phase_duration,
-            "focus": "Core Technical Skills",
-            "skills_to_learn": [s["skill"] for s in phase_skills],
-            "priority": "High",
-            "reasoning": "Essential skills for the target role. Build on Phase 1 knowledge.",
-            "resources": _get_learning_resources([s["skill"] for s in phase_skills])
-        })
-        phase += 1
-    
-    # Phase 3: Skills requiring prerequisites
-    if requires_prereq:
-        phase_skills = requires_prereq[:3]
-        phase_duration = max(s["months"] for s in phase_skills)
-        cumulative_months += phase_duration
+    for phase, (skills, depth, unmet) in enumerate(schedule, start=1):
+        display = [names[s] for s in skills]
+        if depth == 0:
+            first = phase == 1
+            focus = "Foundation & Quick Wins" if first else "Core Technical Skills"
+            priority = "High"
+            reasoning = (
+                "These skills have no prerequisites and will give you immediate progress. Start with these to build momentum."
+                if first else "Essential skills for the target role. Build on Phase 1 knowledge."
+            )
+        else:
+            prereq_list = ", ".join(sorted(set(
+                names[p] for s in skills for p in SKILL_DAG.ancestors.get(s, ()) if p in names
+            )))
+            focus = "Advanced Specialization"
+            priority = "Medium"
+            reasoning = f"These require prerequisites ({prereq_list}). Tackle after completing earlier phases."
         
-        prereq_list = ", ".join(set(
-            p for s in phase_skills for p in s["prerequisites"]
-        ))
+        if unmet:
+            reasoning += f" Brush up on {', '.join(SKILL_DAG.display(p) for p in unmet)} first if needed."
         
         roadmap.append({
             "phase": phase,
-            "duration_months": phase_duration,
-            "focus": "Advanced Specialization",
-            "skills_to_learn": [s["skill"] for s in phase_skills],
-            "priority": "Medium",
-            "reasoning": f"These require prerequisites ({prereq_list}). Tackle after completing earlier phases.",
-            "resources": _get_learning_resources([s["skill"] for s in phase_skills])
+            "duration_months": max(SKILL_DAG.learning_months(s) for s in skills),
+            "focus": focus,
+            "skills_to_learn": display,
+            "priority": priority,
+            "reasoning": reasoning,
+            "resources": _get_learning_resources(display)
         })
     
     return roadmap
 
 def _get_learning_resources(skills: List[str]) -> List[Dict]:
     """Recommend learning resources for skills"""
-    resource_map = {
-        "Python": [
-            {"name": "freeCodeCamp Python Course", "type": "video", "url": "https://www.youtube.com/freecodecamp"},
-            {"name": "Automate the Boring Stuff", "type": "book", "url": "https://automatetheboringstuff.com/"}
-        ],
-        "React": [
-            {"name": "React Official Docs", "type": "docs", "url": "https://react.dev"},
-            {"name": "freeCodeCamp React Course", "type": "video", "url": "https://www.youtube.com/freecodecamp"}
-        ],
-        "Docker": [
-            {"name": "Docker Getting Started", "type": "docs", "url": "https://docs.docker.com/get-started/"},
-            {"name": "Docker Mastery Course", "type": "course", "url": "https://www.udemy.com/"}
+    resources = []
+    for skill in skills[:2]:  # Top 2 skills only
+        if skill.lower() in RESOURCE_MAP:
+            resources.extend(RESOURCE_MAP[skill.lower()][:1])  # One resource per skill
+    
+    return resources
+
+def analyze_catalog_gap(
+    current_skills: List[str],
+    catalog: JobCatalog,
+    limit: int = 10,
+    skills_limit: int = 10
+) -> Dict:
+    """
+    Gap analysis of one candidate against every job in the catalog
+    
+    Works on the catalog's skill -> job bitmaps:
+    - missing skills are the catalog skills the candidate lacks; summing
+      their learning_months over their job bitmaps gives every job's
+      weighted gap in one sparse pass
+    - a bit-sliced counter over the same bitmaps (ones / twos-or-more)
+      yields the jobs missing exactly one skill, so the jobs a skill would
+      unlock are popcount(skill_bits & exactly_one)
+    """
+    current_set = set(s.strip().lower() for s in current_skills if s and s.strip())
+    missing = [skill for skill in catalog.skills() if skill not in current_set]
+    
+    gap_months: Dict[int, int] = {}
+    missing_count: Dict[int, int] = {}
+    ones = twos = 0
+    for skill in missing:
+        bits = catalog.skill_bitmap(skill)
+        twos |= ones & bits
+        ones |= bits
+        months = SKILL_DAG.learning_months(skill)
+        for slot in iter_bits(bits):
+            gap_months[slot] = gap_months.get(slot, 0) + months
+            missing_count[slot] = missing_count.get(slot, 0) + 1
+    exactly_one = ones & ~twos
+    
+    # Jobs with at least one required skill, closest (smallest weighted gap) first
+    slots = [
+        catalog.slot(job["job_id"]) for job in catalog.jobs if job.get("required_skills")
+    ]
+    closest = sorted(slots, key=lambda slot: (gap_months.get(slot, 0), missing_count.get(slot, 0), slot))
+    
+    closest_jobs = []
+    for slot in closest[:limit]:
+        job = catalog.job_at(slot)
+        required = job.get("required_skills", [])
+        job_missing = [s for s in required if s.lower() not in current_set]
+        total = len(set(s.lower() for s in required))
+        closest_jobs.append({
+            "job_id": job["job_id"],
+            "title": job.get("title", ""),
+            "company": job.get("company", ""),
+            "missing_skills": job_missing,
+            "gap_months": gap_months.get(slot, 0),
+            "readiness_score": round((total - missing_count.get(slot, 0)) / total * 100, 1)
+        })
+    
+    ranked_skills = sorted(
+        (
+            (_popcount(catalog.skill_bitmap(skill) & exactly_one), _popcount(catalog.skill_bitmap(skill)), skill)
+            for skill in missing
+        ),
+        key=lambda x: (-x[0], -x[1], SKILL_DAG.learning_months(x[2]), x[2])
+    )
+    skills_to_learn = [
+        {
+            "skill": _display_skill(catalog, skill),
+            "jobs_unlocked": unlocked,
+            "jobs_requiring": requiring,
+            "learning_months": SKILL_DAG.learning_months(skill)
+        }
+        for unlocked, requiring, skill in ranked_skills[:skills_limit]
+    ]
+    
+    return {
+        "jobs_considered": len(slots),
+        "jobs_ready": sum(1 for slot in slots if not missing_count.get(slot)),
+        "closest_jobs": closest_jobs,
+        "skills_to_learn": skills_to_learn
+    }
+
+def _popcount(bits: int) -> int:
+    return bin(bits).count("1")
+
+def _display_skill(catalog: JobCatalog, skill: str) -> str:
+    """Skill as spelled by the first job requiring it"""
+    for slot in iter_bits(catalog.skill_bitmap(skill)):
+        for name in catalog.job_at(slot).get("required_skills", []):
+            if name.lower() == skill:
+                return name
+    return SKILL_DAG.display(skill)
+
+# Jobs missing more skills than this don't seed a greedy step of their
+# own; they are unlocked once smaller bundles have covered their skills
+MAX_BUNDLE_SKILLS = 8
+
+def _job_value(job: Dict, objective: str) -> float:
+    if objective == "salary":
+        salary_range = job.get("salary_range") or [0, 0]
+        return (salary_range[0] + salary_range[-1]) / 2
+    return 1
+
+def optimize_learning_path(
+    current_skills: List[str],
+    catalog: JobCatalog,
+    budget_months: int,
+    objective: str = "count",
+    demand: Optional[Dict[str, int]] = None
+) -> Dict:
+    """
+    Pick the skills to learn within a time budget that unlock the most jobs
+    
+    A job is unlocked once every required skill is known. Budgeted greedy
+    over "bundles": each step adds the remaining missing skills of some
+    group of jobs (plus their unmet prerequisites from the DAG), choosing
+    the bundle with the best value per month. A bundle's value counts
+    every job whose missing skills it covers, prerequisites included.
+    
+    Missing-skill sets come from one pass over the catalog's skill -> job
+    bitmaps. Each bundle's closure is built once as a skill bitmask, and
+    jobs are pooled by the mask of skills they still miss, updated only
+    where a step learned something; a bundle's value is the sum of the
+    pools inside it. Bundles sit in a lazy-greedy heap: only the bundles
+    a step made cheaper are rescored at once, other stale entries when
+    they reach the top. A bundle that doesn't fit the remaining budget
+    never will (its cost can only drop by months already spent), so it
+    is pruned for good.
+    
+    objective: "count" (jobs) or "salary" (sum of salary midpoints)
+    demand: lowercase skill -> job count for ordering the roadmap (see
+    generate_learning_roadmap)
+    """
+    current_set = set(s.strip().lower() for s in current_skills if s and s.strip())
+    
+    def closure(skills) -> Set[str]:
+        needed = set(skills)
+        for skill in skills:
+            needed |= SKILL_DAG.ancestors.get(skill, frozenset())
+        return needed - current_set
+    
+    def cost(skills) -> int:
+        return sum(SKILL_DAG.learning_months(s) for s in skills)
+    
+    # Missing skills per job, via the bitmaps of skills the candidate lacks
+    job_missing: Dict[int, Set[str]] = {}
+    for skill in catalog.skills():
+        if skill in current_set:
+            continue
+        for slot in iter_bits(catalog.skill_bitmap(skill)):
+            job_missing.setdefault(slot, set()).add(skill)
+    
+    slots = [catalog.slot(job["job_id"]) for job in catalog.jobs if job.get("required_skills")]
+    jobs_ready = sum(1 for slot in slots if slot not in job_missing)
+    
+    # Uncovered jobs grouped by remaining missing skills: key -> [value, slots]
+    groups: Dict[FrozenSet[str], List] = {}
+    for slot, missing in job_missing.items():
+        group = groups.setdefault(frozenset(missing), [0, []])
+        group[0] += _job_value(catalog.job_at(slot), objective)
+        group[1].append(slot)
+    
+    # Each group's closure (its missing skills plus unmet prerequisites),
+    # computed and costed once. Groups that can never fit are dropped; big
+    # ones still count toward a bundle's value but don't seed bundles
+    seeds: Dict[FrozenSet[str], FrozenSet[str]] = {}
+    for key in list(groups):
+        needed = frozenset(closure(key))
+        if cost(needed) > budget_months:
+            del groups[key]
+        elif len(key) <= MAX_BUNDLE_SKILLS:
+            seeds[key] = needed
+    
+    # Skills become bits; uncovered jobs are pooled by the mask of skills
+    # they still miss: rest mask -> [value, slots]
+    skills = sorted(set().union(*groups, *seeds.values()))
+    skill_bit = {skill: 1 << i for i, skill in enumerate(skills)}
+    months = [SKILL_DAG.learning_months(skill) for skill in skills]
+    
+    def mask_of(skill_set) -> int:
+        mask = 0
+        for skill in skill_set:
+            mask |= skill_bit[skill]
+        return mask
+    
+    def mask_cost(mask: int) -> int:
+        return sum(months[i] for i in iter_bits(mask))
+    
+    pending: Dict[int, List] = {mask_of(key): group for key, group in groups.items()}
+    
+    def gain_of(bundle: int) -> float:
+        # Jobs whose rest fits inside the bundle: look up each submask of a
+        # small bundle, scan the pool for a big one
+        if 1 << _popcount(bundle) > len(pending):
+            return sum(group[0] for rest, group in pending.items() if not rest & ~bundle)
+        gain = 0
+        sub = bundle
+        while sub:
+            group = pending.get(sub)
+            if group:
+                gain += group[0]
+            sub = (sub - 1) & bundle
+        return gain
+    
+    # Candidate bundles, one per distinct closure; a step only masks out
+    # what's been learned
+    bundles = sorted(set(map(mask_of, seeds.values())))
+    touching: Dict[int, List[int]] = {}
+    for candidate, mask in enumerate(bundles):
+        for i in iter_bits(mask):
+            touching.setdefault(i, []).append(candidate)
+    
+    chosen: List[str] = []
+    learned = 0
+    budget_left = budget_months
+    unlocked_slots: List[int] = []
+    value_unlocked = 0
+    step = 0
+    scored = [0] * len(bundles)
+    
+    def entry(candidate: int) -> Optional[Tuple]:
+        scored[candidate] = step
+        bundle = bundles[candidate] & ~learned
+        bundle_cost = mask_cost(bundle)
+        # Pruned for good: its cost can only drop by months already spent
+        if not bundle or bundle_cost > budget_left:
+            return None
+        gain = gain_of(bundle)
+        names = tuple(sorted(skills[i] for i in iter_bits(bundle)))
+        # Best value per month, then most value, then cheapest, then alphabetical
+        return (-gain / max(bundle_cost, 1), -gain, bundle_cost, names, step, candidate)
+    
+    # Lazy greedy over a heap of scored bundles. Bundles sharing a skill
+    # with the one just taken got cheaper and are rescored right away; any
+    # other stale top is rescored when popped, and a fresh top is taken
+    heap = [item for item in map(entry, range(len(bundles))) if item]
+    heapq.heapify(heap)
+    while heap:
+        top = heapq.heappop(heap)
+        if top[4] < scored[top[5]]:
+            continue
+        if top[4] != step:
+            item = entry(top[5])
+            if item:
+                heapq.heappush(heap, item)
+            continue
+        
+        bundle = bundles[top[5]] & ~learned
+        # Prerequisites first, then alphabetical
+        for skill in sorted(top[3], key=lambda s: (SKILL_DAG.position.get(s, len(SKILL_DAG.order)), s)):
+            chosen.append(skill)
+        learned |= bundle
+        budget_left -= top[2]
+        step += 1
+        
+        # Re-pool the jobs missing a learned skill; nothing left means unlocked
+        for rest in [rest for rest in pending if rest & bundle]:
+            value, members = pending.pop(rest)
+            rest &= ~bundle
+            if not rest:
+                value_unlocked += value
+                unlocked_slots.extend(members)
+                continue
+            group = pending.setdefault(rest, [0, []])
+            group[0] += value
+            group[1].extend(members)
+        
+        for candidate in set(c for i in iter_bits(bundle) for c in touching[i]):
+            item = entry(candidate)
+            if item:
+                heapq.heappush(heap, item)
+    
+    skill_names = [_display_skill(catalog, s) if catalog.skill_bitmap(s) else SKILL_DAG.display(s) for s in chosen]
+    
+    return {
+        "objective": objective,
+        "budget_months": budget_months,
+        "months_used": budget_months - budget_left,
+        "jobs_ready_before": jobs_ready,
+        "jobs_unlocked": len(unlocked_slots),
+        "value_unlocked": value_unlocked,
+        "skills_to_learn": [
+            {"skill": name, "learning_months": SKILL_DAG.learning_months(skill)}
+            for skill, name in zip(chosen, skill_names)
         ],
-        # Add more as needed
+        "unlocked_jobs": [catalog.job_at(slot)["job_id"] for slot in sorted(unlocked_slots)],
+        "learning_roadmap": generate_learning_roadmap(skill_names, current_skills, demand)
     }
+
+def analyze_cohort(
+    profiles: Iterable[Dict],
+    target_skills: List[str],
+    demand: Optional[Dict[str, int]] = None
+) -> Iterator[Dict]:
+    """
+    Gap analysis of many profiles against one target role, streamed
     
-    resources = []
-    for skill in skills[:2]:  # Top 2 skills only
-        if skill in resource_map:
-            resources.extend(resource_map[skill][:1])  # One resource per skill
+    demand (lowercase skill -> job count) orders the shared roadmaps, as
+    in generate_learning_roadmap.
+    
+    Each profile is {"profile_id": ..., "skills": [...], "name": ...}.
+    Yields, in order:
+    - {"type": "group", ...} the first time a distinct missing-skill set
+      appears, with its analysis and one shared learning roadmap
+    - {"type": "profile", ...} per profile: readiness and its gap group
+    - {"type": "summary", ...} at the end: cohort size, average readiness
+      and the missing-skill histogram
+    
+    Profiles are folded into one profile bitmap per target skill (bit i
+    set when profile i has it), so the histogram and average readiness are
+    popcounts over those bitmaps; per-profile gaps are missing-skill masks
+    over the target list, and profiles sharing a mask share a group.
+    """
+    targets = []
+    seen = set()
+    for skill in target_skills:
+        key = normalize_skill(skill)
+        if key and key not in seen:
+            seen.add(key)
+            targets.append((key, skill.strip()))
+    target_bit = {key: 1 << i for i, (key, _) in enumerate(targets)}
+    full_mask = (1 << len(targets)) - 1
+    
+    have_bits = [0] * len(targets)
+    groups: Dict[int, int] = {}
+    count = 0
     
-    return resources
\ No newline at end of file
+    for profile in profiles:
+        have_mask = 0
+        for skill in profile.get("skills", []):
+            have_mask |= target_bit.get(normalize_skill(skill), 0)
+        for i, _ in enumerate(targets):
+            if have_mask >> i & 1:
+                have_bits[i] |= 1 << count
+        count += 1
+        
+        missing_mask = full_mask & ~have_mask
+        missing = [name for i, (_, name) in enumerate(targets) if missing_mask >> i & 1]
+        
+        group_id = groups.get(missing_mask)
+        if group_id is None:
+            group_id = groups[missing_mask] = len(groups) + 1
+            # Roadmaps depend only on the gap set, so the group shares one
+            known = [name for _, name in targets if name not in missing]
+            analysis = analyze_skill_gap(known, [name for _, name in targets])
+            yield {
+                "type": "group",
+                "gap_group": group_id,
+                "missing_skills": missing,
+                "readiness_score": analysis["readiness_score"],
+                "estimated_learning_time_months": analysis["estimated_learning_time_months"],
+                "confidence_level": analysis["confidence_level"],
+                "learning_roadmap": generate_learning_roadmap(missing, known, demand)
+            }
+        
+        readiness = (len(targets) - len(missing)) / len(targets) * 100 if targets else 100
+        yield {
+            "type": "profile",
+            "profile_id": profile.get("profile_id"),
+            "name": profile.get("name", ""),
+            "readiness_score": round(readiness, 1),
+            "missing_skills": missing,
+            "gap_group": group_id
+        }
+    
+    matched = [_popcount(bits) for bits in have_bits]
+    yield {
+        "type": "summary",
+        "profiles": count,
+        "target_skills": [name for _, name in targets],
+        "gap_groups": len(groups),
+        "average_readiness": round(sum(matched) / (count * len(targets)) * 100, 1) if count and targets else 0.0,
+        "missing_skill_histogram": dict(sorted(
+            ((name, count - matched[i]) for i, (_, name) in enumerate(targets)),
+            key=lambda item: -item[1]
+        ))
+    }
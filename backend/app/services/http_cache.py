@@ -0,0 +1,38 @@
+from typing import Optional, Dict
+import hashlib
+
+from fastapi import Response
+
+# Caches (browsers, CDN) may store responses but must revalidate every
+# time; revalidation is a 304 unless the catalog or the query changed
+CACHE_CONTROL = "public, no-cache"
+
+
+def make_etag(catalog_version: str, *query) -> str:
+    """Strong ETag for a catalog version + normalized query"""
+    digest = hashlib.blake2b(repr((catalog_version,) + query).encode("utf-8"), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check: '*' or any listed tag (W/ prefix ignored, per RFC 9110)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def cache_headers(etag: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """ETag + Cache-Control, merged into any other response headers"""
+    return {**(headers or {}), "ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=cache_headers(etag))
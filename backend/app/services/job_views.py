@@ -0,0 +1,43 @@
+from typing import List, Dict, Optional, Tuple
+
+# Default list-view columns for search results
+COMPACT_FIELDS = ("job_id", "title", "company", "location", "salary_range", "match_score")
+
+# Fields a projection may ask for: catalog record fields + computed scores
+JOB_FIELDS = {
+    "job_id", "title", "company", "location", "salary_range", "required_skills",
+    "experience_required", "job_type", "posted_date", "description",
+    "match_score", "text_score", "search_score",
+}
+
+
+def parse_fields(fields: Optional[str], extra: Tuple[str, ...] = ()) -> Optional[Tuple[str, ...]]:
+    """
+    Columns to return for a `fields=` query param
+
+    - None / "" -> compact list view (plus `extra`, e.g. blended scores)
+    - "all" -> full records (returns None)
+    - "a,b,c" -> exactly those columns; unknown names raise ValueError
+    """
+    if fields is None or not fields.strip():
+        return COMPACT_FIELDS + tuple(f for f in extra if f not in COMPACT_FIELDS)
+    if fields.strip().lower() == "all":
+        return None
+
+    requested = []
+    for field in fields.split(","):
+        field = field.strip()
+        if field and field not in requested:
+            requested.append(field)
+
+    unknown = [f for f in requested if f not in JOB_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)} (allowed: {', '.join(sorted(JOB_FIELDS))})")
+    return tuple(requested)
+
+
+def project_jobs(jobs: List[Dict], fields: Optional[Tuple[str, ...]]) -> List[Dict]:
+    """Keep only the requested columns (fields=None keeps everything), as a new list"""
+    if fields is None:
+        return list(jobs)
+    return [{f: job[f] for f in fields if f in job} for job in jobs]
@@ -0,0 +1,30 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json, to_jsonable_python
+
+try:
+    import orjson
+except ImportError:  # optional; pydantic-core's serializer is the fallback
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """Compact UTF-8 JSON bytes via orjson when installed, else pydantic-core"""
+    if orjson is not None:
+        # default= covers what orjson can't encode natively (pydantic models, sets, ...)
+        return orjson.dumps(content, default=to_jsonable_python, option=orjson.OPT_NON_STR_KEYS)
+    return to_json(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by orjson / pydantic-core instead of json.dumps
+
+    Used as the app's default response class. Returning one directly from
+    an endpoint also skips FastAPI's jsonable_encoder pass over the
+    content, which dominates serialization time for large result lists.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
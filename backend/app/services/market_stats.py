@@ -0,0 +1,142 @@
+from typing import List, Dict, Optional
+import bisect
+import threading
+
+from app.services.catalog_service import JobCatalog
+
+
+def _salary_midpoint(job: Dict) -> Optional[float]:
+    salary_range = job.get("salary_range")
+    if not salary_range or len(salary_range) != 2:
+        return None
+    return (salary_range[0] + salary_range[1]) / 2
+
+
+def _percentile(values: List[float], fraction: float) -> Optional[float]:
+    """Linear-interpolated percentile of a sorted list"""
+    if not values:
+        return None
+    position = (len(values) - 1) * fraction
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+class MarketStats:
+    """
+    Skill demand statistics maintained incrementally from catalog events
+
+    - postings per skill
+    - salary midpoints per skill, kept sorted so percentiles are lookups
+    - skill x skill co-occurrence counts (sparse, dict of dicts)
+    Adding or removing a job touches only that job's skills.
+    """
+
+    def __init__(self, catalog: JobCatalog):
+        self.catalog = catalog
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+        self._display: Dict[str, str] = {}
+        self._salaries: Dict[str, List[float]] = {}
+        self._salary_totals: Dict[str, float] = {}
+        self._cooccurrence: Dict[str, Dict[str, int]] = {}
+        self._jobs = 0
+
+        for job in catalog.jobs:
+            self._apply(job, 1)
+        catalog.subscribe(self._on_catalog_change)
+
+    def _on_catalog_change(self, event: str, job: Dict, slot: int):
+        if event not in ("add", "remove"):
+            return
+        with self._lock:
+            self._apply(job, 1 if event == "add" else -1)
+
+    def _apply(self, job: Dict, delta: int):
+        skills = {s.strip().lower(): s.strip() for s in job.get("required_skills", []) if s and s.strip()}
+        salary = _salary_midpoint(job)
+        self._jobs += delta
+
+        for skill, display in skills.items():
+            count = self._counts.get(skill, 0) + delta
+            if count > 0:
+                self._counts[skill] = count
+                self._display.setdefault(skill, display)
+            else:
+                self._counts.pop(skill, None)
+                self._display.pop(skill, None)
+
+            if salary is not None:
+                salaries = self._salaries.setdefault(skill, [])
+                if delta > 0:
+                    bisect.insort(salaries, salary)
+                else:
+                    i = bisect.bisect_left(salaries, salary)
+                    if i < len(salaries) and salaries[i] == salary:
+                        del salaries[i]
+                total = self._salary_totals.get(skill, 0.0) + delta * salary
+                if salaries:
+                    self._salary_totals[skill] = total
+                else:
+                    del self._salaries[skill]
+                    self._salary_totals.pop(skill, None)
+
+            row = self._cooccurrence.setdefault(skill, {})
+            for other in skills:
+                if other == skill:
+                    continue
+                together = row.get(other, 0) + delta
+                if together > 0:
+                    row[other] = together
+                else:
+                    row.pop(other, None)
+            if not row:
+                del self._cooccurrence[skill]
+
+    def count(self, skill: str) -> int:
+        """Number of live jobs requiring a skill"""
+        return self._counts.get(skill.strip().lower(), 0)
+
+    def counts_for(self, skills: List[str]) -> Dict[str, int]:
+        """Posting counts for the given skills (lowercase keys, zeros omitted)"""
+        with self._lock:
+            return {
+                s.strip().lower(): self._counts[s.strip().lower()]
+                for s in skills if s.strip().lower() in self._counts
+            }
+
+    def skill_stats(self, skill: str, related_limit: int = 5) -> Optional[Dict]:
+        key = skill.strip().lower()
+        with self._lock:
+            if key not in self._counts:
+                return None
+            salaries = self._salaries.get(key, [])
+            related = sorted(self._cooccurrence.get(key, {}).items(), key=lambda item: (-item[1], item[0]))
+            return {
+                "skill": self._display[key],
+                "job_count": self._counts[key],
+                "share_of_jobs": round(self._counts[key] / self._jobs * 100, 1) if self._jobs else 0.0,
+                "salary_p25": _percentile(salaries, 0.25),
+                "salary_median": _percentile(salaries, 0.5),
+                "salary_p75": _percentile(salaries, 0.75),
+                "salary_weighted_demand": self._salary_totals.get(key, 0.0),
+                "often_required_with": [
+                    {"skill": self._display[other], "jobs": together}
+                    for other, together in related[:related_limit]
+                ]
+            }
+
+    def top_skills(self, limit: int = 20, sort: str = "count") -> List[Dict]:
+        """
+        Most demanded skills
+
+        sort: "count" (postings) or "salary" (sum of salary midpoints of
+        the postings, i.e. salary-weighted demand)
+        """
+        with self._lock:
+            if sort == "salary":
+                key = lambda s: (-self._salary_totals.get(s, 0.0), -self._counts[s], s)
+            else:
+                key = lambda s: (-self._counts[s], s)
+            skills = sorted(self._counts, key=key)[:limit]
+        return [self.skill_stats(skill) for skill in skills]
@@ -0,0 +1,180 @@
+from typing import List, Dict, Optional
+from collections import OrderedDict
+import bisect
+import threading
+import uuid
+
+from app.services.catalog_service import JobCatalog, iter_bits
+from app.services.matching_service import filter_jobs, normalize_skill, canonical_skills
+
+
+class MatchSession:
+    """
+    Cached per-job match components for one candidate being edited
+
+    Mirrors calculate_match_score term by term:
+    - skill match (60%) and critical skills (15%) are cached per job
+    - skill depth (20%) and experience (5%) are shared by every job
+
+    Adding or removing a skill only touches the jobs in that skill's
+    bitmap; the ranking is a sorted list keyed by the per-job terms, so
+    each affected job costs one bisect remove + insert.
+    """
+
+    def __init__(
+        self,
+        catalog: JobCatalog,
+        skills: List[str],
+        experience_years: int = 0,
+        location_preference: str = None,
+        min_salary: int = None,
+        max_salary: int = None
+    ):
+        self.catalog = catalog
+        self.skills = set(canonical_skills(skills))
+        self.experience_years = experience_years
+        self.filters = (location_preference, min_salary, max_salary)
+        self.lock = threading.Lock()
+        self._rebuild()
+
+    def _rebuild(self):
+        """Score every eligible job from scratch (new session or new catalog)"""
+        catalog = self.catalog
+        self.version = catalog.version
+
+        eligible = filter_jobs(catalog.jobs, *self.filters)
+        self.eligible_bits = 0
+        self.skill_terms: Dict[int, float] = {}
+        self.critical_terms: Dict[int, float] = {}
+        self.matched: Dict[int, int] = {}
+        self.critical_matched: Dict[int, int] = {}
+        self.job_sets: Dict[int, tuple] = {}
+        self.order: List[tuple] = []
+
+        for job in eligible:
+            slot = catalog.slot(job["job_id"])
+            job_skills = job.get("required_skills", [])
+            job_set = set(s.lower() for s in job_skills)
+            critical_set = set(s.lower() for s in job_skills[:3])
+
+            self.eligible_bits |= 1 << slot
+            self.job_sets[slot] = (job_set, critical_set)
+            self.matched[slot] = len(self.skills & job_set)
+            self.critical_matched[slot] = len(self.skills & critical_set)
+            self._compute_terms(slot)
+            self.order.append(self._order_key(slot))
+
+        self.order.sort()
+
+    def _compute_terms(self, slot: int):
+        job_set, critical_set = self.job_sets[slot]
+        if not job_set:
+            self.skill_terms[slot] = self.critical_terms[slot] = 0.0
+            return
+        self.skill_terms[slot] = (self.matched[slot] / len(job_set)) * 60
+        self.critical_terms[slot] = (
+            (self.critical_matched[slot] / len(critical_set)) * 15 if critical_set else 0
+        )
+
+    def _order_key(self, slot: int) -> tuple:
+        if not self.job_sets[slot][0]:
+            # Jobs without requirements always score 0 - keep them last
+            return (float("inf"), slot)
+        return (-(self.skill_terms[slot] + self.critical_terms[slot]), slot)
+
+    def _score(self, slot: int) -> float:
+        if not self.job_sets[slot][0]:
+            return 0.0
+        skill_depth = min(len(self.skills), 10) / 10 * 20
+        experience_bonus = min(self.experience_years * 2.5, 5)
+        total = self.skill_terms[slot] + skill_depth + self.critical_terms[slot] + experience_bonus
+        return round(min(total, 100), 1)
+
+    def apply_delta(self, add: List[str] = None, remove: List[str] = None) -> int:
+        """
+        Add/remove skills, re-scoring only the affected jobs
+
+        Returns the number of job updates performed. Blank skills are
+        ignored, as in canonical_skills.
+        """
+        add = [s for s in add or [] if s and s.strip()]
+        remove = [s for s in remove or [] if s and s.strip()]
+        if self.version != self.catalog.version:
+            for skill in add:
+                self.skills.add(normalize_skill(skill))
+            for skill in remove:
+                self.skills.discard(normalize_skill(skill))
+            self._rebuild()
+            return len(self.order)
+
+        updates = 0
+        for skill, delta in [(s, 1) for s in add] + [(s, -1) for s in remove]:
+            skill = normalize_skill(skill)
+            if (delta > 0) == (skill in self.skills):
+                continue
+            if delta > 0:
+                self.skills.add(skill)
+            else:
+                self.skills.discard(skill)
+
+            for slot in iter_bits(self.catalog.skill_bitmap(skill) & self.eligible_bits):
+                position = bisect.bisect_left(self.order, self._order_key(slot))
+                del self.order[position]
+
+                self.matched[slot] += delta
+                if skill in self.job_sets[slot][1]:
+                    self.critical_matched[slot] += delta
+                self._compute_terms(slot)
+
+                bisect.insort(self.order, self._order_key(slot))
+                updates += 1
+
+        return updates
+
+    def top(self, limit: int = 20) -> List[Dict]:
+        """Top jobs by match_score (same order as rank_jobs)"""
+        if limit <= 0:
+            return []
+        if self.version != self.catalog.version:
+            self._rebuild()
+
+        ranked = []
+        for _, slot in self.order:
+            score = self._score(slot)
+            # Rounding and the 100 cap can tie neighbours; keep the whole run
+            if len(ranked) >= limit and score < ranked[-1][0]:
+                break
+            ranked.append((score, slot))
+
+        ranked.sort(key=lambda x: (-x[0], x[1]))
+        return [
+            dict(self.catalog.job_at(slot), match_score=score)
+            for score, slot in ranked[:limit]
+        ]
+
+
+class MatchSessionStore:
+    """Bounded LRU registry of live match sessions"""
+
+    def __init__(self, max_sessions: int = 1000):
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, MatchSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, session: MatchSession) -> str:
+        session_id = uuid.uuid4().hex
+        with self._lock:
+            self._sessions[session_id] = session
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session_id
+
+    def get(self, session_id: str) -> Optional[MatchSession]:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def __len__(self) -> int:
+        return len(self._sessions)
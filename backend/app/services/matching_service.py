@@ -1,12 +1,29 @@
-from typing import List, Dict
+from typing import List, Dict, Iterable, Iterator, Optional
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+import heapq
 import json
+import os
 from pathlib import Path
+from app.services.parser_service import ALL_SKILL_VARIANTS
+from app.services.taxonomy_service import SkillGraph
+
+TAXONOMY_PATH = Path(__file__).parent.parent / "data" / "skills_taxonomy.json"
+
+# Taxonomy category -> tier used by categorize_skills
+CATEGORY_TIERS = {
+    "programming_languages": "core",
+    "web_frameworks": "core",
+    "databases": "core",
+    "data_science_ml": "core",
+    "cloud_devops": "infrastructure",
+    "tools_platforms": "tools",
+}
 
 def load_skills_taxonomy():
     """Load skill categories for weighted matching"""
-    taxonomy_path = Path(__file__).parent.parent / "data" / "skills_taxonomy.json"
     try:
-        with open(taxonomy_path) as f:
+        with open(TAXONOMY_PATH) as f:
             return json.load(f)
     except FileNotFoundError:
         # Fallback taxonomy
@@ -17,6 +34,18 @@ def load_skills_taxonomy():
             "foundational": ["HTML/CSS", "JavaScript", "REST APIs"]
         }
 
+# Related/implied skill credit, compiled once at startup
+SKILL_GRAPH = SkillGraph(load_skills_taxonomy())
+
+def normalize_skill(skill: str) -> str:
+    """Map a skill string to its lowercase canonical name (aliases resolved)"""
+    key = skill.strip().lower()
+    return ALL_SKILL_VARIANTS.get(key, key)
+
+def canonical_skills(skills: List[str]) -> List[str]:
+    """Deduplicated, alias-resolved, sorted skill list"""
+    return sorted(set(normalize_skill(s) for s in skills if s and s.strip()))
+
 def categorize_skills(skills: List[str], taxonomy: Dict) -> Dict[str, List[str]]:
     """Categorize skills into tiers"""
     categorized = {
@@ -26,22 +55,32 @@ def categorize_skills(skills: List[str], taxonomy: Dict) -> Dict[str, List[str]]
         "foundational": []
     }
     
+    if "categories" in taxonomy:
+        tier_of = {}
+        for category in taxonomy["categories"]:
+            tier = CATEGORY_TIERS.get(category.get("id"), "foundational")
+            for skill in category.get("skills", []):
+                for name in [skill["name"]] + skill.get("aliases", []):
+                    tier_of[name.lower()] = tier
+    else:
+        # Flat fallback format: {"core_technical": [...], "infrastructure": [...], ...}
+        tier_of = {}
+        for key, tier in (("core_technical", "core"), ("infrastructure", "infrastructure"),
+                          ("tools", "tools"), ("foundational", "foundational")):
+            for name in taxonomy.get(key, []):
+                tier_of.setdefault(name.lower(), tier)
+    
     for skill in skills:
-        if skill in taxonomy.get("core_technical", []):
-            categorized["core"].append(skill)
-        elif skill in taxonomy.get("infrastructure", []):
-            categorized["infrastructure"].append(skill)
-        elif skill in taxonomy.get("tools", []):
-            categorized["tools"].append(skill)
-        else:
-            categorized["foundational"].append(skill)
+        categorized[tier_of.get(skill.strip().lower(), "foundational")].append(skill)
     
     return categorized
 
 def calculate_match_score(
     candidate_skills: List[str], 
     job_skills: List[str],
-    experience_years: int = 0
+    experience_years: int = 0,
+    related_credit: bool = False,
+    credits: Optional[Dict[str, float]] = None
 ) -> float:
     """
     Calculate match score with weighted algorithm
@@ -51,6 +90,12 @@ def calculate_match_score(
     - Skill depth: 20% (having more relevant skills)
     - Critical skills: 15% (first 3 job requirements)
     - Experience bonus: 5%
+    
+    With related_credit, a missing job skill that is related to or implied
+    by a candidate skill in the taxonomy counts as a partial match
+    (e.g. FastAPI -> Python 0.8, Python -> Django 0.5). Callers scoring
+    many jobs pass credits (SKILL_GRAPH.expand of the candidate skills)
+    so the expansion runs once per query.
     """
     if not job_skills:
         return 0.0
@@ -60,7 +105,15 @@ def calculate_match_score(
     
     # 1. Exact skill matches (60%)
     matching_skills = candidate_set & job_set
-    skill_match_score = (len(matching_skills) / len(job_set)) * 60
+    matched = len(matching_skills)
+    
+    if not related_credit:
+        credits = {}
+    elif credits is None:
+        credits = SKILL_GRAPH.expand(candidate_set)
+    if credits:
+        matched += sum(credits.get(SKILL_GRAPH.canonical(s), 0.0) for s in job_set - candidate_set)
+    skill_match_score = (matched / len(job_set)) * 60
     
     # 2. Skill depth bonus (20%) - reward having more skills
     # Cap at 10 skills to avoid over-rewarding
@@ -69,7 +122,12 @@ def calculate_match_score(
     # 3. Critical skills bonus (15%) - first 3 job requirements are most important
     critical_job_skills = set(s.lower() for s in job_skills[:3])
     critical_matches = candidate_set & critical_job_skills
-    critical_bonus = (len(critical_matches) / len(critical_job_skills)) * 15 if critical_job_skills else 0
+    critical_matched = len(critical_matches)
+    if credits:
+        critical_matched += sum(
+            credits.get(SKILL_GRAPH.canonical(s), 0.0) for s in critical_job_skills - candidate_set
+        )
+    critical_bonus = (critical_matched / len(critical_job_skills)) * 15 if critical_job_skills else 0
     
     # 4. Experience bonus (5%)
     # 0 years = 0%, 1 year = 2.5%, 2+ years = 5%
@@ -79,26 +137,15 @@ def calculate_match_score(
     
     return round(min(total_score, 100), 1)  # Cap at 100
 
-def rank_jobs(
-    candidate_skills: List[str], 
+def filter_jobs(
     jobs: List[Dict],
-    experience_years: int = 0,
     location_preference: str = None,
     min_salary: int = None,
     max_salary: int = None
 ) -> List[Dict]:
     """
-    Rank jobs by match score and apply filters
+    Apply search filters (location or Remote, salary overlap)
     """
-    # Calculate match scores
-    for job in jobs:
-        job['match_score'] = calculate_match_score(
-            candidate_skills,
-            job.get('required_skills', []),
-            experience_years
-        )
-    
-    # Apply filters
     filtered_jobs = jobs
     
     if location_preference:
@@ -114,11 +161,164 @@ def rank_jobs(
         filtered_jobs = [j for j in filtered_jobs 
                         if j.get('salary_range', [0, 0])[0] <= max_salary]
     
+    return filtered_jobs
+
+def rank_jobs(
+    candidate_skills: List[str], 
+    jobs: List[Dict],
+    experience_years: int = 0,
+    location_preference: str = None,
+    min_salary: int = None,
+    max_salary: int = None,
+    related_credit: bool = False
+) -> List[Dict]:
+    """
+    Rank jobs by match score and apply filters
+    """
+    # Calculate match scores
+    credits = SKILL_GRAPH.expand(set(s.lower() for s in candidate_skills)) if related_credit else None
+    for job in jobs:
+        job['match_score'] = calculate_match_score(
+            candidate_skills,
+            job.get('required_skills', []),
+            experience_years,
+            related_credit,
+            credits
+        )
+    
+    # Apply filters
+    filtered_jobs = filter_jobs(jobs, location_preference, min_salary, max_salary)
+    
     # Sort by match score (descending)
     ranked_jobs = sorted(filtered_jobs, key=lambda x: x.get('match_score', 0), reverse=True)
     
     return ranked_jobs
 
+class JobScoreMatrix:
+    """
+    Catalog compiled for scoring many candidates at once
+
+    Stores the skill x job incidence as inverted lists, so one candidate
+    row of the candidate x job score matrix costs O(postings of its skills)
+    plus one pass over the jobs. Scores are identical to calculate_match_score.
+    """
+
+    def __init__(self, jobs: List[Dict]):
+        self.jobs = [
+            {"job_id": j.get("job_id"), "title": j.get("title", ""), "company": j.get("company", "")}
+            for j in jobs
+        ]
+        self.job_sizes = []
+        self.critical_sizes = []
+        self.skill_jobs: Dict[str, List[int]] = {}
+        self.critical_jobs: Dict[str, List[int]] = {}
+
+        for idx, job in enumerate(jobs):
+            job_skills = job.get("required_skills", [])
+            job_set = set(s.lower() for s in job_skills)
+            critical_set = set(s.lower() for s in job_skills[:3])
+            self.job_sizes.append(len(job_set))
+            self.critical_sizes.append(len(critical_set))
+            for skill in job_set:
+                self.skill_jobs.setdefault(skill, []).append(idx)
+            for skill in critical_set:
+                self.critical_jobs.setdefault(skill, []).append(idx)
+
+    def score_row(self, candidate_skills: List[str], experience_years: int = 0) -> List[float]:
+        """Match scores of one candidate against every job (catalog order)"""
+        n = len(self.jobs)
+        matched = [0] * n
+        critical = [0] * n
+
+        for skill in set(s.lower() for s in candidate_skills):
+            for idx in self.skill_jobs.get(skill, ()):
+                matched[idx] += 1
+            for idx in self.critical_jobs.get(skill, ()):
+                critical[idx] += 1
+
+        skill_depth = min(len(candidate_skills), 10) / 10 * 20
+        experience_bonus = min(experience_years * 2.5, 5)
+
+        scores = []
+        for idx in range(n):
+            job_size = self.job_sizes[idx]
+            if not job_size:
+                scores.append(0.0)
+                continue
+            critical_size = self.critical_sizes[idx]
+            critical_bonus = (critical[idx] / critical_size) * 15 if critical_size else 0
+            total = (matched[idx] / job_size) * 60 + skill_depth + critical_bonus + experience_bonus
+            scores.append(round(min(total, 100), 1))
+        return scores
+
+    def top_matches(self, candidate: Dict, top_k: int) -> Dict:
+        scores = self.score_row(candidate.get("skills", []), candidate.get("experience", 0))
+        # nlargest is stable, so ties keep catalog order like rank_jobs
+        best = heapq.nlargest(top_k, range(len(scores)), key=scores.__getitem__)
+        return {
+            "id": candidate.get("id"),
+            "matches": [dict(self.jobs[idx], match_score=scores[idx]) for idx in best],
+        }
+
+
+# Per-process matrix for pool workers (set by _init_batch_worker)
+_WORKER_MATRIX = None
+
+def _init_batch_worker(jobs: List[Dict]):
+    global _WORKER_MATRIX
+    _WORKER_MATRIX = JobScoreMatrix(jobs)
+
+def _score_batch_chunk(chunk: List[Dict], top_k: int) -> List[Dict]:
+    return [_WORKER_MATRIX.top_matches(candidate, top_k) for candidate in chunk]
+
+def rank_jobs_batch(
+    candidates: Iterable[Dict],
+    jobs: List[Dict],
+    top_k: int = 10,
+    processes: int = None,
+    chunk_size: int = 256
+) -> Iterator[Dict]:
+    """
+    Top-K jobs for many candidates, yielded one candidate at a time
+    
+    Each candidate is {"id": ..., "skills": [...], "experience": int}.
+    Candidates are scored in chunks; with processes > 1 the chunks are
+    fanned out over a process pool. Only a bounded window of chunks is in
+    flight, so memory stays flat however many candidates are streamed.
+    """
+    if processes is None:
+        processes = min(4, os.cpu_count() or 1)
+
+    def chunks():
+        chunk = []
+        for candidate in candidates:
+            chunk.append(candidate)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    if processes <= 1:
+        matrix = JobScoreMatrix(jobs)
+        for chunk in chunks():
+            for candidate in chunk:
+                yield matrix.top_matches(candidate, top_k)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        initializer=_init_batch_worker,
+        initargs=(jobs,)
+    ) as pool:
+        pending = deque()
+        for chunk in chunks():
+            pending.append(pool.submit(_score_batch_chunk, chunk, top_k))
+            if len(pending) >= processes * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
 def get_matching_insights(candidate_skills: List[str], job: Dict) -> Dict:
     """
     Get detailed insights about why a job matches
@@ -130,9 +330,16 @@ def get_matching_insights(candidate_skills: List[str], job: Dict) -> Dict:
     missing = list(job_skills - candidate_set)
     extra = list(candidate_set - job_skills)
     
+    credits = SKILL_GRAPH.expand(candidate_set)
+    
     return {
         "matching_skills": [s for s in job.get('required_skills', []) if s.lower() in matching],
         "missing_skills": [s for s in job.get('required_skills', []) if s.lower() in missing],
+        "related_skills": {
+            s: round(credits[SKILL_GRAPH.canonical(s)], 2)
+            for s in job.get('required_skills', [])
+            if s.lower() in missing and SKILL_GRAPH.canonical(s) in credits
+        },
         "additional_skills": [s for s in candidate_skills if s.lower() in extra][:5],  # Top 5
         "match_percentage": round(len(matching) / len(job_skills) * 100, 1) if job_skills else 0
     }
\ No newline at end of file
@@ -126,17 +126,37 @@ class ResumeParser:
             Dict with parsed resume data matching API schema
         """
         try:
-            # Detect file type and extract text
-            if filename.lower().endswith('.docx'):
-                print(f"📄 Parsing DOCX file: {filename}")
-                text = self._extract_text_from_docx(file_bytes)
-            elif filename.lower().endswith('.pdf'):
-                print(f"📄 Parsing PDF file: {filename}")
-                text = self._extract_text_from_pdf(file_bytes)
-            else:
-                print(f"⚠️ Warning: Unknown file type: {filename}")
-                return self._empty_result()
-            
+            text = self.extract_text(file_bytes, filename)
+        except Exception as e:
+            print(f"❌ Error parsing file: {e}")
+            import traceback
+            traceback.print_exc()
+            return self._empty_result()
+        
+        return self.parse_text(text)
+    
+    def extract_text(self, file_bytes: bytes, filename: str = "") -> str:
+        """
+        Extract raw text from a PDF or DOCX file
+        
+        Returns empty string for unsupported file types
+        """
+        # Detect file type and extract text
+        if filename.lower().endswith('.docx'):
+            print(f"📄 Parsing DOCX file: {filename}")
+            return self._extract_text_from_docx(file_bytes)
+        elif filename.lower().endswith('.pdf'):
+            print(f"📄 Parsing PDF file: {filename}")
+            return self._extract_text_from_pdf(file_bytes)
+        
+        print(f"⚠️ Warning: Unknown file type: {filename}")
+        return ""
+    
+    def parse_text(self, text: str) -> Dict:
+        """
+        Extract structured resume fields from already-extracted text
+        """
+        try:
             if not text.strip():
                 print("⚠️ Warning: Extracted empty text from file")
                 return self._empty_result()
@@ -418,13 +438,13 @@ class ResumeParser:
         # Find all matches
         titles = re.findall(title_pattern, text, re.IGNORECASE)
         companies = re.findall(company_pattern, text, re.IGNORECASE)
-        dates = re.findall(date_pattern, text, re.IGNORECASE)
+        dates = [" ".join(m.group(0).split()) for m in re.finditer(date_pattern, text, re.IGNORECASE)]
         
         # Match title with company and dates
         for i in range(min(len(titles), len(companies))):
             duration_str = "Not specified"
             if i < len(dates):
-                duration_str = f"{dates[i][0]} {dates[i][1]} - {dates[i][3] if dates[i][3] else 'Present'} {dates[i][4] if dates[i][4] else ''}"
+                duration_str = dates[i]
             
             exp_entry = {
                 "title": titles[i].strip(),
@@ -0,0 +1,178 @@
+from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+import threading
+import time
+
+from app.services.profile_store import ProfileStore
+
+
+class ProfileCache:
+    """
+    LRU of decoded profiles in front of a ProfileStore, with write-behind
+
+    - get: cache hit, else read through to the store (no JSON re-parse on hits)
+    - save: updates the cache at once and queues the write; a background
+      thread flushes queued writes every `flush_interval` seconds in one
+      fsync'd transaction. Repeated saves of a profile before a flush are
+      coalesced into a single write.
+    - save(durable=True) returns only after the profile (and anything
+      queued before it) is committed.
+    Cached dicts are shared; treat them as read-only.
+    """
+
+    def __init__(self, store: ProfileStore, max_entries: int = 1024, flush_interval: float = 0.5):
+        self.store = store
+        self.max_entries = max_entries
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        # profile_id -> (latest data, time first queued since last flush)
+        self._pending: Dict[str, Tuple[Dict, float]] = {}
+        # Batch currently being written (still newer than the store)
+        self._inflight: Dict[str, Tuple[Dict, float]] = {}
+        self._closed = False
+        self._stop = threading.Event()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._saves = 0
+        self._flushes = 0
+        self._flushed_writes = 0
+        self._flush_errors = 0
+        self._last_flush_lag = 0.0
+        self._max_flush_lag = 0.0
+
+        self._flusher = threading.Thread(target=self._flush_loop, name="profile-cache-flush", daemon=True)
+        self._flusher.start()
+
+    def _remember(self, profile_id: str, data: Dict):
+        self._entries[profile_id] = data
+        self._entries.move_to_end(profile_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _cached(self, profile_id: str) -> Optional[Dict]:
+        if profile_id in self._entries:
+            return self._entries[profile_id]
+        # Evicted before its queued write landed
+        entry = self._pending.get(profile_id) or self._inflight.get(profile_id)
+        return entry[0] if entry else None
+
+    def get(self, profile_id: str) -> Optional[Dict]:
+        with self._lock:
+            data = self._cached(profile_id)
+            if data is not None:
+                self._hits += 1
+                self._remember(profile_id, data)
+                return data
+            self._misses += 1
+
+        data = self.store.get(profile_id)
+        if data is None:
+            return None
+
+        with self._lock:
+            # A save that raced with this read wins over the stored copy
+            current = self._cached(profile_id)
+            if current is not None:
+                return current
+            self._remember(profile_id, data)
+            return data
+
+    def save(self, profile_id: str, data: Dict, durable: bool = False):
+        """Cache a profile and queue (or, with durable=True, complete) its write"""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ProfileCache is closed")
+            self._saves += 1
+            self._remember(profile_id, data)
+            queued_at = self._pending[profile_id][1] if profile_id in self._pending else time.time()
+            self._pending[profile_id] = (data, queued_at)
+            self._wakeup.notify()
+
+        if durable:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write every queued profile in one durable transaction
+
+        Returns the number of profiles written. On failure the batch is
+        re-queued (unless newer saves superseded it) and the error raised.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                self._inflight = batch
+            if not batch:
+                return 0
+
+            try:
+                self.store.save_many(((pid, data) for pid, (data, _) in batch.items()), durable=True)
+            except Exception:
+                with self._lock:
+                    self._flush_errors += 1
+                    self._inflight = {}
+                    for pid, entry in batch.items():
+                        self._pending.setdefault(pid, entry)
+                raise
+
+            lag = time.time() - min(queued_at for _, queued_at in batch.values())
+            with self._lock:
+                self._inflight = {}
+                self._flushes += 1
+                self._flushed_writes += len(batch)
+                self._last_flush_lag = lag
+                self._max_flush_lag = max(self._max_flush_lag, lag)
+            return len(batch)
+
+    def _flush_loop(self):
+        while True:
+            with self._lock:
+                while not self._pending and not self._closed:
+                    self._wakeup.wait()
+                if self._closed:
+                    return
+            # Let more saves accumulate so they share one transaction
+            # (close() cuts the wait short)
+            self._stop.wait(self.flush_interval)
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"❌ Profile flush failed, will retry: {e}")
+
+    def close(self):
+        """Stop the flush thread and write anything still queued"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._wakeup.notify()
+        self._stop.set()
+        self._flusher.join()
+        self.flush()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            oldest = min((queued_at for _, queued_at in self._pending.values()), default=None)
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+                "evictions": self._evictions,
+                "saves": self._saves,
+                "pending_writes": len(self._pending),
+                "flushes": self._flushes,
+                "flushed_writes": self._flushed_writes,
+                "flush_errors": self._flush_errors,
+                "oldest_pending_seconds": round(time.time() - oldest, 3) if oldest is not None else 0.0,
+                "last_flush_lag_seconds": round(self._last_flush_lag, 3),
+                "max_flush_lag_seconds": round(self._max_flush_lag, 3),
+            }
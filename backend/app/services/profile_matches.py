@@ -0,0 +1,143 @@
+from typing import List, Dict, Optional, Callable
+from collections import OrderedDict
+from pathlib import Path
+from datetime import datetime, timezone
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from app.services.catalog_service import JobCatalog
+from app.services.matching_service import rank_jobs
+from app.services.gap_service import analyze_skill_gap, generate_learning_roadmap
+
+# Bumped when the stored result shape changes, so older files are recomputed
+MATCHES_FORMAT = 2
+
+
+def profile_fingerprint(skills: List[str], experience_years: int = 0) -> str:
+    """Hash of the profile fields that affect matching"""
+    payload = json.dumps([sorted(skills), experience_years])
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def compute_profile_matches(
+    skills: List[str],
+    experience_years: int,
+    catalog: JobCatalog,
+    top_k: int = 10,
+    demand_for: Optional[Callable[[List[str]], Dict[str, int]]] = None
+) -> Dict:
+    """
+    Top-K job matches for a profile, each with its skill gap analysis and
+    a learning roadmap (in-demand skills first when demand_for, e.g.
+    MarketStats.counts_for, is given)
+    """
+    ranked = rank_jobs(skills, [job.copy() for job in catalog.jobs], experience_years)
+
+    matches = []
+    for job in ranked[:top_k]:
+        gap = analyze_skill_gap(skills, job.get("required_skills", []))
+        missing = gap["missing_skills"]
+        matches.append({
+            "job": job,
+            "match_score": job["match_score"],
+            "gap_analysis": gap,
+            "learning_roadmap": generate_learning_roadmap(
+                missing, skills, demand_for(missing) if demand_for and missing else None
+            )
+        })
+
+    return {
+        "format": MATCHES_FORMAT,
+        "catalog_version": catalog.version,
+        "profile_fingerprint": profile_fingerprint(skills, experience_years),
+        "computed_at": datetime.now(timezone.utc).isoformat(),
+        "matches": matches
+    }
+
+
+class MaterializedMatches:
+    """
+    Per-profile top-K matches stored next to saved profiles
+
+    - refresh() computes and persists (run from a background task on save)
+    - get() serves the stored result and only recomputes when the catalog
+      version or the profile's matching fingerprint has changed
+    - the most recently used results (up to max_entries) stay in memory
+    """
+
+    def __init__(
+        self,
+        store_dir: Path,
+        top_k: int = 10,
+        max_entries: int = 1024,
+        demand_for: Optional[Callable[[List[str]], Dict[str, int]]] = None
+    ):
+        self.store_dir = Path(store_dir)
+        self.top_k = top_k
+        self.max_entries = max_entries
+        self.demand_for = demand_for
+        self._memory: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, profile_id: str) -> Path:
+        return self.store_dir / f"{profile_id}.json"
+
+    def refresh(self, profile_id: str, skills: List[str], experience_years: int, catalog: JobCatalog) -> Dict:
+        result = compute_profile_matches(skills, experience_years, catalog, self.top_k, self.demand_for)
+
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        # One temp file per write, so concurrent refreshes never share a path
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.store_dir, prefix=f".{profile_id}.", suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            try:
+                json.dump(result, f)
+            except BaseException:
+                f.close()
+                os.unlink(tmp_path)
+                raise
+        os.replace(tmp_path, self._path(profile_id))
+
+        with self._lock:
+            self._remember(profile_id, result)
+        return result
+
+    def _remember(self, profile_id: str, result: Dict):
+        self._memory[profile_id] = result
+        self._memory.move_to_end(profile_id)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _load(self, profile_id: str) -> Optional[Dict]:
+        with self._lock:
+            cached = self._memory.get(profile_id)
+            if cached is not None:
+                self._memory.move_to_end(profile_id)
+                return cached
+
+        try:
+            with open(self._path(profile_id)) as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        with self._lock:
+            self._remember(profile_id, stored)
+        return stored
+
+    def get(self, profile_id: str, skills: List[str], experience_years: int, catalog: JobCatalog) -> Dict:
+        """Stored matches if still fresh, otherwise recompute lazily"""
+        stored = self._load(profile_id)
+        if (
+            stored is not None
+            and stored.get("format") == MATCHES_FORMAT
+            and stored.get("catalog_version") == catalog.version
+            and stored.get("profile_fingerprint") == profile_fingerprint(skills, experience_years)
+        ):
+            return dict(stored, recomputed=False)
+
+        return dict(self.refresh(profile_id, skills, experience_years, catalog), recomputed=True)
@@ -0,0 +1,192 @@
+from typing import List, Dict, Optional, Iterator, Iterable, Tuple
+from contextlib import contextmanager
+from pathlib import Path
+import json
+import queue
+import sqlite3
+import time
+
+from app.services.matching_service import canonical_skills
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    profile_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL DEFAULT '',
+    email TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS profile_skills (
+    profile_id TEXT NOT NULL REFERENCES profiles(profile_id) ON DELETE CASCADE,
+    skill TEXT NOT NULL,
+    PRIMARY KEY (profile_id, skill)
+);
+CREATE INDEX IF NOT EXISTS idx_profile_skills_skill ON profile_skills(skill);
+"""
+
+
+def _dumps(data: Dict) -> str:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+class ProfileStore:
+    """
+    Saved candidate profiles in SQLite (WAL mode)
+
+    - profiles: one row per profile, the document as compact JSON
+    - profile_skills: canonical skill rows, indexed by skill
+    WAL lets readers run alongside the single writer; each save is one
+    transaction, so concurrent saves of the same profile serialize instead
+    of interleaving partial writes. Connections come from a small pool and
+    every method is blocking - call it from a worker thread (plain `def`
+    endpoints or run_in_threadpool), not directly on the event loop.
+    """
+
+    def __init__(self, db_path: Path, pool_size: int = 4, busy_timeout: float = 30.0):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._busy_timeout = busy_timeout
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._connections: List[sqlite3.Connection] = []
+
+        for _ in range(pool_size):
+            conn = self._connect()
+            self._connections.append(conn)
+            self._pool.put(conn)
+
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode; transactions are opened explicitly with BEGIN
+        conn = sqlite3.connect(
+            self.db_path, timeout=self._busy_timeout,
+            check_same_thread=False, isolation_level=None
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    @contextmanager
+    def _transaction(self, durable: bool = False) -> Iterator[sqlite3.Connection]:
+        with self._connection() as conn:
+            if durable:
+                # FULL fsyncs the WAL on commit (NORMAL may lose the last
+                # commits on power loss, never corrupts)
+                conn.execute("PRAGMA synchronous=FULL")
+            try:
+                # IMMEDIATE takes the write lock up front so two writers never
+                # both read-then-upgrade and deadlock
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    yield conn
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+            finally:
+                if durable:
+                    conn.execute("PRAGMA synchronous=NORMAL")
+
+    @staticmethod
+    def _write(conn: sqlite3.Connection, profile_id: str, data: Dict, replace: bool = True) -> bool:
+        row = (profile_id, data.get("name", ""), data.get("email", ""), _dumps(data), time.time())
+        if replace:
+            conn.execute(
+                "INSERT INTO profiles (profile_id, name, email, data, updated_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(profile_id) DO UPDATE SET name = excluded.name, email = excluded.email, "
+                "data = excluded.data, updated_at = excluded.updated_at",
+                row
+            )
+        elif conn.execute("INSERT OR IGNORE INTO profiles VALUES (?, ?, ?, ?, ?)", row).rowcount == 0:
+            return False
+
+        conn.execute("DELETE FROM profile_skills WHERE profile_id = ?", (profile_id,))
+        conn.executemany(
+            "INSERT OR IGNORE INTO profile_skills (profile_id, skill) VALUES (?, ?)",
+            [(profile_id, skill) for skill in canonical_skills(data.get("skills", []))]
+        )
+        return True
+
+    def save(self, profile_id: str, data: Dict, durable: bool = False):
+        """Insert or replace a profile and its skill rows atomically"""
+        with self._transaction(durable) as conn:
+            self._write(conn, profile_id, data)
+
+    def save_many(self, profiles: Iterable[Tuple[str, Dict]], durable: bool = False) -> int:
+        """Insert or replace several profiles in one transaction (one fsync when durable)"""
+        saved = 0
+        with self._transaction(durable) as conn:
+            for profile_id, data in profiles:
+                self._write(conn, profile_id, data)
+                saved += 1
+        return saved
+
+    def get(self, profile_id: str) -> Optional[Dict]:
+        with self._connection() as conn:
+            row = conn.execute("SELECT data FROM profiles WHERE profile_id = ?", (profile_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, profile_id: str) -> bool:
+        with self._transaction() as conn:
+            return conn.execute("DELETE FROM profiles WHERE profile_id = ?", (profile_id,)).rowcount > 0
+
+    def __len__(self) -> int:
+        with self._connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def profile_ids(self) -> List[str]:
+        with self._connection() as conn:
+            return [row[0] for row in conn.execute("SELECT profile_id FROM profiles ORDER BY profile_id")]
+
+    def profiles_with_skill(self, skill: str) -> List[str]:
+        """Profile IDs listing a skill (aliases resolved, e.g. "k8s")"""
+        canonical = canonical_skills([skill])
+        if not canonical:
+            return []
+        with self._connection() as conn:
+            return [row[0] for row in conn.execute(
+                "SELECT profile_id FROM profile_skills WHERE skill = ? ORDER BY profile_id", (canonical[0],)
+            )]
+
+    def iter_profiles(self) -> Iterator[Tuple[str, Dict]]:
+        """All (profile_id, data) pairs, ordered by profile ID"""
+        with self._connection() as conn:
+            rows = conn.execute("SELECT profile_id, data FROM profiles ORDER BY profile_id").fetchall()
+        for profile_id, data in rows:
+            yield profile_id, json.loads(data)
+
+    def import_directory(self, profiles_dir: Path) -> int:
+        """
+        Bulk-import legacy PROF_*.json files in one transaction
+
+        Profiles already in the store are kept (the database is newer),
+        so running this on every startup is safe. Returns the number of
+        profiles imported.
+        """
+        profiles = []
+        for profile_file in sorted(Path(profiles_dir).glob("PROF_*.json")):
+            try:
+                with open(profile_file) as f:
+                    profiles.append((profile_file.stem, json.load(f)))
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Skipping unreadable profile {profile_file.name}: {e}")
+
+        if not profiles:
+            return 0
+        with self._transaction() as conn:
+            return sum(self._write(conn, profile_id, data, replace=False) for profile_id, data in profiles)
+
+    def close(self):
+        for conn in self._connections:
+            conn.close()
+        self._connections = []
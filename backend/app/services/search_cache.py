@@ -0,0 +1,163 @@
+from typing import List, Dict, Optional, Callable, Tuple, Any
+from collections import OrderedDict
+import threading
+import time
+
+from app.services.matching_service import canonical_skills
+from app.services.text_search import tokenize
+
+
+def normalize_location(location_preference: Optional[str]) -> Optional[str]:
+    """Lowercase, trimmed location; None when blank"""
+    if not location_preference or not location_preference.strip():
+        return None
+    return location_preference.strip().lower()
+
+
+def canonicalize_query(
+    candidate_skills: List[str],
+    experience_years: int = 0,
+    location_preference: str = None,
+    min_salary: int = None,
+    max_salary: int = None,
+    text_query: str = None,
+    related_credit: bool = False
+) -> Tuple:
+    """
+    Build the cache key for a job search
+
+    Two queries that rank the catalog identically map to the same key:
+    - skills are deduplicated, alias-resolved and sorted
+    - experience is capped at 2 years, beyond which the score no longer changes
+    - location is normalized with normalize_location (the search filters
+      must be given the same normalized value)
+    - the free-text query is reduced to its distinct index terms
+    """
+    return (
+        tuple(canonical_skills(candidate_skills)),
+        min(experience_years, 2),
+        normalize_location(location_preference),
+        min_salary,
+        max_salary,
+        tuple(sorted(set(tokenize(text_query)))) if text_query else None,
+        bool(related_credit),
+    )
+
+
+class SearchCache:
+    """
+    Bounded LRU + TTL cache for ranked search results
+
+    - Entries are tagged with the catalog version; a version change
+      drops the whole cache on the next access
+    - Concurrent misses for the same key are single-flighted: one caller
+      computes, the others wait for its result
+    - List results are stored as tuples and every caller gets its own
+      list, so callers can't reorder or truncate a cached entry (the job
+      dicts inside are shared; treat them as read-only)
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any, int]]" = OrderedDict()
+        self._inflight: Dict[Tuple, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get_or_compute(self, key: Tuple, catalog_version: str, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing it at most once per miss"""
+        while True:
+            with self._lock:
+                if catalog_version != self._version:
+                    self._clear()
+                    self._version = catalog_version
+
+                entry = self._entries.get(key)
+                if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return _thaw(entry[1])
+                if entry is not None:
+                    self._evict(key)
+
+                waiter = self._inflight.get(key)
+                if waiter is None:
+                    done = threading.Event()
+                    self._inflight[key] = done
+                    self.misses += 1
+                    break
+
+            # Another caller is computing this key - wait, then re-check
+            waiter.wait()
+
+        try:
+            value = _freeze(compute())
+            with self._lock:
+                if catalog_version == self._version:
+                    self._store(key, value)
+            return _thaw(value)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            done.set()
+
+    def _store(self, key: Tuple, value: Any):
+        size = _estimate_size(value)
+        if key in self._entries:
+            self._evict(key)
+        self._entries[key] = (time.monotonic(), value, size)
+        self._memory_bytes += size
+        while len(self._entries) > self.max_entries:
+            self._evict(next(iter(self._entries)))
+
+    def _evict(self, key: Tuple):
+        _, _, size = self._entries.pop(key)
+        self._memory_bytes -= size
+
+    def _clear(self):
+        if self._entries:
+            self.invalidations += 1
+        self._entries.clear()
+        self._memory_bytes = 0
+
+    def clear(self):
+        with self._lock:
+            self._clear()
+
+    def stats(self) -> Dict:
+        """Hit ratio and memory metrics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "memory_bytes": self._memory_bytes,
+                "catalog_version": self._version,
+            }
+
+
+def _freeze(value: Any) -> Any:
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _thaw(value: Any) -> Any:
+    return list(value) if isinstance(value, tuple) else value
+
+
+# Rough serialized size of one ranked job (a catalog job plus its scores)
+RESULT_BYTES = 512
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate memory footprint of a cached value, from its result count"""
+    return len(value) * RESULT_BYTES if isinstance(value, tuple) else RESULT_BYTES
@@ -0,0 +1,128 @@
+from typing import List, Dict, Tuple
+import math
+import threading
+
+from app.services.catalog_service import JobCatalog
+from app.services.text_search import tokenize
+
+
+def _job_text(job: Dict) -> str:
+    return " ".join([
+        job.get("title", ""),
+        job.get("description", ""),
+        " ".join(job.get("required_skills", []))
+    ])
+
+
+def _l2_normalize(weights: Dict[str, float]) -> Dict[str, float]:
+    norm = math.sqrt(sum(w * w for w in weights.values()))
+    return {term: w / norm for term, w in weights.items()} if norm else {}
+
+
+class SemanticMatcher:
+    """
+    TF-IDF cosine similarity between resume text and job postings
+
+    - The vocabulary and IDF weights are fitted on the job catalog
+    - Job vectors (sublinear TF x IDF, L2-normalized) are precomputed and
+      stored column-wise as term -> [(slot, weight)], i.e. a sparse
+      term x job matrix
+    - A query is one sparse matrix-vector product: only the postings of
+      the resume's terms are touched, and the dot products of unit vectors
+      are the cosine similarities
+    The model is fitted on construction and refitted by refresh() after
+    catalog changes (queries refit only if nobody called refresh()).
+    """
+
+    def __init__(self, catalog: JobCatalog):
+        self.catalog = catalog
+        self._lock = threading.Lock()
+        self._version = None
+        self._idf: Dict[str, float] = {}
+        self._columns: Dict[str, List[Tuple[int, float]]] = {}
+        self.refresh()
+
+    def refresh(self) -> bool:
+        """Refit if the catalog changed since the last fit; True if it did"""
+        with self._lock:
+            if self._version == self.catalog.version:
+                return False
+            self._fit()
+            return True
+
+    def _fit(self):
+        jobs = [(self.catalog.slot(job["job_id"]), job) for job in self.catalog.jobs]
+        term_counts = []
+        df: Dict[str, int] = {}
+        for slot, job in jobs:
+            counts: Dict[str, int] = {}
+            for token in tokenize(_job_text(job)):
+                counts[token] = counts.get(token, 0) + 1
+            term_counts.append((slot, counts))
+            for term in counts:
+                df[term] = df.get(term, 0) + 1
+
+        # Smoothed IDF, so terms found in every job still carry some weight
+        n_docs = len(jobs)
+        self._idf = {term: math.log((1 + n_docs) / (1 + count)) + 1 for term, count in df.items()}
+
+        columns: Dict[str, List[Tuple[int, float]]] = {}
+        for slot, counts in term_counts:
+            vector = _l2_normalize(self._weigh(counts))
+            for term, weight in vector.items():
+                columns.setdefault(term, []).append((slot, weight))
+        self._columns = columns
+        self._version = self.catalog.version
+
+    def _weigh(self, counts: Dict[str, int]) -> Dict[str, float]:
+        return {
+            term: (1 + math.log(tf)) * self._idf[term]
+            for term, tf in counts.items()
+            if term in self._idf
+        }
+
+    def vectorize(self, text: str) -> Dict[str, float]:
+        """Unit TF-IDF vector of text over the catalog vocabulary"""
+        counts: Dict[str, int] = {}
+        for token in tokenize(text):
+            counts[token] = counts.get(token, 0) + 1
+        return _l2_normalize(self._weigh(counts))
+
+    def similarities(self, text: str) -> Dict[str, float]:
+        """Cosine similarity (0-1) of text to every job sharing a term"""
+        self.refresh()
+        with self._lock:
+            query = self.vectorize(text)
+            scores: Dict[int, float] = {}
+            for term, weight in query.items():
+                for slot, job_weight in self._columns.get(term, ()):
+                    scores[slot] = scores.get(slot, 0.0) + weight * job_weight
+
+        results = {}
+        for slot, score in scores.items():
+            job = self.catalog.job_at(slot)
+            if job is not None:
+                results[job["job_id"]] = min(score, 1.0)
+        return results
+
+
+def blend_semantic_scores(
+    ranked_jobs: List[Dict],
+    similarities: Dict[str, float],
+    semantic_weight: float = 0.4
+) -> List[Dict]:
+    """
+    Combine skill match_score with resume/job text similarity
+
+    - semantic_score: cosine similarity scaled to 0-100
+    - combined_score: weighted blend used for the final ordering
+    """
+    for job in ranked_jobs:
+        semantic_score = similarities.get(job.get("job_id"), 0.0) * 100
+        job["semantic_score"] = round(semantic_score, 1)
+        job["combined_score"] = round(
+            (1 - semantic_weight) * job.get("match_score", 0) + semantic_weight * semantic_score, 1
+        )
+
+    ranked_jobs.sort(key=lambda x: x["combined_score"], reverse=True)
+    return ranked_jobs
@@ -0,0 +1,112 @@
+from typing import List, Dict, Set, Tuple
+import bisect
+import threading
+
+from app.services.catalog_service import JobCatalog, iter_bits
+
+
+class SimilarJobsIndex:
+    """
+    Sparse job x job Jaccard graph over required_skills, top-N per job
+
+    Rows are built from the catalog's skill -> job bitmaps: walking the
+    bitmaps of a job's skills accumulates |A & B| for every job sharing a
+    skill (one row of the sparse product M * M^T of the job x skill
+    matrix), so jobs with no skill in common are never touched.
+
+    The graph follows the catalog incrementally:
+    - add: compute the new job's row and offer it to every overlapping job
+    - remove: drop the job and rebuild only the rows that listed it
+    """
+
+    def __init__(self, catalog: JobCatalog, top_n: int = 10):
+        self.catalog = catalog
+        self.top_n = top_n
+        self._lock = threading.Lock()
+        # slot -> [(-similarity, other_slot)] sorted, at most top_n long
+        self._neighbours: Dict[int, List[Tuple[float, int]]] = {}
+        # slot -> slots whose neighbour lists contain it
+        self._listed_by: Dict[int, Set[int]] = {}
+
+        for job in catalog.jobs:
+            slot = catalog.slot(job["job_id"])
+            self._set_row(slot, self._compute_row(slot))
+        catalog.subscribe(self._on_catalog_change)
+
+    def _skills(self, slot: int) -> Set[str]:
+        job = self.catalog.job_at(slot)
+        return set(s.lower() for s in job.get("required_skills", [])) if job else set()
+
+    def _compute_row(self, slot: int, truncate: bool = True) -> List[Tuple[float, int]]:
+        skills = self._skills(slot)
+        overlap: Dict[int, int] = {}
+        for skill in skills:
+            for other in iter_bits(self.catalog.skill_bitmap(skill)):
+                if other != slot:
+                    overlap[other] = overlap.get(other, 0) + 1
+
+        row = []
+        for other, shared in overlap.items():
+            union = len(skills) + len(self._skills(other)) - shared
+            row.append((-(shared / union), other))
+        row.sort()
+        return row[:self.top_n] if truncate else row
+
+    def _set_row(self, slot: int, row: List[Tuple[float, int]]):
+        for _, other in self._neighbours.get(slot, []):
+            self._listed_by.get(other, set()).discard(slot)
+        self._neighbours[slot] = row
+        for _, other in row:
+            self._listed_by.setdefault(other, set()).add(slot)
+
+    def _offer(self, slot: int, entry: Tuple[float, int]):
+        """Insert entry into slot's neighbour list if it makes the top-N"""
+        row = self._neighbours.setdefault(slot, [])
+        if len(row) >= self.top_n and entry >= row[-1]:
+            return
+        bisect.insort(row, entry)
+        self._listed_by.setdefault(entry[1], set()).add(slot)
+        if len(row) > self.top_n:
+            _, dropped = row.pop()
+            self._listed_by.get(dropped, set()).discard(slot)
+
+    def _on_catalog_change(self, event: str, job: Dict, slot: int):
+        with self._lock:
+            if event == "add":
+                # Similarity is symmetric but top-N is not: offer the new
+                # job to every overlapping job, not just its own top-N
+                row = self._compute_row(slot, truncate=False)
+                self._set_row(slot, row[:self.top_n])
+                for negative_similarity, other in row:
+                    self._offer(other, (negative_similarity, slot))
+            elif event == "remove":
+                self._set_row(slot, [])
+                del self._neighbours[slot]
+                for other in self._listed_by.pop(slot, set()):
+                    self._set_row(other, self._compute_row(other))
+
+    def similar(self, job_id: str, limit: int = 10) -> List[Dict]:
+        """Most similar jobs by Jaccard similarity of required skills"""
+        if limit <= 0:
+            return []
+        results = []
+        # Slot and jobs are looked up under the lock, so a row and the jobs
+        # it names come from the same catalog state (catalog reads don't lock)
+        with self._lock:
+            slot = self.catalog.slot(job_id)
+            if slot is None:
+                return []
+            for negative_similarity, other in self._neighbours.get(slot, []):
+                job = self.catalog.job_at(other)
+                # Removed from the catalog; this listener hasn't caught up yet
+                if job is None:
+                    continue
+                results.append({
+                    "job_id": job["job_id"],
+                    "title": job.get("title", ""),
+                    "company": job.get("company", ""),
+                    "similarity": round(-negative_similarity, 3)
+                })
+                if len(results) >= limit:
+                    break
+        return results
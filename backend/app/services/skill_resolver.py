@@ -0,0 +1,182 @@
+from typing import List, Dict, Optional, Set, Tuple
+from functools import lru_cache
+import re
+import threading
+
+from app.services.catalog_service import JobCatalog
+from app.services.parser_service import ALL_SKILL_VARIANTS
+from app.services.matching_service import SKILL_GRAPH, normalize_skill
+
+
+def skill_key(skill: str) -> str:
+    """Lookup key: lowercase, no spaces/dots/hyphens ("React JS" -> "reactjs")"""
+    return re.sub(r"[\s.\-_]+", "", skill.strip().lower())
+
+
+# Tokens shorter than this get at most one edit, and not a substitution:
+# one changed letter of a short word is usually a different real skill
+# ("nestjs" -> "nextjs", "podman" -> "postman")
+LONG_TOKEN = 8
+# Shorter / longer length a correction may have (rules out "reactor" -> "react")
+MIN_LENGTH_RATIO = 0.8
+
+
+def _allowed_distance(key: str, max_distance: int) -> int:
+    # Short tokens ("go", "c#", "aws", "jest") only resolve exactly; one
+    # edit is too large a share of them ("jest" -> "rest")
+    if len(key) <= 4:
+        return 0
+    if len(key) < LONG_TOKEN:
+        return min(1, max_distance)
+    return max_distance
+
+
+def _is_substitution(a: str, b: str) -> bool:
+    """True if a and b (at distance 1) differ by one replaced letter, not a swap"""
+    if len(a) != len(b):
+        return False
+    diffs = [i for i in range(len(a)) if a[i] != b[i]]
+    return not (len(diffs) == 2 and diffs[1] == diffs[0] + 1)
+
+
+def _deletes(word: str, distance: int) -> Set[str]:
+    """All strings reachable from word by deleting up to `distance` characters"""
+    results = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        results |= frontier
+    return results
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Optimal string alignment distance (adjacent transpositions cost 1)"""
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        previous2, previous = previous, current
+    return previous[len(b)]
+
+
+class SkillResolver:
+    """
+    Typo-tolerant mapping of query tokens to canonical skills (SymSpell)
+
+    Every known variant (catalog skills, SKILL_ALIASES variants, taxonomy
+    names and aliases) is indexed under all of its deletions up to
+    max_distance. A query token generates its own deletions; any shared
+    deletion yields a candidate, which is verified with the real edit
+    distance. Lookup cost depends on the token length, not the vocabulary.
+
+    Results are memoized (LRU); new catalog skills are indexed as jobs
+    are added and clear the memo.
+    """
+
+    def __init__(self, catalog: Optional[JobCatalog] = None, max_distance: int = 2, cache_size: int = 4096):
+        self.max_distance = max_distance
+        self._lock = threading.Lock()
+        self._canonical: Dict[str, str] = {}
+        self._deletes: Dict[str, Set[str]] = {}
+        self._catalog_keys: Set[str] = set()
+        self._resolve_cached = lru_cache(maxsize=cache_size)(self._resolve)
+
+        for variant, canonical in ALL_SKILL_VARIANTS.items():
+            self._add(variant, canonical)
+        for name in SKILL_GRAPH.categories:
+            self._add(name, normalize_skill(name))
+        for alias, name in SKILL_GRAPH.aliases.items():
+            self._add(alias, normalize_skill(name))
+
+        if catalog is not None:
+            for skill in catalog.skills():
+                self._add_catalog_skill(skill)
+            catalog.subscribe(self._on_catalog_change)
+
+    def _add(self, variant: str, canonical: str) -> bool:
+        key = skill_key(variant)
+        if not key or key in self._canonical:
+            return False
+        self._canonical[key] = canonical
+        for deletion in _deletes(key, _allowed_distance(key, self.max_distance)):
+            self._deletes.setdefault(deletion, set()).add(key)
+        return True
+
+    def _add_catalog_skill(self, skill: str) -> bool:
+        # Catalog spelling wins over alias canonicals, so a token that
+        # names a job skill keeps matching that job skill exactly
+        key = skill_key(skill)
+        spelling = skill.strip().lower()
+        changed = self._add(skill, spelling) or self._canonical[key] != spelling
+        self._canonical[key] = spelling
+        self._catalog_keys.add(key)
+        return changed
+
+    def _on_catalog_change(self, event: str, job: Dict, slot: int):
+        if event != "add":
+            return
+        with self._lock:
+            added = [self._add_catalog_skill(s) for s in job.get("required_skills", [])]
+            if any(added):
+                self._resolve_cached.cache_clear()
+
+    def _resolve(self, key: str) -> Optional[Tuple[str, int]]:
+        if key in self._canonical:
+            return self._canonical[key], 0
+
+        allowed = _allowed_distance(key, self.max_distance)
+        best_distance = None
+        best = set()
+        seen = set()
+        for deletion in _deletes(key, allowed):
+            for candidate in self._deletes.get(deletion, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                if min(len(key), len(candidate)) < MIN_LENGTH_RATIO * max(len(key), len(candidate)):
+                    continue
+                distance = edit_distance(key, candidate)
+                if distance > min(allowed, _allowed_distance(candidate, self.max_distance)):
+                    continue
+                if len(key) < LONG_TOKEN and _is_substitution(key, candidate):
+                    continue
+                if best_distance is None or distance < best_distance:
+                    best_distance, best = distance, set()
+                if distance == best_distance:
+                    best.add(self._canonical[candidate])
+        # Only correct when the nearest skill is unambiguous
+        return (best.pop(), best_distance) if len(best) == 1 else None
+
+    def resolve(self, skill: str) -> Optional[Tuple[str, int]]:
+        """(canonical_skill, edit_distance) for a query token, or None"""
+        key = skill_key(skill)
+        if not key:
+            return None
+        with self._lock:
+            return self._resolve_cached(key)
+
+    def resolve_skills(self, skills: List[str]) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Resolve query tokens to canonical skills
+
+        Returns (skills, corrections): unresolvable tokens are kept as
+        given; corrections maps each rewritten token to its skill.
+        """
+        resolved = []
+        corrections = {}
+        for skill in skills:
+            if not skill or not skill.strip():
+                continue
+            match = self.resolve(skill)
+            if match is None:
+                resolved.append(skill.strip())
+                continue
+            resolved.append(match[0])
+            if match[0] != skill.strip().lower():
+                corrections[skill.strip()] = match[0]
+        return resolved, corrections
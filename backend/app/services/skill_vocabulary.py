@@ -0,0 +1,109 @@
+from typing import List, Dict, Optional, Tuple
+import bisect
+import heapq
+import threading
+
+from app.services.catalog_service import JobCatalog
+from app.services.parser_service import ALL_SKILL_VARIANTS
+from app.services.matching_service import SKILL_GRAPH, normalize_skill
+
+
+def _aliases_by_canonical() -> Dict[str, List[str]]:
+    """canonical skill -> alias spellings (SKILL_ALIASES + taxonomy)"""
+    aliases: Dict[str, List[str]] = {}
+    for variant, canonical in ALL_SKILL_VARIANTS.items():
+        aliases.setdefault(canonical, []).append(variant)
+    for alias, name in SKILL_GRAPH.aliases.items():
+        aliases.setdefault(normalize_skill(name), []).append(alias)
+    return aliases
+
+
+class SkillVocabulary:
+    """
+    Catalog skill vocabulary with demand counts, for autocomplete
+
+    - Per-skill job counts follow catalog add/remove events
+    - Completion terms (skill names and their aliases, lowercase) are kept
+      in one sorted list of (term, skill); a prefix query is a bisect to
+      the first match plus a scan of the matching run
+    - Completions are ranked by how many live jobs require the skill
+    """
+
+    def __init__(self, catalog: JobCatalog):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+        self._display: Dict[str, str] = {}
+        self._terms: List[Tuple[str, str]] = []
+        self._sorted_names: Optional[List[str]] = None
+        self._aliases = _aliases_by_canonical()
+
+        for job in catalog.jobs:
+            self._add_job(job)
+        catalog.subscribe(self._on_catalog_change)
+
+    def _job_skills(self, job: Dict) -> Dict[str, str]:
+        return {s.strip().lower(): s.strip() for s in job.get("required_skills", []) if s and s.strip()}
+
+    def _completion_terms(self, skill: str) -> set:
+        return {skill} | set(self._aliases.get(normalize_skill(skill), []))
+
+    def _add_job(self, job: Dict):
+        for skill, display in self._job_skills(job).items():
+            count = self._counts.get(skill, 0)
+            self._counts[skill] = count + 1
+            if count == 0:
+                self._display[skill] = display
+                for term in self._completion_terms(skill):
+                    bisect.insort(self._terms, (term, skill))
+                self._sorted_names = None
+
+    def _remove_job(self, job: Dict):
+        for skill in self._job_skills(job):
+            count = self._counts.get(skill, 0) - 1
+            if count > 0:
+                self._counts[skill] = count
+                continue
+            self._counts.pop(skill, None)
+            self._display.pop(skill, None)
+            for term in self._completion_terms(skill):
+                i = bisect.bisect_left(self._terms, (term, skill))
+                if i < len(self._terms) and self._terms[i] == (term, skill):
+                    del self._terms[i]
+            self._sorted_names = None
+
+    def _on_catalog_change(self, event: str, job: Dict, slot: int):
+        with self._lock:
+            if event == "add":
+                self._add_job(job)
+            elif event == "remove":
+                self._remove_job(job)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def count(self, skill: str) -> int:
+        """Number of live jobs requiring a skill"""
+        return self._counts.get(skill.strip().lower(), 0)
+
+    def skills(self) -> List[str]:
+        """All skill names (as first spelled in the catalog), sorted"""
+        with self._lock:
+            if self._sorted_names is None:
+                self._sorted_names = sorted(self._display.values())
+            return self._sorted_names
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Dict]:
+        """Top completions for a prefix, most in-demand first"""
+        prefix = prefix.strip().lower()
+        with self._lock:
+            if prefix:
+                matches = set()
+                i = bisect.bisect_left(self._terms, (prefix,))
+                while i < len(self._terms) and self._terms[i][0].startswith(prefix):
+                    matches.add(self._terms[i][1])
+                    i += 1
+            else:
+                matches = self._counts.keys()
+
+            best = heapq.nsmallest(limit, matches, key=lambda s: (-self._counts[s], self._display[s]))
+            return [{"skill": self._display[s], "job_count": self._counts[s]} for s in best]
@@ -0,0 +1,90 @@
+from typing import List, Dict, Iterable
+import heapq
+
+# Partial credit for a job skill the candidate doesn't list exactly
+RELATED_WEIGHT = 0.5   # related_to edges (either direction)
+REQUIRES_WEIGHT = 0.8  # knowing X implies its prerequisite (X requires Y)
+# Paths weaker than this are dropped to keep the closure sparse
+MIN_CREDIT = 0.25
+
+
+class SkillGraph:
+    """
+    Skill taxonomy compiled into a weighted transitive closure
+
+    Edges come from `related_to` and `requires` in skills_taxonomy.json.
+    The closure keeps, for every pair of skills, the strongest path
+    (product of edge weights), stored sparsely as
+    closure[candidate_skill][job_skill] -> credit in (0, 1).
+    It is computed once, so scoring never walks the graph.
+    """
+
+    def __init__(self, taxonomy: Dict):
+        self.aliases: Dict[str, str] = {}
+        self.names: Dict[str, str] = {}
+        self.categories: Dict[str, str] = {}
+        self.requires: Dict[str, List[str]] = {}
+        edges: Dict[str, Dict[str, float]] = {}
+
+        def add_edge(source: str, target: str, weight: float):
+            if source != target and weight > edges.setdefault(source, {}).get(target, 0.0):
+                edges[source][target] = weight
+
+        for category in taxonomy.get("categories", []):
+            for skill in category.get("skills", []):
+                name = skill["name"].lower()
+                self.names[name] = skill["name"]
+                self.categories[name] = category.get("id", "")
+                for alias in skill.get("aliases", []):
+                    self.aliases[alias.lower()] = name
+
+        for category in taxonomy.get("categories", []):
+            for skill in category.get("skills", []):
+                name = skill["name"].lower()
+                for related in skill.get("related_to", []):
+                    related = self.canonical(related)
+                    add_edge(name, related, RELATED_WEIGHT)
+                    add_edge(related, name, RELATED_WEIGHT)
+                for required in skill.get("requires", []):
+                    required = self.canonical(required)
+                    self.requires.setdefault(name, []).append(required)
+                    add_edge(name, required, REQUIRES_WEIGHT)
+
+        self.closure = {source: self._strongest_paths(source, edges) for source in edges}
+
+    @staticmethod
+    def _strongest_paths(source: str, edges: Dict[str, Dict[str, float]]) -> Dict[str, float]:
+        """Max-product path weights from source (weights <= 1, so best-first is exact)"""
+        best = {source: 1.0}
+        heap = [(-1.0, source)]
+        while heap:
+            negative_weight, skill = heapq.heappop(heap)
+            weight = -negative_weight
+            if weight < best.get(skill, 0.0):
+                continue
+            for target, edge_weight in edges.get(skill, {}).items():
+                credit = weight * edge_weight
+                if credit >= MIN_CREDIT and credit > best.get(target, 0.0):
+                    best[target] = credit
+                    heapq.heappush(heap, (-credit, target))
+        del best[source]
+        return best
+
+    def canonical(self, skill: str) -> str:
+        key = skill.strip().lower()
+        return self.aliases.get(key, key)
+
+    def expand(self, candidate_skills: Iterable[str]) -> Dict[str, float]:
+        """
+        Best related/implied credit per skill for a candidate skill set
+
+        One closure row lookup per candidate skill; skills the candidate
+        already has are left out (they score as exact matches).
+        """
+        have = set(self.canonical(s) for s in candidate_skills)
+        credits: Dict[str, float] = {}
+        for skill in have:
+            for target, credit in self.closure.get(skill, {}).items():
+                if target not in have and credit > credits.get(target, 0.0):
+                    credits[target] = credit
+        return credits
@@ -0,0 +1,232 @@
+from typing import List, Dict, Tuple
+from array import array
+import heapq
+import math
+import re
+import threading
+
+from app.services.catalog_service import JobCatalog
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is",
+    "it", "of", "on", "or", "our", "that", "the", "to", "we", "will", "with", "you", "your"
+}
+
+# Title tokens are indexed this many times (simple field boost)
+TITLE_BOOST = 2
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords (keeps c++, c#, node.js)"""
+    tokens = re.findall(r"[a-z0-9][a-z0-9+#.]*", text.lower())
+    return [t.rstrip(".") for t in tokens if t.rstrip(".") and t not in STOPWORDS]
+
+
+class _PostingCursor:
+    """Sequential reader over a delta-encoded posting list"""
+
+    def __init__(self, deltas: array, tfs: array, idf: float):
+        self.deltas = deltas
+        self.tfs = tfs
+        self.idf = idf
+        self.upper_bound = 0.0
+        self.position = -1
+        self.doc = 0
+        self.next()
+
+    def next(self):
+        self.position += 1
+        if self.position < len(self.deltas):
+            self.doc += self.deltas[self.position]
+        else:
+            self.doc = None
+
+    def seek(self, target: int):
+        """Advance to the first doc >= target"""
+        while self.doc is not None and self.doc < target:
+            self.next()
+
+    @property
+    def tf(self) -> int:
+        return self.tfs[self.position]
+
+
+class TextSearchIndex:
+    """
+    BM25 inverted index over job titles and descriptions
+
+    - Postings are docid gaps in compact arrays (array('I')) with term
+      frequencies alongside; docids are catalog slots, which only grow,
+      so new postings are appended without re-encoding
+    - Top-K queries use MaxScore: terms whose summed upper bounds cannot
+      beat the current k-th score are only probed for docs that the
+      remaining terms already made competitive
+    - Removed jobs are tombstoned and the index is rebuilt once tombstones
+      exceed a quarter of the documents
+    """
+
+    def __init__(self, catalog: JobCatalog, k1: float = 1.2, b: float = 0.75):
+        self.catalog = catalog
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self._build()
+        catalog.subscribe(self._on_catalog_change)
+
+    def _build(self):
+        self._deltas: Dict[str, array] = {}
+        self._tfs: Dict[str, array] = {}
+        self._last_doc: Dict[str, int] = {}
+        # Live document frequency (postings may still hold tombstones)
+        self._df: Dict[str, int] = {}
+        self._doc_lengths: Dict[int, int] = {}
+        self._total_length = 0
+        self._deleted = set()
+
+        for job in self.catalog.jobs:
+            self._add_document(self.catalog.slot(job["job_id"]), job)
+
+    def _document_terms(self, job: Dict) -> Dict[str, int]:
+        tokens = tokenize(job.get("title", "")) * TITLE_BOOST + tokenize(job.get("description", ""))
+        counts: Dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        return counts
+
+    def _add_document(self, doc: int, job: Dict):
+        counts = self._document_terms(job)
+        for term, tf in counts.items():
+            if term not in self._deltas:
+                self._deltas[term] = array("I")
+                self._tfs[term] = array("H")
+                self._last_doc[term] = 0
+                self._df[term] = 0
+            self._deltas[term].append(doc - self._last_doc[term])
+            self._tfs[term].append(min(tf, 0xFFFF))
+            self._last_doc[term] = doc
+            self._df[term] += 1
+        length = sum(counts.values())
+        self._doc_lengths[doc] = length
+        self._total_length += length
+
+    def _on_catalog_change(self, event: str, job: Dict, slot: int):
+        with self._lock:
+            if event == "add":
+                self._add_document(slot, job)
+            elif event == "remove" and slot in self._doc_lengths:
+                self._deleted.add(slot)
+                self._total_length -= self._doc_lengths.pop(slot)
+                for term in self._document_terms(job):
+                    self._df[term] -= 1
+                if len(self._deleted) * 4 > len(self._doc_lengths) + len(self._deleted):
+                    self._build()
+
+    def _idf(self, term: str, n_docs: int) -> float:
+        df = self._df[term]
+        return math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """Top-K (job_id, bm25_score) for a free-text query"""
+        terms = sorted(set(t for t in tokenize(query)))
+        with self._lock:
+            n_docs = len(self._doc_lengths)
+            if not n_docs or limit < 1:
+                return []
+            avg_length = self._total_length / n_docs
+
+            cursors = []
+            for term in terms:
+                if self._df.get(term):
+                    cursor = _PostingCursor(self._deltas[term], self._tfs[term], self._idf(term, n_docs))
+                    cursor.upper_bound = cursor.idf * (self.k1 + 1)
+                    cursors.append(cursor)
+            if not cursors:
+                return []
+
+            # MaxScore: cursors sorted by upper bound, cumulative bounds
+            cursors.sort(key=lambda c: c.upper_bound)
+            cumulative = []
+            running = 0.0
+            for cursor in cursors:
+                running += cursor.upper_bound
+                cumulative.append(running)
+
+            top: List[Tuple[float, int]] = []
+            threshold = 0.0
+            first_essential = 0
+
+            while True:
+                essential = [c for c in cursors[first_essential:] if c.doc is not None]
+                if not essential:
+                    break
+                doc = min(c.doc for c in essential)
+
+                score = 0.0
+                for cursor in essential:
+                    if cursor.doc == doc:
+                        score += self._term_score(cursor, doc, avg_length)
+                        cursor.next()
+
+                # Probe non-essential terms while the doc can still make the top-K
+                for i in range(first_essential - 1, -1, -1):
+                    if score + cumulative[i] <= threshold:
+                        break
+                    cursor = cursors[i]
+                    cursor.seek(doc)
+                    if cursor.doc == doc:
+                        score += self._term_score(cursor, doc, avg_length)
+
+                if doc in self._deleted or score <= threshold:
+                    continue
+
+                if len(top) < limit:
+                    heapq.heappush(top, (score, -doc))
+                else:
+                    heapq.heapreplace(top, (score, -doc))
+                if len(top) == limit:
+                    threshold = top[0][0]
+                    while first_essential < len(cursors) and cumulative[first_essential] <= threshold:
+                        first_essential += 1
+
+            ranked = sorted(top, key=lambda x: (-x[0], -x[1]))
+            return [
+                (self.catalog.job_at(-neg_doc)["job_id"], round(score, 4))
+                for score, neg_doc in ranked
+            ]
+
+    def _term_score(self, cursor: _PostingCursor, doc: int, avg_length: float) -> float:
+        tf = cursor.tf
+        norm = 1 - self.b + self.b * self._doc_lengths.get(doc, avg_length) / avg_length
+        return cursor.idf * tf * (self.k1 + 1) / (tf + self.k1 * norm)
+
+
+def blend_text_scores(
+    ranked_jobs: List[Dict],
+    text_hits: List[Tuple[str, float]],
+    text_weight: float = 0.5
+) -> List[Dict]:
+    """
+    Combine skill match_score with BM25 relevance
+
+    - text_score: BM25 scaled to 0-100 against the best hit
+    - search_score: weighted blend used for the final ordering
+    Jobs without a text hit are dropped.
+    """
+    if not text_hits:
+        return []
+    best = text_hits[0][1] or 1.0
+    text_scores = {job_id: score / best * 100 for job_id, score in text_hits}
+
+    blended = []
+    for job in ranked_jobs:
+        text_score = text_scores.get(job.get("job_id"))
+        if text_score is None:
+            continue
+        job["text_score"] = round(text_score, 1)
+        job["search_score"] = round(
+            (1 - text_weight) * job.get("match_score", 0) + text_weight * text_score, 1
+        )
+        blended.append(job)
+
+    blended.sort(key=lambda x: x["search_score"], reverse=True)
+    return blended
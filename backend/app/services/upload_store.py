@@ -0,0 +1,318 @@
+from typing import Dict, List, Optional, Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+import hashlib
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # not on Windows; the store lock is then per-process only
+    fcntl = None
+
+MIME_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+# gc() leaves files in blobs/ younger than this alone (writes in progress)
+TMP_GRACE_SECONDS = 3600
+
+
+class UploadStore:
+    """
+    Content-addressed upload storage with a metadata index
+
+    - blobs live at blobs/<ab>/<cd>/<sha256>, so identical bytes are
+      stored once and no directory grows past a few hundred entries
+    - index.jsonl is an append-only log of put/delete records
+      (file_id -> sha256, size, mime, extension, created_at), replayed on
+      startup into in-memory maps; counts and sizes are running totals
+    - deleting a file only drops its record; gc() removes blobs no file
+      references any more and compacts the log
+    - writers (put/delete/gc) hold an flock on <root>/.lock and first
+      replay records other processes appended (or reload after another
+      process compacted the log), so a CLI run next to the server never
+      works from a stale view
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.blob_dir = self.root / "blobs"
+        self.index_path = self.root / "index.jsonl"
+        self.lock_path = self.root / ".lock"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        # Identity of the index file and how far into it we have replayed
+        self._index_ino = None
+        self._index_offset = 0
+        self._reset()
+
+        with self._lock:
+            self._sync()
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def _reset(self):
+        self._files: Dict[str, Dict] = {}
+        self._refs: Dict[str, int] = {}
+        self._blob_sizes: Dict[str, int] = {}
+        self._blobs = 0
+        self._stored_bytes = 0
+        self._logical_bytes = 0
+
+    def _sync(self):
+        """Replay index records written by other processes since the last sync"""
+        try:
+            stat = os.stat(self.index_path)
+        except FileNotFoundError:
+            if self._index_ino is not None:
+                self._reset()
+                self._index_ino, self._index_offset = None, 0
+            return
+
+        if stat.st_ino != self._index_ino or stat.st_size < self._index_offset:
+            # Compacted (replaced) by another process: start over
+            self._reset()
+            self._index_ino, self._index_offset = stat.st_ino, 0
+        if stat.st_size == self._index_offset:
+            return
+
+        with open(self.index_path, "rb") as f:
+            f.seek(self._index_offset)
+            data = f.read()
+        # A record still being appended has no newline yet; pick it up next time
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if line.strip():
+                self._apply(json.loads(line))
+        self._index_offset += end
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Thread + cross-process write lock, with the index synced on entry"""
+        with self._lock:
+            with open(self.lock_path, "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    self._sync()
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _apply(self, entry: Dict):
+        if entry["op"] == "put":
+            record = {k: v for k, v in entry.items() if k != "op"}
+            self._unlink(record["file_id"])
+            self._files[record["file_id"]] = record
+            self._blob_sizes[record["sha256"]] = record["size"]
+            self._ref(record["sha256"], 1)
+            self._logical_bytes += record["size"]
+        elif entry["op"] == "delete":
+            self._unlink(entry["file_id"])
+
+    def _unlink(self, file_id: str):
+        record = self._files.pop(file_id, None)
+        if record is not None:
+            self._ref(record["sha256"], -1)
+            self._logical_bytes -= record["size"]
+
+    def _ref(self, sha256: str, delta: int):
+        refs = self._refs.get(sha256, 0)
+        self._refs[sha256] = refs + delta
+        if refs == 0 and delta > 0:
+            self._blobs += 1
+            self._stored_bytes += self._blob_sizes[sha256]
+        elif refs + delta == 0:
+            self._blobs -= 1
+            self._stored_bytes -= self._blob_sizes[sha256]
+
+    def _log(self, entry: Dict):
+        # Only called under _exclusive(), so the file ends where we synced to
+        with open(self.index_path, "ab") as f:
+            f.write((json.dumps(entry) + "\n").encode("utf-8"))
+            self._index_offset = f.tell()
+        self._index_ino = os.stat(self.index_path).st_ino
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.blob_dir / sha256[:2] / sha256[2:4] / sha256
+
+    def _write_blob(self, sha256: str, content: bytes):
+        path = self.blob_path(sha256)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{sha256}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(content)
+        # Atomic: readers never see a partially written blob
+        os.replace(tmp, path)
+
+    def put(self, file_id: str, content: bytes, filename: str = "") -> Dict:
+        """Store bytes under file_id; identical content shares one blob"""
+        extension = Path(filename).suffix.lower()
+        sha256 = hashlib.sha256(content).hexdigest()
+        record = {
+            "file_id": file_id,
+            "sha256": sha256,
+            "size": len(content),
+            "mime": MIME_TYPES.get(extension, "application/octet-stream"),
+            "extension": extension,
+            "original_filename": filename,
+            "created_at": time.time(),
+        }
+        with self._exclusive():
+            self._write_blob(sha256, content)
+            self._log({"op": "put", **record})
+            self._apply({"op": "put", **record})
+        return record
+
+    def get(self, file_id: str) -> Optional[Dict]:
+        with self._lock:
+            self._sync()
+            return self._files.get(file_id)
+
+    def file_ids(self) -> List[str]:
+        with self._lock:
+            self._sync()
+            return list(self._files)
+
+    def path(self, file_id: str) -> Optional[Path]:
+        record = self.get(file_id)
+        return self.blob_path(record["sha256"]) if record else None
+
+    def read(self, file_id: str) -> Optional[bytes]:
+        path = self.path(file_id)
+        try:
+            return path.read_bytes() if path else None
+        except FileNotFoundError:
+            # Expired and collected by another process since the lookup
+            return None
+
+    def delete(self, file_id: str) -> bool:
+        """Drop a file record (its blob is reclaimed by gc())"""
+        with self._exclusive():
+            if file_id not in self._files:
+                return False
+            self._log({"op": "delete", "file_id": file_id})
+            self._unlink(file_id)
+            return True
+
+    def import_directory(self, upload_dir: Path, remove: bool = False) -> int:
+        """
+        Import legacy flat <file_id>.pdf/.docx uploads, keeping their file_ids
+
+        Files already in the index are skipped, so this is safe to run on
+        every startup. With remove=True the originals are deleted once
+        their blob is in place.
+        """
+        imported = 0
+        for path in sorted(Path(upload_dir).iterdir()):
+            if path.suffix.lower() not in MIME_TYPES or not path.is_file():
+                continue
+            if self.get(path.stem) is None:
+                content = path.read_bytes()
+                self.put(path.stem, content, path.name)
+                imported += 1
+            if remove:
+                path.unlink()
+        return imported
+
+    def gc(
+        self,
+        max_age_seconds: Optional[float] = None,
+        keep: Iterable[str] = (),
+        grace_seconds: float = TMP_GRACE_SECONDS
+    ) -> Dict:
+        """
+        Reclaim space
+
+        - with max_age_seconds, files older than that (and not in `keep`)
+          are deleted first; their IDs are returned as expired_file_ids so
+          callers can drop anything else keyed by them
+        - blobs no file references are removed, including orphans left by
+          an interrupted put (only once older than grace_seconds)
+        - the index log is rewritten with live records only
+        Safe to run from another process while the server is up.
+        """
+        keep = set(keep)
+        with self._exclusive():
+            expired = []
+            if max_age_seconds is not None:
+                cutoff = time.time() - max_age_seconds
+                for file_id, record in list(self._files.items()):
+                    if record["created_at"] < cutoff and file_id not in keep:
+                        self._unlink(file_id)
+                        expired.append(file_id)
+
+            removed = freed = 0
+            for sha256 in [s for s, refs in self._refs.items() if refs <= 0]:
+                path = self.blob_path(sha256)
+                if path.exists():
+                    freed += path.stat().st_size
+                    path.unlink()
+                    removed += 1
+                del self._refs[sha256]
+                self._blob_sizes.pop(sha256, None)
+
+            young = time.time() - grace_seconds
+            for path in self.blob_dir.glob("*/*/*"):
+                if not (path.name.startswith(".") or path.name not in self._refs):
+                    continue
+                try:
+                    stat = path.stat()
+                    if stat.st_mtime > young:
+                        continue
+                    path.unlink()
+                except FileNotFoundError:
+                    continue
+                freed += stat.st_size
+                removed += 1
+
+            tmp = self.index_path.with_suffix(".jsonl.tmp")
+            with open(tmp, "wb") as f:
+                for record in self._files.values():
+                    f.write((json.dumps({"op": "put", **record}) + "\n").encode("utf-8"))
+                offset = f.tell()
+            os.replace(tmp, self.index_path)
+            self._index_ino, self._index_offset = os.stat(self.index_path).st_ino, offset
+
+        return {
+            "expired_files": len(expired),
+            "expired_file_ids": expired,
+            "removed_blobs": removed,
+            "bytes_freed": freed
+        }
+
+    def stats(self) -> Dict:
+        with self._lock:
+            self._sync()
+        return {
+            "files": len(self._files),
+            "blobs": self._blobs,
+            "unreferenced_blobs": len(self._refs) - self._blobs,
+            "logical_bytes": self._logical_bytes,
+            "stored_bytes": self._stored_bytes,
+        }
+
+
+if __name__ == "__main__":
+    # python -m app.services.upload_store [uploads_dir] [stats|import|gc]
+    # Expiring old uploads also drops their fingerprints, so it runs inside
+    # the server: POST /api/uploads/gc. The CLI gc only reclaims blobs.
+    import sys
+
+    directory = Path(sys.argv[1] if len(sys.argv) > 1 else "uploads")
+    command = sys.argv[2] if len(sys.argv) > 2 else "stats"
+    store = UploadStore(directory)
+
+    if command == "import":
+        print(f"✅ Imported {store.import_directory(directory, remove=True)} legacy uploads")
+    elif command == "gc":
+        print(f"✅ GC: {store.gc()}")
+    print(store.stats())
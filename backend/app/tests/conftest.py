@@ -0,0 +1,17 @@
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def client(tmp_path_factory):
+    # app.main keeps uploads/ and saved_profiles/ relative to the CWD, and
+    # is imported once per session, so every API test shares one directory
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("api"))
+    try:
+        from app.main import app
+        yield TestClient(app)
+    finally:
+        os.chdir(cwd)
@@ -0,0 +1,75 @@
+from datetime import date
+
+from app.services.candidate_index import CandidateIndex, _experience_years
+
+JOB = {"job_id": "J1", "required_skills": ["Python", "FastAPI", "Docker"]}
+
+
+def _index():
+    index = CandidateIndex()
+    index.upsert("PROF_A", {"name": "A", "email": "a@x.com", "skills": ["Python", "FastAPI", "Docker"]})
+    index.upsert("PROF_B", {"name": "B", "email": "b@x.com", "skills": ["python"]})
+    index.upsert("PROF_C", {"name": "C", "email": "c@x.com", "skills": ["Rust", "Go"]})
+    return index
+
+
+def test_top_candidates_ranked_by_match_score():
+    ranked = _index().top_candidates(JOB, limit=10)
+
+    assert [c["profile_id"] for c in ranked] == ["PROF_A", "PROF_B"]
+    assert ranked[0]["match_score"] > ranked[1]["match_score"]
+    assert ranked[1]["matching_skills"] == ["python"]
+
+
+def test_profiles_without_overlap_are_not_scored():
+    ranked = _index().top_candidates(JOB)
+
+    assert "PROF_C" not in [c["profile_id"] for c in ranked]
+
+
+def test_upsert_replaces_old_postings():
+    index = _index()
+    index.upsert("PROF_B", {"name": "B", "email": "b@x.com", "skills": ["Go"]})
+
+    assert [c["profile_id"] for c in index.top_candidates(JOB)] == ["PROF_A"]
+    assert len(index) == 3
+
+
+def test_limit_and_remove():
+    index = _index()
+
+    assert len(index.top_candidates(JOB, limit=1)) == 1
+    index.remove("PROF_A")
+    assert [c["profile_id"] for c in index.top_candidates(JOB)] == ["PROF_B"]
+
+
+def test_experience_years_from_parsed_durations():
+    today = date(2026, 1, 15)
+    experience = [
+        {"title": "Engineer", "company": "A Inc", "duration": "Jan 2022 - Dec 2023"},
+        # Overlaps the first job by a year: counted once
+        {"title": "Consultant", "company": "B Corp", "duration": "January 2023 – Present"},
+        {"title": "Intern", "company": "C Ltd", "duration": "Not specified"},
+    ]
+
+    assert _experience_years({"experience": experience}, today) == 4
+    assert _experience_years({"experience": experience[:1]}, today) == 2
+    assert _experience_years({"experience_years": 1, "experience": experience}, today) == 1
+    assert _experience_years({"experience": []}, today) == 0
+
+
+def test_parsed_experience_feeds_the_score():
+    index = CandidateIndex()
+    index.upsert("PROF_NEW", {"name": "N", "email": "n@x.com", "skills": ["Python"]})
+    index.upsert("PROF_OLD", {"name": "O", "email": "o@x.com", "skills": ["Python"],
+                              "experience": [{"duration": "Jun 2015 - May 2020"}]})
+
+    assert index.get("PROF_OLD")["experience_years"] == 5
+    assert [c["profile_id"] for c in index.top_candidates(JOB)] == ["PROF_OLD", "PROF_NEW"]
+
+
+def test_load_pairs():
+    index = CandidateIndex()
+
+    assert index.load([("PROF_X", {"name": "X", "email": "x@y.com", "skills": ["Docker"]})]) == 1
+    assert index.top_candidates(JOB)[0]["profile_id"] == "PROF_X"
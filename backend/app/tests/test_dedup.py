@@ -0,0 +1,92 @@
+from app.services.catalog_service import JobCatalog
+from app.services.dedup_service import JobDeduplicator, dedupe_jobs, shingles
+
+BASE = {
+    "job_id": "J1",
+    "title": "Backend Developer",
+    "company": "TechCorp India",
+    "description": "Build scalable REST APIs for our e-commerce platform serving 50K+ daily users. "
+                   "Work with modern Python stack and contribute to microservices architecture.",
+}
+
+
+def test_shingles_ignore_case_and_punctuation():
+    a = shingles(BASE)
+    b = shingles(dict(BASE, title="BACKEND developer!"))
+
+    assert a == b
+
+
+def test_near_duplicate_is_collapsed():
+    repost = dict(BASE, job_id="J2", title="backend developer",
+                  description=BASE["description"] + " Apply now.")
+    other = dict(BASE, job_id="J3", title="Data Engineer", company="DataFlow",
+                 description="Design ETL pipelines with Spark and Airflow for analytics workloads.")
+
+    dedup = JobDeduplicator()
+    unique, aliases = dedupe_jobs([BASE, repost, other], dedup)
+
+    assert [j["job_id"] for j in unique] == ["J1", "J3"]
+    assert aliases == {"J2": "J1"}
+    stats = dedup.stats()
+    assert stats["duplicates"] == 1
+    assert stats["reduction_percentage"] == 33.3
+
+
+def test_forget_removed_posting():
+    dedup = JobDeduplicator()
+    dedup.add(BASE)
+    dedup.forget("J1")
+
+    assert dedup.find_duplicate(dict(BASE, job_id="J2")) is None
+
+
+def test_catalog_resolves_aliases():
+    catalog = JobCatalog([dict(BASE, required_skills=["Python"])])
+    catalog.add_alias("J2", "J1")
+
+    assert catalog.get("J2")["job_id"] == "J1"
+    assert catalog.slot("J2") == catalog.slot("J1")
+
+
+def test_live_job_wins_over_alias():
+    catalog = JobCatalog([dict(BASE, required_skills=["Python"])])
+    catalog.add_alias("J2", "J1")
+    catalog.add_job(dict(BASE, job_id="J2", title="Data Engineer", required_skills=["Spark"]))
+
+    assert catalog.get("J2")["title"] == "Data Engineer"
+    assert catalog.resolve("J2") == "J2"
+
+
+def test_alias_changes_version_and_follows_removal():
+    catalog = JobCatalog([dict(BASE, required_skills=["Python"])])
+    events = []
+    catalog.subscribe(lambda event, job, slot: events.append(event))
+    version = catalog.version
+
+    catalog.add_alias("J2", "J1")
+    assert catalog.version != version
+    assert events == ["alias"]
+
+    catalog.remove_job("J1")
+    assert catalog.get("J2") is None
+    assert catalog.resolve("J2") == "J2"
+
+
+def test_reingested_job_that_became_a_duplicate_is_replaced_by_its_alias():
+    other = dict(BASE, job_id="J3", title="Data Engineer", company="DataFlow",
+                 description="Design ETL pipelines with Spark and Airflow for analytics workloads.")
+    dedup = JobDeduplicator()
+    unique, _ = dedupe_jobs([BASE, other], dedup)
+    catalog = JobCatalog(unique)
+    catalog.subscribe(lambda event, job, slot: dedup.forget(job["job_id"]) if event == "remove" else None)
+
+    # J3 is re-posted with J1's content
+    _, aliases = dedupe_jobs([dict(BASE, job_id="J3")], dedup)
+    for alias, canonical in aliases.items():
+        catalog.add_alias(alias, canonical)
+
+    assert aliases == {"J3": "J1"}
+    assert len(catalog) == 1
+    assert catalog.get("J3")["job_id"] == "J1"
+    assert [job["job_id"] for job in catalog.jobs] == ["J1"]
@@ -0,0 +1,103 @@
+import json
+from pathlib import Path
+
+from app.services.catalog_service import JobCatalog
+from app.services.facet_service import FacetIndex, salary_bands
+from app.services.matching_service import filter_jobs
+
+JOBS_PATH = Path(__file__).parent.parent / "data" / "mock_jobs.json"
+
+
+def _load_jobs():
+    with open(JOBS_PATH) as f:
+        return json.load(f)
+
+
+def _brute_force(jobs):
+    facets = {"location": {}, "job_type": {}, "salary_band": {}}
+    for job in jobs:
+        for field, values in (
+            ("location", [job["location"]]),
+            ("job_type", [job["job_type"]]),
+            ("salary_band", salary_bands(job["salary_range"])),
+        ):
+            for value in values:
+                facets[field][value] = facets[field].get(value, 0) + 1
+    return facets
+
+
+def test_salary_bands_overlap():
+    assert salary_bands([600000, 1000000]) == ["6-10L", "10-15L"]
+    assert salary_bands([350000, 590000]) == ["0-6L"]
+    assert salary_bands([1500000, 2500000]) == ["15-20L", "20L+"]
+    assert salary_bands(None) == []
+
+
+def test_counts_for_whole_catalog():
+    jobs = _load_jobs()
+    index = FacetIndex(JobCatalog(jobs))
+
+    assert index.counts() == _brute_force(jobs)
+    assert list(index.counts()["salary_band"]) == ["0-6L", "6-10L", "10-15L", "15-20L", "20L+"]
+
+
+def test_counts_for_result_subset():
+    jobs = _load_jobs()
+    index = FacetIndex(JobCatalog(jobs))
+    subset = [job for job in jobs if "Python" in job["required_skills"]]
+
+    counts = index.counts(index.result_bits(job["job_id"] for job in subset))
+
+    assert counts == _brute_force(subset)
+
+
+def test_counts_follow_catalog_changes():
+    jobs = _load_jobs()
+    catalog = JobCatalog(jobs)
+    index = FacetIndex(catalog)
+
+    catalog.remove_job(jobs[0]["job_id"])
+    catalog.add_job(dict(jobs[1], job_id="J999", location="Kochi"))
+
+    assert index.counts() == _brute_force(catalog.jobs)
+    assert index.counts()["location"]["Kochi"] == 1
+
+
+def test_filter_bits_match_filter_jobs():
+    jobs = _load_jobs()
+    catalog = JobCatalog(jobs)
+    index = FacetIndex(catalog)
+
+    for location, min_salary, max_salary in [
+        (None, None, None),
+        ("bangalore", None, None),
+        ("Pune", 1000000, None),
+        (None, None, 800000),
+        ("Hyderabad", 600000, 1500000),
+        (None, 99000000, None),
+    ]:
+        expected = filter_jobs(jobs, location, min_salary, max_salary)
+        bits = index.filter_bits(location, min_salary, max_salary)
+        assert index.counts(bits) == _brute_force(expected)
+
+
+def test_filter_bits_follow_catalog_changes():
+    jobs = _load_jobs()
+    catalog = JobCatalog(jobs)
+    index = FacetIndex(catalog)
+    index.filter_bits(min_salary=5000000)
+
+    catalog.add_job(dict(jobs[0], job_id="J999", location="Kochi", salary_range=[5000000, 6000000]))
+
+    bits = index.filter_bits("kochi", 5000000, None)
+    assert index.counts(bits)["location"] == {"Kochi": 1}
+
+
+def test_malformed_salary_range_is_unknown():
+    catalog = JobCatalog(_load_jobs()[:2])
+    index = FacetIndex(catalog)
+
+    catalog.add_job({"job_id": "ODD", "title": "Odd", "location": "Kochi", "salary_range": [5]})
+
+    assert index.counts(index.filter_bits("kochi", None, None))["location"].get("Kochi") == 1
+    assert "Kochi" not in index.counts(index.filter_bits("kochi", 1, None))["location"]
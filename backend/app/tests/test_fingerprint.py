@@ -0,0 +1,120 @@
+import json
+
+from app.services.fingerprint_service import (
+    ResumeFingerprintIndex,
+    content_hash,
+    hamming,
+    index_uploads,
+    simhash,
+    text_hash,
+)
+from app.services.upload_store import UploadStore
+
+RESUME = """John Doe
+john.doe@example.com | +91-9876543210
+SKILLS: Python, FastAPI, React, Docker, PostgreSQL
+EXPERIENCE
+Software Engineer Intern, Acme Technologies (Jan 2024 - Jun 2024)
+- Built REST APIs with FastAPI and PostgreSQL for internal dashboards
+- Containerized services with Docker and set up CI pipelines
+EDUCATION
+B.Tech Computer Science, NIT Trichy 2020 - 2024, CGPA 8.4
+"""
+
+
+def _record(file_id, text, data=b"x"):
+    return {
+        "file_id": file_id,
+        "extension": ".pdf",
+        "size": len(data),
+        "content_hash": content_hash(data),
+        "text_hash": text_hash(text),
+        "simhash": simhash(text),
+        "duplicate_of": None,
+    }
+
+
+def test_text_hash_ignores_layout():
+    assert text_hash(RESUME) == text_hash(RESUME.replace("\n", "   \n\n").upper())
+
+
+def test_simhash_is_close_for_small_edits():
+    edited = RESUME.replace("Python,", "Python, Python3,")
+    unrelated = "Jane Roe, chef. Pastry, bread, sauces, menu planning, kitchen management in Paris."
+
+    assert hamming(simhash(RESUME), simhash(edited)) <= 3
+    assert hamming(simhash(RESUME), simhash(unrelated)) > 10
+
+
+def test_index_lookups():
+    index = ResumeFingerprintIndex()
+    index.add(_record("f1", RESUME, b"pdf-bytes"))
+
+    assert index.find_exact(content_hash(b"pdf-bytes"))["file_id"] == "f1"
+    assert index.find_same_text(text_hash(RESUME))["file_id"] == "f1"
+
+    record, distance = index.find_near(simhash(RESUME.replace("Python,", "Python, Python3,")))
+    assert record["file_id"] == "f1"
+    assert distance <= 3
+    assert index.find_near(simhash("completely different document text")) is None
+
+
+def test_index_persists_and_tracks_savings(tmp_path):
+    path = tmp_path / "fingerprints.jsonl"
+    index = ResumeFingerprintIndex(path)
+    index.add(_record("f1", RESUME), parsed={"name": "John Doe", "email": "john.doe@example.com"})
+    index.record_saving("exact", 1000, parse_reused=True)
+
+    reloaded = ResumeFingerprintIndex(path)
+
+    assert reloaded.parsed(reloaded.get("f1"))["name"] == "John Doe"
+    assert "john.doe@example.com" not in path.read_text()
+    assert index.stats()["parses_saved"] == 1
+    assert index.stats()["bytes_saved"] == 1000
+
+
+def test_forget_drops_records_and_rewrites_log(tmp_path):
+    path = tmp_path / "fingerprints.jsonl"
+    index = ResumeFingerprintIndex(path)
+    index.add(_record("f1", RESUME, b"a"))
+    index.add(_record("f2", "Jane Roe, chef. Pastry and bread.", b"b"))
+
+    assert index.forget(["f1", "missing"]) == 1
+    assert index.find_exact(content_hash(b"a")) is None
+    assert index.find_near(simhash(RESUME)) is None
+    assert len(ResumeFingerprintIndex(path)) == 1
+
+
+def test_legacy_records_move_parse_out_of_the_log(tmp_path):
+    path = tmp_path / "fingerprints.jsonl"
+    path.write_text(json.dumps(dict(_record("f1", RESUME), parsed={"email": "john.doe@example.com"})) + "\n")
+
+    index = ResumeFingerprintIndex(path)
+
+    assert index.parsed(index.get("f1")) == {"email": "john.doe@example.com"}
+    assert "john.doe@example.com" not in path.read_text()
+    assert index.forget(["f1"]) == 1
+    assert not (tmp_path / "parses" / "f1.json").exists()
+
+
+class _TextParser:
+    """Resumes stored as plain text, so the backfill needs no PDF fixtures"""
+
+    def extract_text(self, content, filename):
+        return content.decode()
+
+    def parse_text(self, text):
+        return {"name": text.split("\n")[0]}
+
+
+def test_backfill_fingerprints_upload_store_files(tmp_path):
+    store = UploadStore(tmp_path / "uploads")
+    store.put("f1", RESUME.encode(), "resume.pdf")
+    store.put("f2", b"Jane Roe, chef", "cv.docx")
+    index = ResumeFingerprintIndex(tmp_path / "uploads" / "fingerprints.jsonl")
+    index.add(_record("f2", "Jane Roe, chef", b"Jane Roe, chef"))
+
+    assert index_uploads(store, index, _TextParser()) == 1
+    assert index.find_exact(content_hash(RESUME.encode()))["file_id"] == "f1"
+    assert index.parsed(index.get("f1")) == {"name": "John Doe"}
+    assert index_uploads(store, index, _TextParser()) == 0
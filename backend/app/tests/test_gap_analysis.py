@@ -121,3 +121,246 @@ def test_roadmap_has_reasoning_and_resources():
     assert "reasoning" in phase
     assert "resources" in phase
     assert isinstance(phase["resources"], list)
+
+
+def test_roadmap_schedules_every_missing_skill():
+    missing = ["Kubernetes", "Docker", "Linux", "AWS", "Redis", "MongoDB", "FastAPI", "Python", "GraphQL"]
+
+    roadmap = generate_learning_roadmap(missing, ["JavaScript"])
+
+    scheduled = [s for phase in roadmap for s in phase["skills_to_learn"]]
+    assert sorted(scheduled) == sorted(missing)
+    assert [phase["phase"] for phase in roadmap] == list(range(1, len(roadmap) + 1))
+
+
+def test_roadmap_respects_transitive_prerequisites():
+    missing = ["Kubernetes", "Linux", "Docker"]
+
+    roadmap = generate_learning_roadmap(missing, [])
+
+    phase_of = {s: phase["phase"] for phase in roadmap for s in phase["skills_to_learn"]}
+    assert phase_of["Linux"] < phase_of["Docker"] < phase_of["Kubernetes"]
+
+
+def test_roadmap_is_memoized():
+    from app.services.gap_service import _schedule
+
+    generate_learning_roadmap(["Docker", "Redis"], ["Python"])
+    hits = _schedule.cache_info().hits
+    roadmap = generate_learning_roadmap(["redis", "docker"], ["python"])
+
+    assert _schedule.cache_info().hits == hits + 1
+    assert sorted(roadmap[0]["skills_to_learn"]) == ["docker", "redis"]
+
+
+def test_learning_time_is_case_insensitive():
+    result = analyze_skill_gap([], ["kubernetes", "Redis"])
+
+    assert result["estimated_learning_time_months"] == 5
+
+
+def test_skill_dag_order_and_cycles():
+    from app.services.gap_service import SKILL_DAG, SkillDAG
+
+    for skill, prerequisites in SKILL_DAG.prerequisites.items():
+        assert all(SKILL_DAG.position[p] < SKILL_DAG.position[skill] for p in prerequisites)
+    assert SKILL_DAG.ancestors["kubernetes"] == {"docker", "linux"}
+    assert "python" in SKILL_DAG.ancestors["django"]  # from the taxonomy
+
+    with pytest.raises(ValueError):
+        SkillDAG({"A": {"prerequisites": ["B"]}, "B": {"prerequisites": ["A"]}}, {}, {})
+
+
+# -----------------------------
+# Tests for analyze_catalog_gap
+# -----------------------------
+
+def _catalog():
+    import json
+    from pathlib import Path
+    from app.services.catalog_service import JobCatalog
+
+    with open(Path(__file__).parent.parent / "data" / "mock_jobs.json") as f:
+        return JobCatalog(json.load(f))
+
+
+def test_catalog_gap_matches_per_job_analysis():
+    from app.services.gap_service import analyze_catalog_gap
+
+    catalog = _catalog()
+    current = ["Python", "FastAPI", "PostgreSQL"]
+
+    result = analyze_catalog_gap(current, catalog, limit=len(catalog))
+
+    assert result["jobs_considered"] == len(catalog)
+    for entry in result["closest_jobs"]:
+        job = catalog.get(entry["job_id"])
+        expected = analyze_skill_gap(current, job["required_skills"])
+        assert entry["missing_skills"] == expected["missing_skills"]
+        assert entry["gap_months"] == expected["estimated_learning_time_months"]
+        assert entry["readiness_score"] == expected["readiness_score"]
+
+    gaps = [entry["gap_months"] for entry in result["closest_jobs"]]
+    assert gaps == sorted(gaps)
+
+
+def test_catalog_gap_unlock_counts():
+    from app.services.gap_service import analyze_catalog_gap
+
+    catalog = _catalog()
+    current = ["Python", "FastAPI", "PostgreSQL", "React"]
+
+    result = analyze_catalog_gap(current, catalog, skills_limit=100)
+
+    current_set = {s.lower() for s in current}
+    expected = {}
+    for job in catalog.jobs:
+        job_missing = {s.lower() for s in job["required_skills"]} - current_set
+        if len(job_missing) == 1:
+            skill = job_missing.pop()
+            expected[skill] = expected.get(skill, 0) + 1
+
+    unlocked = {s["skill"].lower(): s["jobs_unlocked"] for s in result["skills_to_learn"] if s["jobs_unlocked"]}
+    assert unlocked == expected
+    counts = [s["jobs_unlocked"] for s in result["skills_to_learn"]]
+    assert counts == sorted(counts, reverse=True)
+    assert all(s["skill"].lower() not in current_set for s in result["skills_to_learn"])
+
+
+# -----------------------------
+# Tests for optimize_learning_path
+# -----------------------------
+
+def test_optimized_path_is_feasible():
+    from app.services.gap_service import optimize_learning_path, SKILL_DAG
+
+    catalog = _catalog()
+    current = ["Python", "FastAPI"]
+
+    for budget in (2, 4, 6, 10, 24):
+        result = optimize_learning_path(current, catalog, budget)
+        chosen = [s["skill"].lower() for s in result["skills_to_learn"]]
+
+        assert result["months_used"] <= budget
+        assert result["months_used"] == sum(s["learning_months"] for s in result["skills_to_learn"])
+        assert result["jobs_unlocked"] == result["value_unlocked"] == len(result["unlocked_jobs"])
+
+        known = {s.lower() for s in current} | set(chosen)
+        for job_id in result["unlocked_jobs"]:
+            assert {s.lower() for s in catalog.get(job_id)["required_skills"]} <= known
+
+        # Prerequisites are learned before the skills that need them
+        for i, skill in enumerate(chosen):
+            for prerequisite in SKILL_DAG.prerequisites.get(skill, ()):
+                if prerequisite not in {s.lower() for s in current}:
+                    assert prerequisite in chosen[:i]
+
+
+def test_optimized_path_prefers_payoff():
+    from app.services.catalog_service import JobCatalog
+    from app.services.gap_service import optimize_learning_path
+
+    catalog = JobCatalog([
+        {"job_id": "A", "required_skills": ["Redis"], "salary_range": [100, 100]},
+        {"job_id": "B", "required_skills": ["Redis", "Python"], "salary_range": [100, 100]},
+        {"job_id": "C", "required_skills": ["MongoDB"], "salary_range": [5000, 5000]},
+        {"job_id": "D", "required_skills": ["Kubernetes"], "salary_range": [100, 100]},
+    ])
+
+    by_count = optimize_learning_path(["Python"], catalog, budget_months=2)
+    assert by_count["unlocked_jobs"] == ["A", "B"]
+
+    by_salary = optimize_learning_path(["Python"], catalog, budget_months=2, objective="salary")
+    assert by_salary["unlocked_jobs"] == ["C"]
+
+    # Kubernetes needs Docker and Linux first: 8 months in total
+    bundled = optimize_learning_path(["Python", "Redis", "MongoDB"], catalog, budget_months=8)
+    assert [s["skill"] for s in bundled["skills_to_learn"]] == ["Linux", "Docker", "Kubernetes"]
+    assert bundled["unlocked_jobs"] == ["D"]
+    assert optimize_learning_path(["Python"], catalog, budget_months=1)["unlocked_jobs"] == ["A", "B"]
+
+
+def test_bundle_gain_counts_jobs_its_prerequisites_unlock():
+    from app.services.catalog_service import JobCatalog
+    from app.services.gap_service import optimize_learning_path
+
+    # Docker drags Linux in, which alone unlocks L1: 4 jobs for 4 months,
+    # better than Airflow's 2 jobs for 2 months plus Linux's 1 for 2
+    catalog = JobCatalog(
+        [{"job_id": f"D{i}", "required_skills": ["Docker"]} for i in range(3)]
+        + [{"job_id": "L1", "required_skills": ["Linux"]}]
+        + [{"job_id": f"A{i}", "required_skills": ["Airflow"]} for i in range(2)]
+    )
+
+    result = optimize_learning_path([], catalog, budget_months=4)
+
+    assert result["unlocked_jobs"] == ["D0", "D1", "D2", "L1"]
+
+
+def test_jobs_missing_many_skills_still_unlock():
+    from app.services.catalog_service import JobCatalog
+    from app.services.gap_service import optimize_learning_path, MAX_BUNDLE_SKILLS
+
+    skills = [f"s{i}" for i in range(MAX_BUNDLE_SKILLS + 1)]
+    catalog = JobCatalog(
+        [{"job_id": "BIG", "required_skills": skills}]
+        + [{"job_id": f"J{i}", "required_skills": [skill]} for i, skill in enumerate(skills)]
+    )
+
+    result = optimize_learning_path([], catalog, budget_months=2 * len(skills))
+
+    assert len(result["skills_to_learn"]) == len(skills)
+    assert result["jobs_unlocked"] == len(skills) + 1
+    assert "BIG" in result["unlocked_jobs"]
+
+
+# -----------------------------
+# Tests for analyze_cohort
+# -----------------------------
+
+def test_cohort_rows_match_individual_analysis():
+    import random
+    from app.services.gap_service import analyze_cohort
+
+    rng = random.Random(7)
+    pool = ["Python", "Docker", "AWS", "React", "Redis", "Linux", "SQL"]
+    target = ["Python", "Docker", "AWS", "Redis"]
+    profiles = [
+        {"profile_id": f"s-{i}", "skills": rng.sample(pool, rng.randint(0, 5))}
+        for i in range(200)
+    ]
+
+    rows = list(analyze_cohort(profiles, target))
+    groups = {r["gap_group"]: r for r in rows if r["type"] == "group"}
+    students = [r for r in rows if r["type"] == "profile"]
+    summary = rows[-1]
+
+    assert [r["profile_id"] for r in students] == [p["profile_id"] for p in profiles]
+    for profile, row in zip(profiles, students):
+        expected = analyze_skill_gap(profile["skills"], target)
+        assert row["missing_skills"] == expected["missing_skills"]
+        assert row["readiness_score"] == expected["readiness_score"]
+        assert groups[row["gap_group"]]["missing_skills"] == row["missing_skills"]
+
+    # One group (and roadmap) per distinct gap set
+    assert len(groups) == len({tuple(r["missing_skills"]) for r in students}) == summary["gap_groups"]
+
+    assert summary["type"] == "summary"
+    assert summary["profiles"] == 200
+    for skill in target:
+        assert summary["missing_skill_histogram"][skill] == sum(skill in r["missing_skills"] for r in students)
+    average = sum(r["readiness_score"] for r in students) / len(students)
+    assert abs(summary["average_readiness"] - average) < 0.1
+
+
+def test_cohort_groups_emitted_before_their_profiles():
+    from app.services.gap_service import analyze_cohort
+
+    rows = list(analyze_cohort(
+        [{"profile_id": "a", "skills": ["python"]}, {"profile_id": "b", "skills": ["Python3"]}],
+        ["Python", "Docker"]
+    ))
+
+    assert [r["type"] for r in rows] == ["group", "profile", "profile", "summary"]
+    assert rows[0]["missing_skills"] == ["Docker"]
+    assert rows[0]["learning_roadmap"][0]["skills_to_learn"] == ["Docker"]
@@ -0,0 +1,17 @@
+import pytest
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/api/skills/analyze/catalog", {"current_skills": ["Python"], "limit": True}),
+    ("/api/skills/analyze/catalog", {"current_skills": ["Python"], "skills_limit": False}),
+    ("/api/skills/optimize", {"current_skills": ["Python"], "budget_months": True}),
+])
+def test_booleans_are_not_counts(client, path, body):
+    response = client.post(path, json=body)
+
+    assert response.status_code == 400
+
+
+def test_counts_still_accepted(client):
+    assert client.post("/api/skills/analyze/catalog", json={"current_skills": ["Python"], "limit": 1}).status_code == 200
+    assert client.post("/api/skills/optimize", json={"current_skills": ["Python"], "budget_months": 3}).status_code == 200
@@ -0,0 +1,32 @@
+from app.services.http_cache import CACHE_CONTROL, cache_headers, etag_matches, make_etag, not_modified
+
+
+def test_etag_is_strong_and_deterministic():
+    etag = make_etag("v1", "search", ("python",), None)
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag("v1", "search", ("python",), None)
+    assert etag != make_etag("v2", "search", ("python",), None)
+    assert etag != make_etag("v1", "search", ("docker",), None)
+
+
+def test_if_none_match_parsing():
+    etag = make_etag("v1")
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(etag.strip('"'), etag)
+
+
+def test_not_modified_response():
+    etag = make_etag("v1")
+    response = not_modified(etag)
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == CACHE_CONTROL
+    assert cache_headers(etag, {"X-Resolved-Skills": "a=b"})["X-Resolved-Skills"] == "a=b"
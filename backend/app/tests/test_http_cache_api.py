@@ -0,0 +1,46 @@
+import pytest
+
+
+def _ingest(client, job):
+    response = client.post("/api/jobs/ingest", json={"jobs": [job]})
+    assert response.json()["added"] == [job["job_id"]]
+
+
+@pytest.mark.parametrize("path, job", [
+    ("/api/jobs/search?skills=Python,Docker",
+     {"job_id": "ETAG1", "title": "Platform Engineer", "description": "Run Kubernetes clusters on bare metal",
+      "required_skills": ["Python", "Docker"]}),
+    ("/api/jobs/search?skills=Python&facets=true&fields=all",
+     {"job_id": "ETAG2", "title": "Data Analyst", "description": "Build weekly sales dashboards in Excel",
+      "required_skills": ["Python", "SQL"]}),
+    ("/api/jobs/J001/match?skills=Python",
+     {"job_id": "ETAG3", "title": "Firmware Developer", "description": "Write embedded C for sensor boards",
+      "required_skills": ["C"]}),
+    ("/api/skills/available",
+     {"job_id": "ETAG4", "title": "Quantum Researcher", "description": "Prototype algorithms on qubit hardware",
+      "required_skills": ["Qiskit"]}),
+])
+def test_revalidation_then_catalog_change(client, path, job):
+    first = client.get(path)
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+
+    revalidated = client.get(path, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["ETag"] == etag
+
+    _ingest(client, job)
+
+    changed = client.get(path, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()
+
+
+def test_padded_location_filters_like_its_cache_key(client):
+    padded = client.get("/api/jobs/search?skills=Python&location=%20Pune%20").json()
+    plain = client.get("/api/jobs/search?skills=Python&location=pune").json()
+
+    assert any(job["location"] == "Pune" for job in padded)
+    assert [job["job_id"] for job in padded] == [job["job_id"] for job in plain]
@@ -0,0 +1,47 @@
+import pytest
+
+from app.services.job_views import COMPACT_FIELDS, parse_fields, project_jobs
+
+JOB = {
+    "job_id": "J001",
+    "title": "Backend Developer",
+    "company": "TechCorp India",
+    "location": "Bangalore",
+    "salary_range": [600000, 1000000],
+    "required_skills": ["Python"],
+    "description": "A long description",
+    "match_score": 72.0,
+}
+
+
+def test_default_is_compact_view():
+    assert parse_fields(None) == COMPACT_FIELDS
+    assert project_jobs([JOB], parse_fields("")) == [{
+        "job_id": "J001",
+        "title": "Backend Developer",
+        "company": "TechCorp India",
+        "location": "Bangalore",
+        "salary_range": [600000, 1000000],
+        "match_score": 72.0,
+    }]
+
+
+def test_extra_columns_added_to_default():
+    assert parse_fields(None, extra=("search_score", "job_id")) == COMPACT_FIELDS + ("search_score",)
+
+
+def test_explicit_fields_keep_order_and_skip_missing():
+    columns = parse_fields("title, job_id,title,text_score")
+
+    assert columns == ("title", "job_id", "text_score")
+    assert project_jobs([JOB], columns) == [{"title": "Backend Developer", "job_id": "J001"}]
+
+
+def test_all_returns_full_records():
+    assert parse_fields("all") is None
+    assert project_jobs([JOB], None) == [JOB]
+
+
+def test_unknown_fields_rejected():
+    with pytest.raises(ValueError, match="secret"):
+        parse_fields("job_id,secret")
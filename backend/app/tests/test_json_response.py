@@ -0,0 +1,66 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas import GapAnalysisResponse, JobPosting, ParseResumeResponse
+from app.services import json_response
+from app.services.gap_service import analyze_skill_gap, generate_learning_roadmap
+from app.services.json_response import FastJSONResponse, dumps
+
+CONTENT = {"jobs": [{"job_id": "J1", "title": "Dev", "salary_range": [1, 2], "match_score": 87.5}], "name": "Ünïcode"}
+
+
+@pytest.fixture(params=["orjson", "pydantic-core"])
+def renderer(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_response, "orjson", None)
+    return request.param
+
+
+def test_dumps_matches_stdlib(renderer):
+    assert json.loads(dumps(CONTENT)) == CONTENT
+    assert dumps({"a": 1}) == b'{"a":1}'
+
+
+def test_dumps_handles_models_and_sets(renderer):
+    job = JobPosting(job_id="J1", title="Dev")
+
+    assert json.loads(dumps({"job": job, "tags": {"x"}})) == {"job": job.model_dump(), "tags": ["x"]}
+
+
+def test_response_renders_bytes():
+    response = FastJSONResponse(CONTENT, headers={"X-Test": "1"})
+
+    assert json.loads(response.body) == CONTENT
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["x-test"] == "1"
+
+
+def test_schemas_accept_service_output():
+    analysis = analyze_skill_gap(["Python"], ["Python", "Docker", "Kubernetes"])
+    roadmap = generate_learning_roadmap(analysis["missing_skills"], ["Python"])
+    response = GapAnalysisResponse(analysis=analysis, learning_roadmap=roadmap)
+
+    assert response.model_dump() == {"analysis": analysis, "learning_roadmap": roadmap}
+
+    parsed = ParseResumeResponse(
+        file_id="f1", original_filename="cv.pdf", name="A", email="", phone="", skills=["Python"],
+        education=[{"degree": "B.Tech", "field": "CS", "institution": "IIT", "year": "", "percentage": 81.0}],
+        experience=[], confidence_scores={"name": 0.9}
+    )
+    assert parsed.education[0].percentage == 81.0
+
+
+def test_job_posting_keeps_ingested_shapes():
+    job = {"job_id": "J1", "title": "Dev", "salary_range": [6.5, 10], "experience_required": 2, "team": "ML"}
+
+    assert JobPosting.model_validate(job).model_dump(exclude_unset=True) == job
+
+
+@pytest.mark.parametrize("salary_range", [[5], [1, 2, 3]])
+def test_job_posting_rejects_partial_salary_range(salary_range):
+    with pytest.raises(ValidationError):
+        JobPosting.model_validate({"job_id": "J1", "title": "Dev", "salary_range": salary_range})
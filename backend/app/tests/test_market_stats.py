@@ -0,0 +1,100 @@
+import json
+import statistics
+from pathlib import Path
+
+import pytest
+
+from app.services.catalog_service import JobCatalog
+from app.services.market_stats import MarketStats
+from app.services.gap_service import generate_learning_roadmap
+
+JOBS_PATH = Path(__file__).parent.parent / "data" / "mock_jobs.json"
+
+
+@pytest.fixture
+def jobs():
+    with open(JOBS_PATH) as f:
+        return json.load(f)
+
+
+def _brute_force(catalog):
+    counts, salaries, pairs = {}, {}, {}
+    for job in catalog.jobs:
+        skills = set(s.lower() for s in job["required_skills"])
+        midpoint = sum(job["salary_range"]) / 2
+        for skill in skills:
+            counts[skill] = counts.get(skill, 0) + 1
+            salaries.setdefault(skill, []).append(midpoint)
+            for other in skills - {skill}:
+                pairs[(skill, other)] = pairs.get((skill, other), 0) + 1
+    return counts, salaries, pairs
+
+
+def _assert_matches_catalog(stats, catalog):
+    counts, salaries, pairs = _brute_force(catalog)
+    assert len(stats.top_skills(limit=1000)) == len(counts)
+    for skill, n in counts.items():
+        row = stats.skill_stats(skill, related_limit=1000)
+        assert row["job_count"] == n
+        assert row["salary_median"] == pytest.approx(statistics.median(salaries[skill]))
+        assert row["salary_weighted_demand"] == pytest.approx(sum(salaries[skill]))
+        related = {r["skill"].lower(): r["jobs"] for r in row["often_required_with"]}
+        assert related == {o: c for (s, o), c in pairs.items() if s == skill}
+
+
+def test_stats_match_catalog(jobs):
+    catalog = JobCatalog(jobs)
+    _assert_matches_catalog(MarketStats(catalog), catalog)
+
+
+def test_percentiles_interpolate():
+    catalog = JobCatalog([
+        {"job_id": f"J{i}", "title": "Dev", "required_skills": ["Go"], "salary_range": [s, s]}
+        for i, s in enumerate([100, 200, 300, 400, 500])
+    ])
+    row = MarketStats(catalog).skill_stats("go")
+
+    assert (row["salary_p25"], row["salary_median"], row["salary_p75"]) == (200, 300, 400)
+    assert row["share_of_jobs"] == 100.0
+
+
+def test_top_skills_sorting(jobs):
+    catalog = JobCatalog(jobs)
+    stats = MarketStats(catalog)
+    counts, salaries, _ = _brute_force(catalog)
+
+    by_count = [r["skill"].lower() for r in stats.top_skills(limit=5)]
+    assert by_count == sorted(counts, key=lambda s: (-counts[s], s))[:5]
+
+    by_salary = [r["skill"].lower() for r in stats.top_skills(limit=5, sort="salary")]
+    assert by_salary == sorted(counts, key=lambda s: (-sum(salaries[s]), -counts[s], s))[:5]
+
+
+def test_incremental_updates(jobs):
+    catalog = JobCatalog(jobs)
+    stats = MarketStats(catalog)
+
+    catalog.add_job({
+        "job_id": "JQ1", "title": "Quantum Engineer",
+        "required_skills": ["Qiskit", "Python"], "salary_range": [2000000, 3000000]
+    })
+    assert stats.skill_stats("qiskit")["often_required_with"] == [{"skill": "Python", "jobs": 1}]
+    _assert_matches_catalog(stats, catalog)
+
+    catalog.remove_job("JQ1")
+    assert stats.skill_stats("qiskit") is None
+    assert stats.count("Qiskit") == 0
+
+    for job in jobs[:5]:
+        catalog.remove_job(job["job_id"])
+    _assert_matches_catalog(stats, catalog)
+
+
+def test_roadmap_prefers_in_demand_skills():
+    missing = ["Git", "SQL", "Docker"]
+
+    plain = generate_learning_roadmap(missing, [])
+    assert plain[0]["skills_to_learn"] == ["Docker", "Git", "SQL"]
+
+    ranked = generate_learning_roadmap(missing, [], demand={"sql": 9, "git": 4})
+    assert ranked[0]["skills_to_learn"] == ["SQL", "Git", "Docker"]
@@ -0,0 +1,98 @@
+import json
+import random
+from pathlib import Path
+
+from app.services.catalog_service import JobCatalog
+from app.services.match_session import MatchSession, MatchSessionStore
+from app.services.matching_service import rank_jobs
+
+JOBS_PATH = Path(__file__).parent.parent / "data" / "mock_jobs.json"
+
+
+def _catalog():
+    with open(JOBS_PATH) as f:
+        return JobCatalog(json.load(f))
+
+
+def _expected(catalog, skills, experience=0, **filters):
+    ranked = rank_jobs(sorted(skills), [j.copy() for j in catalog.jobs], experience, **filters)
+    return [(j["job_id"], j["match_score"]) for j in ranked]
+
+
+def _actual(session, limit=100):
+    return [(j["job_id"], j["match_score"]) for j in session.top(limit)]
+
+
+def test_initial_ranking_matches_rank_jobs():
+    catalog = _catalog()
+    session = MatchSession(catalog, ["Python", "React", "Docker"], experience_years=1)
+
+    assert _actual(session) == _expected(catalog, {"python", "react", "docker"}, 1)
+
+
+def test_skill_delta_only_rescores_affected_jobs():
+    catalog = _catalog()
+    session = MatchSession(catalog, ["Python"])
+
+    updated = session.apply_delta(add=["Kubernetes"])
+
+    assert updated == len([j for j in catalog.jobs if "Kubernetes" in j["required_skills"]])
+    assert _actual(session) == _expected(catalog, {"python", "kubernetes"})
+
+
+def test_blank_skills_are_ignored():
+    catalog = _catalog()
+    session = MatchSession(catalog, ["Python"])
+
+    assert session.apply_delta(add=["", "   "], remove=[" "]) == 0
+    assert session.skills == {"python"}
+    assert _actual(session) == _expected(catalog, {"python"})
+
+
+def test_non_positive_limit_returns_nothing():
+    session = MatchSession(_catalog(), ["Python"])
+
+    assert session.top(0) == []
+    assert session.top(-5) == []
+
+
+def test_random_edits_stay_consistent_with_full_rescore():
+    catalog = _catalog()
+    vocabulary = sorted({s for j in catalog.jobs for s in j["required_skills"]})
+    rng = random.Random(7)
+    session = MatchSession(catalog, [], location_preference="Bangalore")
+    skills = set()
+
+    for _ in range(40):
+        skill = rng.choice(vocabulary)
+        if skill.lower() in skills:
+            session.apply_delta(remove=[skill])
+            skills.discard(skill.lower())
+        else:
+            session.apply_delta(add=[skill])
+            skills.add(skill.lower())
+
+        expected = _expected(catalog, skills, location_preference="Bangalore")
+        assert _actual(session) == expected
+        assert _actual(session, limit=5) == expected[:5]
+
+
+def test_catalog_change_triggers_rebuild():
+    catalog = _catalog()
+    session = MatchSession(catalog, ["Python"])
+    catalog.add_job({"job_id": "JX", "required_skills": ["Python"]})
+
+    session.apply_delta(add=["Rust"])
+
+    assert _actual(session) == _expected(catalog, {"python", "rust"})
+
+
+def test_session_store_is_bounded():
+    store = MatchSessionStore(max_sessions=2)
+    catalog = _catalog()
+    first = store.create(MatchSession(catalog, []))
+    store.create(MatchSession(catalog, []))
+    store.create(MatchSession(catalog, []))
+
+    assert store.get(first) is None
+    assert len(store) == 2
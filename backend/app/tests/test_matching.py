@@ -3,10 +3,13 @@ import pytest
 from app.services.matching_service import (
     calculate_match_score,
     rank_jobs,
+    rank_jobs_batch,
+    JobScoreMatrix,
     get_matching_insights,
     categorize_skills,
     load_skills_taxonomy
 )
+from app.services import matching_service
 
 # -----------------------------
 # calculate_match_score tests
@@ -98,6 +101,57 @@ def test_rank_jobs_salary_filter():
     assert ranked[0]["job_id"] == "J2"
 
 
+# -----------------------------
+# batch matching tests
+# -----------------------------
+
+BATCH_JOBS = [
+    {"job_id": "J1", "title": "Backend", "required_skills": ["Python", "FastAPI", "Docker", "AWS"]},
+    {"job_id": "J2", "title": "Frontend", "required_skills": ["React", "JavaScript"]},
+    {"job_id": "J3", "title": "Empty", "required_skills": []},
+    {"job_id": "J4", "title": "Fullstack", "required_skills": ["React", "Python", "Docker"]},
+]
+
+
+def test_score_matrix_matches_calculate_match_score():
+    matrix = JobScoreMatrix(BATCH_JOBS)
+    candidate = ["python", "Docker", "React", "Go"]
+
+    for experience in (0, 1, 3):
+        row = matrix.score_row(candidate, experience)
+        expected = [
+            calculate_match_score(candidate, j["required_skills"], experience)
+            for j in BATCH_JOBS
+        ]
+        assert row == expected
+
+
+def test_rank_jobs_batch_streams_top_k_in_order():
+    candidates = [
+        {"id": "c1", "skills": ["React", "JavaScript"], "experience": 1},
+        {"id": "c2", "skills": ["Python", "Docker"], "experience": 0},
+    ]
+
+    results = list(rank_jobs_batch(candidates, BATCH_JOBS, top_k=2, processes=1))
+
+    assert [r["id"] for r in results] == ["c1", "c2"]
+    assert results[0]["matches"][0]["job_id"] == "J2"
+    assert len(results[1]["matches"]) == 2
+    assert results[1]["matches"][0]["match_score"] >= results[1]["matches"][1]["match_score"]
+
+
+def test_rank_jobs_batch_process_pool_matches_in_process():
+    candidates = [
+        {"id": i, "skills": ["Python", "React", "Docker", "AWS"][: i % 4 + 1], "experience": i % 3}
+        for i in range(20)
+    ]
+
+    serial = list(rank_jobs_batch(candidates, BATCH_JOBS, top_k=3, processes=1))
+    pooled = list(rank_jobs_batch(candidates, BATCH_JOBS, top_k=3, processes=2, chunk_size=3))
+
+    assert pooled == serial
+
+
 # -----------------------------
 # get_matching_insights tests
 # -----------------------------
@@ -134,7 +188,15 @@ def test_matching_insights_values():
 # taxonomy & categorization tests
 # -----------------------------
 
-def test_load_skills_taxonomy_fallback():
+def test_load_skills_taxonomy():
+    taxonomy = load_skills_taxonomy()
+
+    assert isinstance(taxonomy, dict)
+    assert "categories" in taxonomy
+
+
+def test_load_skills_taxonomy_fallback(monkeypatch, tmp_path):
+    monkeypatch.setattr(matching_service, "TAXONOMY_PATH", tmp_path / "missing.json")
     taxonomy = load_skills_taxonomy()
 
     assert isinstance(taxonomy, dict)
@@ -151,3 +213,52 @@ def test_categorize_skills():
     assert "Docker" in categorized["infrastructure"]
     assert "Git" in categorized["tools"]
     assert "SomeRandomSkill" in categorized["foundational"]
+
+
+def test_categorize_skills_fallback_format():
+    taxonomy = {"core_technical": ["Python"], "infrastructure": ["Docker"], "tools": ["Git"]}
+
+    categorized = categorize_skills(["python", "Docker", "Git", "Other"], taxonomy)
+
+    assert categorized["core"] == ["python"]
+    assert categorized["infrastructure"] == ["Docker"]
+    assert categorized["tools"] == ["Git"]
+    assert categorized["foundational"] == ["Other"]
+
+
+def test_related_credit_is_opt_in():
+    candidate = ["FastAPI"]
+    job = ["Python", "Docker"]
+
+    assert calculate_match_score(candidate, job) == calculate_match_score([], job) + 2.0
+    assert calculate_match_score(candidate, job, related_credit=True) > calculate_match_score(candidate, job)
+
+
+def test_related_credit_values():
+    job = ["Python", "Docker"]
+
+    # FastAPI requires Python: 0.8 of one of two skills (60%) and critical skills (15%)
+    exact = calculate_match_score(["FastAPI"], job)
+    assert calculate_match_score(["FastAPI"], job, related_credit=True) == round(exact + 0.4 * 60 + 0.4 * 15, 1)
+
+    # Exact matches are never double counted
+    assert calculate_match_score(["Python", "Django"], ["Python"], related_credit=True) == \
+        calculate_match_score(["Python", "Django"], ["Python"])
+
+
+def test_rank_jobs_expands_related_skills_once(monkeypatch):
+    calls = []
+    expand = matching_service.SKILL_GRAPH.expand
+    monkeypatch.setattr(matching_service.SKILL_GRAPH, "expand", lambda skills: calls.append(skills) or expand(skills))
+    jobs = [{"job_id": str(i), "required_skills": ["Python", "Docker"]} for i in range(5)]
+
+    ranked = rank_jobs(["FastAPI"], jobs, related_credit=True)
+
+    assert len(calls) == 1
+    assert ranked[0]["match_score"] == calculate_match_score(["FastAPI"], ["Python", "Docker"], related_credit=True)
+
+
+def test_matching_insights_related_skills():
+    insights = get_matching_insights(["Django"], {"required_skills": ["Python", "Docker"]})
+
+    assert insights["related_skills"] == {"Python": 0.8}
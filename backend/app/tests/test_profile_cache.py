@@ -0,0 +1,121 @@
+import time
+
+import pytest
+
+from app.services.profile_cache import ProfileCache
+from app.services.profile_store import ProfileStore
+
+
+def _profile(name, skills=("Python",)):
+    return {"name": name, "email": f"{name.lower()}@x.com", "skills": list(skills)}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ProfileStore(tmp_path / "profiles.db")
+    yield store
+    store.close()
+
+
+def test_read_through_and_hit_rate(store):
+    store.save("PROF_A", _profile("A"))
+    cache = ProfileCache(store, flush_interval=60)
+
+    assert cache.get("PROF_A") == _profile("A")
+    assert cache.get("PROF_A") is cache.get("PROF_A")
+    assert cache.get("PROF_NONE") is None
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 2)
+    assert stats["hit_rate"] == 0.5
+    cache.close()
+
+
+def test_saves_are_visible_before_flush_and_coalesced(store):
+    cache = ProfileCache(store, flush_interval=60)
+
+    cache.save("PROF_A", _profile("A", ["Go"]))
+    cache.save("PROF_A", _profile("A", ["Rust"]))
+    cache.save("PROF_B", _profile("B"))
+
+    assert cache.get("PROF_A")["skills"] == ["Rust"]
+    assert store.get("PROF_A") is None
+    assert cache.stats()["pending_writes"] == 2
+
+    assert cache.flush() == 2
+    assert store.get("PROF_A")["skills"] == ["Rust"]
+    assert store.profiles_with_skill("go") == []
+    assert cache.stats()["flushed_writes"] == 2
+    cache.close()
+
+
+def test_durable_save_is_committed_on_return(store):
+    cache = ProfileCache(store, flush_interval=60)
+
+    cache.save("PROF_A", _profile("A"))
+    cache.save("PROF_B", _profile("B"), durable=True)
+
+    # Earlier queued writes go out in the same transaction
+    assert store.get("PROF_A") == _profile("A")
+    assert store.get("PROF_B") == _profile("B")
+    assert cache.stats()["pending_writes"] == 0
+    cache.close()
+
+
+def test_background_flush(store):
+    cache = ProfileCache(store, flush_interval=0.01)
+    cache.save("PROF_A", _profile("A"))
+
+    deadline = time.time() + 5
+    while store.get("PROF_A") is None and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert store.get("PROF_A") == _profile("A")
+    assert cache.stats()["flushes"] >= 1
+    cache.close()
+
+
+def test_eviction_keeps_unflushed_profiles_readable(store):
+    cache = ProfileCache(store, max_entries=2, flush_interval=60)
+    for name in ("A", "B", "C"):
+        cache.save(f"PROF_{name}", _profile(name))
+
+    stats = cache.stats()
+    assert (stats["entries"], stats["evictions"]) == (2, 1)
+    assert cache.get("PROF_A") == _profile("A")
+    cache.close()
+
+
+def test_close_flushes_pending_writes(store):
+    cache = ProfileCache(store, flush_interval=60)
+    cache.save("PROF_A", _profile("A"))
+    cache.close()
+
+    assert store.get("PROF_A") == _profile("A")
+    with pytest.raises(RuntimeError):
+        cache.save("PROF_B", _profile("B"))
+
+
+def test_failed_flush_is_requeued(store):
+    class FlakyStore(ProfileStore):
+        fail = True
+
+        def save_many(self, profiles, durable=False):
+            if self.fail:
+                raise OSError("disk full")
+            return super().save_many(profiles, durable)
+
+    flaky = FlakyStore(store.db_path)
+    cache = ProfileCache(flaky, flush_interval=60)
+    cache.save("PROF_A", _profile("A"))
+
+    with pytest.raises(OSError):
+        cache.flush()
+    assert cache.stats()["pending_writes"] == 1
+    assert cache.stats()["flush_errors"] == 1
+
+    flaky.fail = False
+    assert cache.flush() == 1
+    assert store.get("PROF_A") == _profile("A")
+    cache.close()
+    flaky.close()
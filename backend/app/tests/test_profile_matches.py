@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.catalog_service import JobCatalog
+from app.services.profile_matches import MaterializedMatches, compute_profile_matches
+
+JOBS = [
+    {"job_id": "J1", "required_skills": ["Python", "Docker"]},
+    {"job_id": "J2", "required_skills": ["React"]},
+    {"job_id": "J3", "required_skills": ["Python"]},
+]
+
+
+def test_compute_profile_matches_includes_gap_analysis():
+    result = compute_profile_matches(["python"], 0, JobCatalog(JOBS), top_k=2)
+
+    assert [m["job"]["job_id"] for m in result["matches"]] == ["J3", "J1"]
+    assert result["matches"][1]["gap_analysis"]["missing_skills"] == ["Docker"]
+
+
+def test_materialized_matches_are_served_until_stale(tmp_path):
+    catalog = JobCatalog(JOBS)
+    store = MaterializedMatches(tmp_path, top_k=2)
+    store.refresh("PROF_A", ["python"], 0, catalog)
+
+    assert (tmp_path / "PROF_A.json").exists()
+    assert store.get("PROF_A", ["python"], 0, catalog)["recomputed"] is False
+
+    # Profile changed
+    assert store.get("PROF_A", ["react"], 0, catalog)["recomputed"] is True
+    assert store.get("PROF_A", ["react"], 0, catalog)["recomputed"] is False
+
+    # Catalog changed
+    catalog.add_job({"job_id": "J4", "required_skills": ["React", "Go"]})
+    assert store.get("PROF_A", ["react"], 0, catalog)["recomputed"] is True
+
+
+def test_materialized_matches_survive_restart(tmp_path):
+    catalog = JobCatalog(JOBS)
+    MaterializedMatches(tmp_path).refresh("PROF_A", ["python"], 1, catalog)
+
+    reloaded = MaterializedMatches(tmp_path).get("PROF_A", ["python"], 1, catalog)
+
+    assert reloaded["recomputed"] is False
+    assert reloaded["matches"][0]["job"]["job_id"] == "J3"
+
+
+def test_concurrent_refreshes_and_bounded_memory(tmp_path):
+    catalog = JobCatalog(JOBS)
+    store = MaterializedMatches(tmp_path, max_entries=2)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: store.refresh("PROF_A", ["python"], i % 3, catalog), range(32)))
+    for profile_id in ("PROF_B", "PROF_C"):
+        store.refresh(profile_id, ["react"], 0, catalog)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["PROF_A.json", "PROF_B.json", "PROF_C.json"]
+    assert list(store._memory) == ["PROF_B", "PROF_C"]
+
+
+def test_roadmaps_put_in_demand_skills_first(tmp_path):
+    catalog = JobCatalog([{"job_id": "J1", "required_skills": ["Python", "Airflow", "Bash"]}])
+    demand = {"airflow": 1, "bash": 5}
+    store = MaterializedMatches(tmp_path, demand_for=lambda skills: {s.lower(): demand[s.lower()] for s in skills})
+
+    match = store.refresh("PROF_A", ["python"], 0, catalog)["matches"][0]
+
+    assert match["learning_roadmap"][0]["skills_to_learn"] == ["Bash", "Airflow"]
@@ -0,0 +1,72 @@
+import json
+import threading
+
+from app.services.profile_store import ProfileStore
+
+PROFILE = {"name": "Asha", "email": "asha@x.com", "skills": ["Python", "k8s", "python"]}
+
+
+def test_save_get_roundtrip(tmp_path):
+    store = ProfileStore(tmp_path / "profiles.db")
+    store.save("PROF_ASHA", PROFILE)
+
+    assert store.get("PROF_ASHA") == PROFILE
+    assert store.get("PROF_NOBODY") is None
+    assert len(store) == 1
+
+
+def test_wal_mode(tmp_path):
+    store = ProfileStore(tmp_path / "profiles.db")
+
+    with store._connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_skill_rows_follow_saves(tmp_path):
+    store = ProfileStore(tmp_path / "profiles.db")
+    store.save("PROF_ASHA", PROFILE)
+
+    assert store.profiles_with_skill("Kubernetes") == ["PROF_ASHA"]
+    assert store.profiles_with_skill("python") == ["PROF_ASHA"]
+
+    store.save("PROF_ASHA", {**PROFILE, "skills": ["Go"]})
+    assert store.profiles_with_skill("python") == []
+    assert store.profiles_with_skill("go") == ["PROF_ASHA"]
+
+    assert store.delete("PROF_ASHA")
+    assert store.profiles_with_skill("go") == []
+    assert not store.delete("PROF_ASHA")
+
+
+def test_concurrent_saves_of_one_profile(tmp_path):
+    store = ProfileStore(tmp_path / "profiles.db", pool_size=4)
+
+    def save(i):
+        store.save("PROF_SAME", {"name": "Same", "email": "s@x.com", "skills": [f"Skill{i}"]})
+
+    threads = [threading.Thread(target=save, args=(i,)) for i in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Last writer wins as a whole: document and skill rows agree
+    saved = store.get("PROF_SAME")
+    skill = saved["skills"][0].lower()
+    assert store.profiles_with_skill(skill) == ["PROF_SAME"]
+    assert sum(len(store.profiles_with_skill(f"skill{i}")) for i in range(16)) == 1
+
+
+def test_import_directory_keeps_newer_rows(tmp_path):
+    (tmp_path / "PROF_X.json").write_text(json.dumps({"name": "X", "email": "x@y.com", "skills": ["Docker"]}))
+    (tmp_path / "PROF_Y.json").write_text(json.dumps({"name": "Y", "email": "y@y.com", "skills": ["Go"]}))
+    (tmp_path / "PROF_BAD.json").write_text("{not json")
+
+    store = ProfileStore(tmp_path / "profiles.db")
+    store.save("PROF_Y", {"name": "Y", "email": "y@y.com", "skills": ["Rust"]})
+
+    assert store.import_directory(tmp_path) == 1
+    assert store.get("PROF_X")["skills"] == ["Docker"]
+    assert store.get("PROF_Y")["skills"] == ["Rust"]
+    assert store.import_directory(tmp_path) == 0
+    assert [pid for pid, _ in store.iter_profiles()] == ["PROF_X", "PROF_Y"]
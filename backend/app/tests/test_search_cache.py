@@ -0,0 +1,147 @@
+import threading
+import time
+
+import pytest
+
+from app.services.catalog_service import JobCatalog
+from app.services.search_cache import SearchCache, canonicalize_query, normalize_location
+
+# -----------------------------
+# canonicalize_query tests
+# -----------------------------
+
+def test_equivalent_queries_share_a_key():
+    a = canonicalize_query(["React", "python", "Python", "JS"], 5, "Bangalore")
+    b = canonicalize_query(["javascript", "react", "python"], 2, " bangalore ")
+
+    assert a == b
+    assert a[0] == ("javascript", "python", "react")
+
+
+def test_blank_location_is_no_location():
+    assert normalize_location("  ") is None
+    assert canonicalize_query(["Python"], location_preference=" ") == canonicalize_query(["Python"])
+
+
+def test_filters_are_part_of_the_key():
+    base = canonicalize_query(["Python"])
+
+    assert canonicalize_query(["Python"], min_salary=500000) != base
+    assert canonicalize_query(["Python"], experience_years=1) != base
+
+
+# -----------------------------
+# SearchCache tests
+# -----------------------------
+
+def test_cache_hit_and_stats():
+    cache = SearchCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return [{"job_id": "J1", "match_score": 90.0}]
+
+    first = cache.get_or_compute(("k",), "v1", compute)
+    second = cache.get_or_compute(("k",), "v1", compute)
+
+    assert first == second
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+    assert stats["memory_bytes"] > 0
+
+
+def test_callers_get_their_own_list():
+    cache = SearchCache()
+    first = cache.get_or_compute(("k",), "v1", lambda: [{"job_id": "J1"}, {"job_id": "J2"}])
+    first.reverse()
+    del first[1:]
+
+    assert [j["job_id"] for j in cache.get_or_compute(("k",), "v1", list)] == ["J1", "J2"]
+
+
+def test_catalog_version_change_invalidates():
+    cache = SearchCache()
+    cache.get_or_compute(("k",), "v1", lambda: "old")
+
+    assert cache.get_or_compute(("k",), "v2", lambda: "new") == "new"
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_lru_eviction_and_ttl():
+    cache = SearchCache(max_entries=2, ttl_seconds=0.05)
+    cache.get_or_compute(("a",), "v", lambda: "a")
+    cache.get_or_compute(("b",), "v", lambda: "b")
+    cache.get_or_compute(("a",), "v", lambda: "a2")  # refresh a
+    cache.get_or_compute(("c",), "v", lambda: "c")   # evicts b
+
+    assert cache.get_or_compute(("a",), "v", lambda: "miss") == "a"
+    assert cache.get_or_compute(("b",), "v", lambda: "b2") == "b2"
+
+    time.sleep(0.06)
+    assert cache.get_or_compute(("b",), "v", lambda: "b3") == "b3"
+
+
+def test_single_flight_for_concurrent_misses():
+    cache = SearchCache()
+    started = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        time.sleep(0.05)
+        return "result"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute(("k",), "v", slow)))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+
+
+def test_failed_compute_releases_waiters():
+    cache = SearchCache()
+
+    with pytest.raises(ValueError):
+        cache.get_or_compute(("k",), "v", lambda: (_ for _ in ()).throw(ValueError("boom")))
+
+    assert cache.get_or_compute(("k",), "v", lambda: "ok") == "ok"
+
+
+# -----------------------------
+# JobCatalog tests
+# -----------------------------
+
+def test_catalog_version_tracks_changes():
+    catalog = JobCatalog([{"job_id": "J1", "required_skills": ["Python"]}])
+    v1 = catalog.version
+
+    catalog.add_job({"job_id": "J2", "required_skills": ["React"]})
+    v2 = catalog.version
+    catalog.remove_job("J2")
+
+    assert len({v1, v2, catalog.version}) == 3
+    assert catalog.get("J2") is None
+    assert [j["job_id"] for j in catalog.jobs] == ["J1"]
+    assert JobCatalog([{"job_id": "J1", "required_skills": ["Python"]}]).version == v1
+
+
+def test_catalog_version_depends_on_added_content():
+    a = JobCatalog([{"job_id": "J1", "required_skills": ["Python"]}])
+    b = JobCatalog([{"job_id": "J1", "required_skills": ["Python"]}])
+
+    a.add_job({"job_id": "J2", "required_skills": ["React"]})
+    b.add_job({"job_id": "J2", "required_skills": ["Vue"]})
+
+    assert a.version != b.version
@@ -0,0 +1,82 @@
+import json
+import math
+from pathlib import Path
+
+from app.services.catalog_service import JobCatalog
+from app.services.semantic_service import SemanticMatcher, blend_semantic_scores
+
+JOBS_PATH = Path(__file__).parent.parent / "data" / "mock_jobs.json"
+
+
+def _load_jobs():
+    with open(JOBS_PATH) as f:
+        return json.load(f)
+
+
+def test_job_vectors_are_unit_length():
+    matcher = SemanticMatcher(JobCatalog(_load_jobs()))
+    matcher.similarities("python")
+
+    norms = {}
+    for postings in matcher._columns.values():
+        for slot, weight in postings:
+            norms[slot] = norms.get(slot, 0.0) + weight * weight
+    assert norms
+    assert all(math.isclose(total, 1.0) for total in norms.values())
+
+
+def test_job_text_is_most_similar_to_itself():
+    jobs = _load_jobs()
+    matcher = SemanticMatcher(JobCatalog(jobs))
+
+    for job in jobs[:5]:
+        text = " ".join([job["title"], job["description"], " ".join(job["required_skills"])])
+        similarities = matcher.similarities(text)
+        assert math.isclose(similarities[job["job_id"]], 1.0)
+        assert max(similarities, key=similarities.get) == job["job_id"]
+
+
+def test_refits_when_catalog_changes():
+    jobs = _load_jobs()
+    catalog = JobCatalog(jobs[:10])
+    matcher = SemanticMatcher(catalog)
+    assert matcher.similarities("quantum qiskit") == {}
+
+    catalog.add_job({
+        "job_id": "JQ1",
+        "title": "Quantum Computing Researcher",
+        "description": "Research quantum algorithms",
+        "required_skills": ["Qiskit"]
+    })
+    similarities = matcher.similarities("quantum algorithms with qiskit")
+    assert max(similarities, key=similarities.get) == "JQ1"
+
+
+def test_fitted_eagerly_and_on_refresh():
+    catalog = JobCatalog(_load_jobs()[:10])
+    matcher = SemanticMatcher(catalog)
+    assert matcher._columns
+    assert matcher.refresh() is False
+
+    catalog.add_job({"job_id": "JQ1", "title": "Quantum Researcher", "required_skills": ["Qiskit"]})
+
+    assert matcher.refresh() is True
+    assert "qiskit" in matcher._idf
+
+
+def test_unrelated_text_has_no_similarity():
+    matcher = SemanticMatcher(JobCatalog(_load_jobs()))
+    assert matcher.similarities("zzzqqq") == {}
+
+
+def test_blend_semantic_scores():
+    ranked = [
+        {"job_id": "A", "match_score": 80},
+        {"job_id": "B", "match_score": 50},
+    ]
+    blended = blend_semantic_scores(ranked, {"B": 0.9}, semantic_weight=0.5)
+
+    assert [job["job_id"] for job in blended] == ["B", "A"]
+    assert blended[0]["semantic_score"] == 90.0
+    assert blended[0]["combined_score"] == 70.0
+    assert blended[1]["combined_score"] == 40.0
@@ -0,0 +1,13 @@
+import uuid
+
+
+def test_semantic_search_404s_when_the_upload_blob_is_gone(client):
+    from app import main
+
+    file_id = str(uuid.uuid4())
+    main.UPLOAD_STORE.put(file_id, f"resume {file_id}".encode(), "resume.pdf")
+    main.UPLOAD_STORE.path(file_id).unlink()
+
+    response = client.post("/api/jobs/semantic-search", json={"file_id": file_id})
+
+    assert response.status_code == 404
@@ -0,0 +1,75 @@
+import json
+import random
+from pathlib import Path
+
+from app.services.catalog_service import JobCatalog
+from app.services.similarity_service import SimilarJobsIndex
+
+JOBS_PATH = Path(__file__).parent.parent / "data" / "mock_jobs.json"
+
+
+def _load_jobs():
+    with open(JOBS_PATH) as f:
+        return json.load(f)
+
+
+def _brute_force(catalog, job_id, top_n):
+    target = set(s.lower() for s in catalog.get(job_id)["required_skills"])
+    scored = []
+    for slot, job in enumerate(catalog._slots):
+        if job is None or job["job_id"] == job_id:
+            continue
+        other = set(s.lower() for s in job["required_skills"])
+        shared = len(target & other)
+        if shared:
+            scored.append((-(shared / len(target | other)), slot, job["job_id"]))
+    scored.sort()
+    return [(job, round(-sim, 3)) for sim, _, job in scored[:top_n]]
+
+
+def _actual(index, job_id):
+    return [(j["job_id"], j["similarity"]) for j in index.similar(job_id)]
+
+
+def test_similar_jobs_match_brute_force():
+    catalog = JobCatalog(_load_jobs())
+    index = SimilarJobsIndex(catalog, top_n=5)
+
+    for job in catalog.jobs:
+        assert _actual(index, job["job_id"]) == _brute_force(catalog, job["job_id"], 5)
+
+
+def test_incremental_updates_match_rebuild():
+    jobs = _load_jobs()
+    catalog = JobCatalog(jobs[:20])
+    index = SimilarJobsIndex(catalog, top_n=4)
+    rng = random.Random(3)
+
+    for job in jobs[20:]:
+        catalog.add_job(job)
+    for job_id in rng.sample([j["job_id"] for j in jobs], 8):
+        catalog.remove_job(job_id)
+
+    for job in catalog.jobs:
+        assert _actual(index, job["job_id"]) == _brute_force(catalog, job["job_id"], 4)
+
+
+def test_unknown_job_has_no_neighbours():
+    index = SimilarJobsIndex(JobCatalog(_load_jobs()))
+
+    assert index.similar("NOPE") == []
+
+
+def test_similar_skips_jobs_removed_before_the_index_catches_up():
+    catalog = JobCatalog(_load_jobs())
+    target = catalog.jobs[0]["job_id"]
+    seen = []
+    # Subscribed first, so it runs before the index has dropped the job
+    catalog.subscribe(lambda event, job, slot: seen.append(index.similar(target)) if event == "remove" else None)
+    index = SimilarJobsIndex(catalog, top_n=5)
+    removed = index.similar(target)[0]["job_id"]
+
+    catalog.remove_job(removed)
+
+    assert removed not in [j["job_id"] for j in seen[0]]
+    assert _actual(index, target) == _brute_force(catalog, target, 5)
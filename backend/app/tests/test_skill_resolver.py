@@ -0,0 +1,86 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from app.services.catalog_service import JobCatalog
+from app.services.skill_resolver import SkillResolver, edit_distance, skill_key
+
+JOBS_PATH = Path(__file__).parent.parent / "data" / "mock_jobs.json"
+
+
+@pytest.fixture
+def catalog():
+    with open(JOBS_PATH) as f:
+        return JobCatalog(json.load(f))
+
+
+def test_edit_distance():
+    assert edit_distance("python", "python") == 0
+    assert edit_distance("pyhton", "python") == 1  # transposition
+    assert edit_distance("kubernates", "kubernetes") == 1
+    assert edit_distance("dockr", "docker") == 1
+    assert edit_distance("abc", "xyz") == 3
+
+
+def test_skill_key():
+    assert skill_key(" React JS ") == "reactjs"
+    assert skill_key("Node.js") == "nodejs"
+    assert skill_key("C++") == "c++"
+
+
+@pytest.mark.parametrize("token, expected", [
+    ("Pyhton", "python"),
+    ("kubernates", "kubernetes"),
+    ("React JS", "react"),
+    ("postgres", "postgresql"),
+    ("k8s", "kubernetes"),
+    ("Machne Learning", "machine learning"),
+    ("javascirpt", "javascript"),
+])
+def test_resolves_typos_and_aliases(catalog, token, expected):
+    resolver = SkillResolver(catalog)
+    assert resolver.resolve(token)[0] == expected
+
+
+def test_short_tokens_only_match_exactly(catalog):
+    resolver = SkillResolver(catalog)
+
+    assert resolver.resolve("go") == ("go", 0)
+    assert resolver.resolve("gx") is None
+    assert resolver.resolve("Jest") is None
+
+
+@pytest.mark.parametrize("token, wrong", [
+    ("Cypress", "express"),
+    ("Gradle", "oracle"),
+    ("Packer", "docker"),
+    ("Looker", "docker"),
+    ("Matlab", "gitlab ci"),
+    ("Reactor", "react"),
+    ("Nestjs", "next.js"),
+    ("Podman", "postman"),
+])
+def test_real_skills_are_not_rewritten_into_others(catalog, token, wrong):
+    match = SkillResolver(catalog).resolve(token)
+
+    assert match is None or match[1] == 0
+    assert match is None or match[0] != wrong
+
+
+def test_resolve_skills_reports_corrections(catalog):
+    resolver = SkillResolver(catalog)
+
+    skills, corrections = resolver.resolve_skills(["Python", "Dokcer", "", "Quantumology"])
+
+    assert skills == ["python", "docker", "Quantumology"]
+    assert corrections == {"Dokcer": "docker"}
+
+
+def test_new_catalog_skills_become_resolvable(catalog):
+    resolver = SkillResolver(catalog)
+    assert resolver.resolve("Qiskitt") is None
+
+    catalog.add_job({"job_id": "JQ1", "title": "Quantum Engineer", "required_skills": ["Qiskit"]})
+
+    assert resolver.resolve("Qiskitt") == ("qiskit", 1)
@@ -0,0 +1,71 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from app.services.catalog_service import JobCatalog
+from app.services.skill_vocabulary import SkillVocabulary
+
+JOBS_PATH = Path(__file__).parent.parent / "data" / "mock_jobs.json"
+
+
+@pytest.fixture
+def jobs():
+    with open(JOBS_PATH) as f:
+        return json.load(f)
+
+
+def _brute_force_counts(catalog):
+    counts = {}
+    for job in catalog.jobs:
+        for skill in set(s.lower() for s in job["required_skills"]):
+            counts[skill] = counts.get(skill, 0) + 1
+    return counts
+
+
+def test_counts_match_catalog(jobs):
+    catalog = JobCatalog(jobs)
+    vocabulary = SkillVocabulary(catalog)
+
+    counts = _brute_force_counts(catalog)
+    assert len(vocabulary) == len(counts)
+    assert all(vocabulary.count(skill) == n for skill, n in counts.items())
+
+
+def test_suggest_ranks_by_demand(jobs):
+    catalog = JobCatalog(jobs)
+    vocabulary = SkillVocabulary(catalog)
+    counts = _brute_force_counts(catalog)
+
+    suggestions = vocabulary.suggest("p", limit=3)
+
+    expected = sorted((s for s in counts if s.startswith("p")), key=lambda s: (-counts[s], s))[:3]
+    assert [s["skill"].lower() for s in suggestions] == expected
+    assert [s["job_count"] for s in suggestions] == [counts[s] for s in expected]
+
+
+def test_suggest_matches_aliases(jobs):
+    vocabulary = SkillVocabulary(JobCatalog(jobs))
+
+    assert [s["skill"] for s in vocabulary.suggest("k8")] == ["Kubernetes"]
+    assert "PostgreSQL" in [s["skill"] for s in vocabulary.suggest("postgres")]
+    assert vocabulary.suggest("zzz") == []
+
+
+def test_incremental_updates(jobs):
+    catalog = JobCatalog(jobs)
+    vocabulary = SkillVocabulary(catalog)
+
+    catalog.add_job({"job_id": "JQ1", "title": "Quantum Engineer", "required_skills": ["Qiskit", "Python"]})
+    assert vocabulary.suggest("qis") == [{"skill": "Qiskit", "job_count": 1}]
+    assert "Qiskit" in vocabulary.skills()
+
+    catalog.remove_job("JQ1")
+    assert vocabulary.suggest("qis") == []
+    assert "Qiskit" not in vocabulary.skills()
+
+    for job in jobs[:5]:
+        catalog.remove_job(job["job_id"])
+    counts = _brute_force_counts(catalog)
+    assert len(vocabulary) == len(counts)
+    assert all(vocabulary.count(skill) == n for skill, n in counts.items())
@@ -0,0 +1,65 @@
+import pytest
+
+from app.services.taxonomy_service import SkillGraph, RELATED_WEIGHT, REQUIRES_WEIGHT, MIN_CREDIT
+from app.services.matching_service import load_skills_taxonomy
+
+TAXONOMY = {
+    "categories": [
+        {
+            "id": "languages",
+            "skills": [
+                {"name": "Python", "aliases": ["python3"], "related_to": ["Django", "FastAPI"]},
+                {"name": "JavaScript", "aliases": ["js"], "related_to": ["React"]}
+            ]
+        },
+        {
+            "id": "frameworks",
+            "skills": [
+                {"name": "FastAPI", "requires": ["Python"]},
+                {"name": "Django", "requires": ["python3"]},
+                {"name": "React", "requires": ["JavaScript"]}
+            ]
+        }
+    ]
+}
+
+
+def test_direct_edges():
+    graph = SkillGraph(TAXONOMY)
+
+    assert graph.closure["fastapi"]["python"] == REQUIRES_WEIGHT
+    assert graph.closure["python"]["fastapi"] == RELATED_WEIGHT
+    assert graph.closure["django"]["python"] == REQUIRES_WEIGHT  # alias resolved
+
+
+def test_closure_keeps_strongest_path():
+    graph = SkillGraph(TAXONOMY)
+
+    # FastAPI -> Python (0.8) -> Django (0.5) beats FastAPI -> Python -> ... longer paths
+    assert graph.closure["fastapi"]["django"] == pytest.approx(REQUIRES_WEIGHT * RELATED_WEIGHT)
+    # Unconnected components stay apart
+    assert "react" not in graph.closure["python"]
+
+
+def test_closure_prunes_weak_paths():
+    graph = SkillGraph(load_skills_taxonomy())
+
+    for row in graph.closure.values():
+        assert all(MIN_CREDIT <= credit < 1 for credit in row.values())
+
+
+def test_expand_skips_owned_skills():
+    graph = SkillGraph(TAXONOMY)
+
+    credits = graph.expand(["FastAPI", "Python3"])
+
+    assert "python" not in credits
+    assert "fastapi" not in credits
+    assert credits["django"] == RELATED_WEIGHT
+
+
+def test_empty_taxonomy():
+    graph = SkillGraph({"core_technical": ["Python"]})
+
+    assert graph.closure == {}
+    assert graph.expand(["Python"]) == {}
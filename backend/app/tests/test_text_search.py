@@ -0,0 +1,108 @@
+import json
+import math
+from pathlib import Path
+
+from app.services.catalog_service import JobCatalog
+from app.services.text_search import TextSearchIndex, blend_text_scores, tokenize, TITLE_BOOST
+
+JOBS_PATH = Path(__file__).parent.parent / "data" / "mock_jobs.json"
+
+QUERIES = [
+    "python backend developer",
+    "react frontend",
+    "machine learning engineer",
+    "cloud aws devops kubernetes",
+    "data",
+    "senior java spring microservices",
+]
+
+
+def _load_jobs():
+    with open(JOBS_PATH) as f:
+        return json.load(f)
+
+
+def _brute_force(catalog, query, limit, k1=1.2, b=0.75):
+    docs = []
+    for slot, job in enumerate(catalog._slots):
+        if job is None:
+            continue
+        tokens = tokenize(job.get("title", "")) * TITLE_BOOST + tokenize(job.get("description", ""))
+        docs.append((slot, job["job_id"], tokens))
+
+    avg_length = sum(len(tokens) for _, _, tokens in docs) / len(docs)
+    scored = []
+    for slot, job_id, tokens in docs:
+        score = 0.0
+        for term in set(tokenize(query)):
+            tf = tokens.count(term)
+            if not tf:
+                continue
+            df = sum(1 for _, _, other in docs if term in other)
+            idf = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+            norm = 1 - b + b * len(tokens) / avg_length
+            score += idf * tf * (k1 + 1) / (tf + k1 * norm)
+        if score > 0:
+            scored.append((-score, slot, job_id))
+    scored.sort()
+    return [(job_id, round(-score, 4)) for score, _, job_id in scored[:limit]]
+
+
+def test_tokenize_keeps_tech_terms():
+    assert tokenize("C++ and Node.js, with C#.") == ["c++", "node.js", "c#"]
+
+
+def test_maxscore_matches_exhaustive_bm25():
+    catalog = JobCatalog(_load_jobs())
+    index = TextSearchIndex(catalog)
+
+    for query in QUERIES:
+        for limit in (1, 3, 10):
+            assert index.search(query, limit) == _brute_force(catalog, query, limit)
+
+
+def test_incremental_add_and_remove():
+    jobs = _load_jobs()
+    catalog = JobCatalog(jobs[:10])
+    index = TextSearchIndex(catalog)
+
+    for job in jobs[10:20]:
+        catalog.add_job(job)
+    catalog.remove_job(jobs[3]["job_id"])
+
+    for query in QUERIES:
+        assert index.search(query, 5) == _brute_force(catalog, query, 5)
+        assert jobs[3]["job_id"] not in [job_id for job_id, _ in index.search(query, 50)]
+
+
+def test_rebuild_after_many_removals():
+    jobs = _load_jobs()
+    catalog = JobCatalog(jobs)
+    index = TextSearchIndex(catalog)
+
+    for job in jobs[: len(jobs) // 2]:
+        catalog.remove_job(job["job_id"])
+
+    assert not index._deleted or len(index._deleted) * 4 <= len(jobs)
+    for query in QUERIES:
+        assert index.search(query, 5) == _brute_force(catalog, query, 5)
+
+
+def test_unknown_terms_return_nothing():
+    index = TextSearchIndex(JobCatalog(_load_jobs()))
+    assert index.search("zzzqqq", 10) == []
+    assert index.search("the and of", 10) == []
+
+
+def test_blend_text_scores():
+    ranked = [
+        {"job_id": "A", "match_score": 90},
+        {"job_id": "B", "match_score": 40},
+        {"job_id": "C", "match_score": 80},
+    ]
+    blended = blend_text_scores(ranked, [("B", 8.0), ("C", 2.0)], text_weight=0.5)
+
+    assert [job["job_id"] for job in blended] == ["B", "C"]
+    assert blended[0]["text_score"] == 100.0
+    assert blended[0]["search_score"] == 70.0
+    assert blended[1]["search_score"] == 52.5
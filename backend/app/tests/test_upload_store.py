@@ -0,0 +1,106 @@
+import time
+
+from app.services.upload_store import UploadStore
+
+PDF = b"%PDF-1.4 resume A"
+DOCX = b"PK\x03\x04 resume B"
+
+
+def test_identical_bytes_share_one_sharded_blob(tmp_path):
+    store = UploadStore(tmp_path)
+    first = store.put("f1", PDF, "a.pdf")
+    store.put("f2", PDF, "copy.pdf")
+    store.put("f3", DOCX, "b.docx")
+
+    sha = first["sha256"]
+    assert store.path("f1") == tmp_path / "blobs" / sha[:2] / sha[2:4] / sha
+    assert store.path("f1") == store.path("f2")
+    assert store.read("f2") == PDF
+    assert store.get("f3")["mime"].endswith("wordprocessingml.document")
+    assert store.stats() == {
+        "files": 3, "blobs": 2, "unreferenced_blobs": 0,
+        "logical_bytes": 2 * len(PDF) + len(DOCX), "stored_bytes": len(PDF) + len(DOCX),
+    }
+
+
+def test_index_survives_restart(tmp_path):
+    store = UploadStore(tmp_path)
+    store.put("f1", PDF, "a.pdf")
+    store.put("f2", DOCX, "b.docx")
+    store.delete("f1")
+
+    reopened = UploadStore(tmp_path)
+    assert reopened.get("f1") is None
+    assert reopened.read("f2") == DOCX
+    assert reopened.stats() == store.stats()
+
+
+def test_gc_removes_unreferenced_blobs_only(tmp_path):
+    store = UploadStore(tmp_path)
+    store.put("f1", PDF, "a.pdf")
+    store.put("f2", PDF, "copy.pdf")
+    store.put("f3", DOCX, "b.docx")
+    store.delete("f1")
+    store.delete("f3")
+    orphan = store.blob_path("ab" * 32)
+    orphan.parent.mkdir(parents=True)
+    orphan.write_bytes(b"left by a crash")
+
+    assert store.gc()["removed_blobs"] == 1  # the orphan is still within the grace period
+    result = store.gc(grace_seconds=0)
+
+    assert result["removed_blobs"] == 1
+    assert store.read("f2") == PDF
+    assert not orphan.exists()
+    assert UploadStore(tmp_path).stats() == {
+        "files": 1, "blobs": 1, "unreferenced_blobs": 0,
+        "logical_bytes": len(PDF), "stored_bytes": len(PDF),
+    }
+    assert len((tmp_path / "index.jsonl").read_text().splitlines()) == 1
+
+
+def test_gc_retention(tmp_path):
+    store = UploadStore(tmp_path)
+    store.put("old", PDF, "a.pdf")
+    store.put("kept", DOCX, "b.docx")
+    store.get("old")["created_at"] = store.get("kept")["created_at"] = time.time() - 3600
+
+    result = store.gc(max_age_seconds=60, keep={"kept"})
+
+    assert result["expired_files"] == 1
+    assert result["expired_file_ids"] == ["old"]
+    assert store.get("old") is None
+    assert store.read("kept") == DOCX
+
+
+def test_gc_from_another_process_sees_newer_uploads(tmp_path):
+    server = UploadStore(tmp_path)
+    cli = UploadStore(tmp_path)
+    server.put("f1", PDF, "a.pdf")
+    server.put("f2", DOCX, "b.docx")
+    server.delete("f1")
+
+    cli.gc(grace_seconds=0)
+    server.put("f3", PDF, "c.pdf")
+
+    assert server.read("f2") == DOCX
+    assert cli.read("f3") == PDF
+    assert UploadStore(tmp_path).stats() == server.stats() == cli.stats()
+
+
+def test_import_legacy_directory(tmp_path):
+    legacy = tmp_path / "uploads"
+    legacy.mkdir()
+    (legacy / "u1.pdf").write_bytes(PDF)
+    (legacy / "u2.docx").write_bytes(DOCX)
+    (legacy / "notes.txt").write_text("ignored")
+    store = UploadStore(legacy)
+
+    assert store.import_directory(legacy) == 2
+    assert store.import_directory(legacy) == 0
+    assert store.read("u2") == DOCX
+    assert (legacy / "u1.pdf").exists()
+
+    store.import_directory(legacy, remove=True)
+    assert not (legacy / "u1.pdf").exists()
+    assert store.read("u1") == PDF
@@ -0,0 +1,44 @@
+def test_gc_is_disabled_without_admin_token(client, monkeypatch):
+    from app import main
+
+    monkeypatch.setattr(main, "ADMIN_TOKEN", None)
+
+    response = client.post("/api/uploads/gc", json={"max_age_days": 0}, headers={"X-Admin-Token": ""})
+
+    assert response.status_code == 403
+
+
+def test_gc_needs_matching_token_and_minimum_age(client, monkeypatch):
+    from app import main
+
+    monkeypatch.setattr(main, "ADMIN_TOKEN", "s3cret")
+
+    assert client.post("/api/uploads/gc", json={"max_age_days": 90}).status_code == 403
+    assert client.post(
+        "/api/uploads/gc", json={"max_age_days": 90}, headers={"X-Admin-Token": "wrong"}
+    ).status_code == 403
+
+    for age in (0, main.MIN_UPLOAD_AGE_DAYS - 1, True, "90"):
+        response = client.post("/api/uploads/gc", json={"max_age_days": age}, headers={"X-Admin-Token": "s3cret"})
+        assert response.status_code == 400
+
+    response = client.post(
+        "/api/uploads/gc", json={"max_age_days": main.MIN_UPLOAD_AGE_DAYS}, headers={"X-Admin-Token": "s3cret"}
+    )
+    assert response.status_code == 200
+    assert response.json()["expired_files"] == 0
+
+
+def test_gc_keeps_uploads_of_saved_profiles(client, monkeypatch):
+    from app import main
+
+    monkeypatch.setattr(main, "ADMIN_TOKEN", "s3cret")
+    calls = []
+    monkeypatch.setattr(main.UPLOAD_STORE, "gc", lambda max_age, keep=(): calls.append(set(keep)) or {
+        "expired_files": 0, "expired_file_ids": [], "removed_blobs": 0, "bytes_freed": 0
+    })
+    main.PROFILE_STORE.save("PROF_GC", {"name": "Gc Test", "email": "gc@example.com", "file_id": "kept-upload"})
+
+    client.post("/api/uploads/gc", json={"max_age_days": 365}, headers={"X-Admin-Token": "s3cret"})
+
+    assert "kept-upload" in calls[0]
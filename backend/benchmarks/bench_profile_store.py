@@ -0,0 +1,90 @@
+"""
+Profile save/get throughput: SQLite ProfileStore vs one JSON file per profile
+
+Run from backend/:
+    python -m benchmarks.bench_profile_store [--profiles 2000] [--threads 8]
+"""
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import argparse
+import json
+import random
+import tempfile
+import time
+
+from app.services.profile_store import ProfileStore
+
+SKILLS = ["Python", "React", "Docker", "AWS", "Kubernetes", "SQL", "Go", "Java", "FastAPI", "Git"]
+
+
+def make_profile(i: int) -> dict:
+    rng = random.Random(i)
+    return {
+        "name": f"Candidate {i}",
+        "email": f"candidate{i}@example.com",
+        "skills": rng.sample(SKILLS, 5),
+        "experience": [{"title": "Engineer", "company": "Acme", "duration": "2 years"}],
+        "education": [{"degree": "B.Tech", "institution": "IIT"}],
+    }
+
+
+class JsonFiles:
+    """The previous layout: saved_profiles/PROF_<ID>.json, indent=2"""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    def save(self, profile_id, data):
+        with open(self.directory / f"{profile_id}.json", "w") as f:
+            json.dump(data, f, indent=2)
+
+    def get(self, profile_id):
+        with open(self.directory / f"{profile_id}.json") as f:
+            return json.load(f)
+
+    def profiles_with_skill(self, skill):
+        # No index: scan and parse the whole directory
+        matches = []
+        for profile_file in sorted(self.directory.glob("PROF_*.json")):
+            with open(profile_file) as f:
+                if skill in (s.lower() for s in json.load(f)["skills"]):
+                    matches.append(profile_file.stem)
+        return matches
+
+
+def run(label, fn, items, threads):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(fn, items))
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {len(items) / elapsed:>10,.0f} ops/s  ({elapsed * 1000:.0f} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profiles", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    profiles = [(f"PROF_C{i}", make_profile(i)) for i in range(args.profiles)]
+    reads = [pid for pid, _ in profiles] * 3
+    random.Random(0).shuffle(reads)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        (tmp / "json").mkdir()
+        backends = [
+            ("json files", JsonFiles(tmp / "json")),
+            ("sqlite (WAL, pooled)", ProfileStore(tmp / "profiles.db", pool_size=args.threads)),
+        ]
+        print(f"{args.profiles} profiles, {args.threads} threads")
+        for name, backend in backends:
+            print(name)
+            run("save", lambda item: backend.save(*item), profiles, args.threads)
+            run("get", backend.get, reads, args.threads)
+            run("save + get mixed", lambda item: (backend.save(*item), backend.get(item[0])), profiles, args.threads)
+            run("profiles with skill", backend.profiles_with_skill, ["docker", "go"] * 5, args.threads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Serialization cost of a large job search response
+
+Compares FastAPI's default path (jsonable_encoder + json.dumps) with the
+FastJSONResponse paths, on N jobs cloned from the mock catalog.
+
+Run from backend/:
+    python -m benchmarks.bench_serialization [--jobs 10000] [--repeat 5]
+"""
+from pathlib import Path
+from typing import List
+import argparse
+import json
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.schemas import JobPosting
+from app.services import json_response
+from app.services.json_response import FastJSONResponse
+
+JOBS_PATH = Path(__file__).parent.parent / "app" / "data" / "mock_jobs.json"
+
+
+def make_jobs(n: int) -> List[dict]:
+    with open(JOBS_PATH) as f:
+        base = json.load(f)
+    jobs = []
+    for i in range(n):
+        job = dict(base[i % len(base)])
+        job["job_id"] = f"J{i:06d}"
+        job["match_score"] = round((i * 37) % 1000 / 10, 1)
+        jobs.append(job)
+    return jobs
+
+
+def best_of(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    jobs = make_jobs(args.jobs)
+    adapter = TypeAdapter(List[JobPosting])
+
+    paths = [
+        ("dict -> jsonable_encoder -> json.dumps (before)",
+         lambda: JSONResponse(jsonable_encoder(jobs))),
+        ("dict -> jsonable_encoder -> FastJSONResponse",
+         lambda: FastJSONResponse(jsonable_encoder(jobs))),
+        ("response_model validate + serialize -> FastJSONResponse",
+         lambda: FastJSONResponse(adapter.dump_python(adapter.validate_python(jobs), mode="json"))),
+        ("FastJSONResponse returned directly (search)",
+         lambda: FastJSONResponse(jobs)),
+    ]
+
+    backend = "orjson" if json_response.orjson is not None else "pydantic-core"
+    size = len(FastJSONResponse(jobs).body)
+    print(f"{args.jobs} jobs, {size / 1024:.0f} KiB, renderer: {backend}")
+    baseline = None
+    for label, fn in paths:
+        ms = best_of(fn, args.repeat)
+        baseline = baseline or ms
+        print(f"  {label:<58} {ms:>8.1f} ms  {baseline / ms:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()